@@ -0,0 +1,97 @@
+# evaluation.py
+# Nhân đánh giá lịch dùng chung cho Schedule.evaluate và utils.metrics.Metrics
+import numpy as np
+
+from Core.job_table import JobTable
+
+
+def evaluate_arrays(finish_times, deadlines, durations=None, priorities=None,
+                    machines=None, n_machines=None):
+    """
+    Tính mọi chỉ số của lịch trong một lần trên các mảng cột
+    finish_times: (n,) hoặc (B, n) - NaN nếu job chưa được xếp
+                  (B, n) => đánh giá B lịch ứng viên cùng lúc
+    deadlines:    (n,) hoặc (B, n) - NaN nếu job không có deadline
+    durations, priorities: (n,) - priorities làm trọng số cho weighted_tardiness
+                  durations: thời gian bận thực trên máy (tính utilization)
+    machines, n_machines: chỉ số máy của từng job (n,) hoặc (B, n) - để tính utilization
+    Trả về dict (số thực nếu đầu vào 1 chiều, mảng (B,) nếu theo lô):
+        makespan, tardy_jobs, total_lateness, avg_lateness (trung bình trên job trễ),
+        weighted_tardiness, utilization (mảng (m,) hoặc (B, m): thời gian bận / makespan)
+    """
+    finish = np.atleast_2d(np.asarray(finish_times, dtype=float))
+    single = np.ndim(finish_times) == 1
+    batch, n = finish.shape
+
+    # Độ trễ dương của từng job, 0 với job đúng hạn / không deadline / chưa xếp
+    lateness = finish - np.asarray(deadlines, dtype=float)
+    tardiness = np.where(lateness > 0, lateness, 0.0)
+    tardy = tardiness > 0
+
+    makespan = np.where(np.isnan(finish), 0.0, finish).max(axis=1) if n else np.zeros(batch)
+    tardy_jobs = tardy.sum(axis=1)
+    total_lateness = tardiness.sum(axis=1)
+    avg_lateness = np.divide(total_lateness, tardy_jobs,
+                             out=np.zeros(batch), where=tardy_jobs > 0)
+    weights = np.ones(n) if priorities is None else np.asarray(priorities, dtype=float)
+    weighted_tardiness = (tardiness * weights).sum(axis=1)
+
+    result = {
+        "makespan": makespan,
+        "tardy_jobs": tardy_jobs,
+        "total_lateness": total_lateness,
+        "avg_lateness": avg_lateness,
+        "weighted_tardiness": weighted_tardiness,
+    }
+
+    if machines is not None and durations is not None and n_machines:
+        machine_idx = np.atleast_2d(np.asarray(machines, dtype=np.int64))
+        machine_idx = np.broadcast_to(machine_idx, (batch, n))
+        busy_weights = np.broadcast_to(np.asarray(durations, dtype=float), (batch, n))
+        scheduled = (machine_idx >= 0) & ~np.isnan(finish)
+        # Dồn (lịch b, máy k) thành chỉ số b * m + k để bincount một lần cho cả lô
+        flat = (machine_idx + np.arange(batch)[:, None] * n_machines)[scheduled]
+        busy = np.bincount(flat, weights=busy_weights[scheduled],
+                           minlength=batch * n_machines).reshape(batch, n_machines)
+        result["utilization"] = np.divide(busy, makespan[:, None], out=np.zeros_like(busy),
+                                          where=makespan[:, None] > 0)
+
+    if single:
+        result = {key: (value[0] if key == "utilization" else value[0].item())
+                  for key, value in result.items()}
+    return result
+
+
+def schedule_arrays(machines, jobs=None):
+    """
+    Gom các cột cần cho evaluate_arrays từ danh sách Machine (+ JobTable nếu có)
+    Thời điểm kết thúc lấy từ lịch của máy (job, start, finish) nên không phụ thuộc
+    vào job.finish_time; thời gian bận = finish - start (đúng cả khi máy khác tốc độ)
+    Trả về dict: finish_times, deadlines, durations, priorities, machines, n_machines
+    """
+    entries = [entry for machine in machines for entry in machine.schedule]
+    jobs_on_machines = [job for job, _, _ in entries]
+    columns = {
+        "finish_times": np.array([finish for _, _, finish in entries], dtype=float),
+        # deadline None => NaN (np.array chuyển None thành NaN với dtype float)
+        "deadlines": np.array([job.deadline for job in jobs_on_machines], dtype=float),
+        "durations": np.array([finish - start for _, start, finish in entries], dtype=float),
+        "priorities": np.array([job.priority for job in jobs_on_machines], dtype=float),
+        "machines": np.repeat(np.arange(len(machines), dtype=np.int64),
+                              [len(machine.schedule) for machine in machines]),
+    }
+    if isinstance(jobs, JobTable):
+        table_columns = {
+            "finish_times": jobs.finish_times, "deadlines": jobs.deadlines,
+            "durations": jobs.finish_times - jobs.start_times, "priorities": jobs.priorities,
+            "machines": jobs.machines,
+        }
+        columns = {key: np.concatenate((columns[key], table_columns[key]))
+                   for key in columns}
+    columns["n_machines"] = len(machines)
+    return columns
+
+
+def evaluate_schedule(machines, jobs=None):
+    """Đánh giá lịch gồm các Machine (+ JobTable nếu lịch nằm trong bảng)"""
+    return evaluate_arrays(**schedule_arrays(machines, jobs))
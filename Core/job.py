@@ -1,5 +1,9 @@
 #Lớp đại diện cho 1 công việc
 class Job:
+    # __slots__: không dùng __dict__ => nhẹ hơn, truy cập thuộc tính nhanh hơn
+    # Với dữ liệu lớn nên dùng JobTable (Core/job_table.py), Job chỉ là một bản ghi đơn lẻ
+    __slots__ = ("job_id", "duration", "deadline", "priority", "start_time", "finish_time")
+
     def __init__(self, job_id, duration, deadline=None, priority=1):
         self.job_id = job_id
         self.duration = duration
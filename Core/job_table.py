@@ -0,0 +1,127 @@
+# job_table.py
+import numpy as np
+
+from Core.job import Job
+
+
+def _scalar(value):
+    """
+    Số NumPy -> số Python; giá trị nguyên trả về int như Job gốc (duration 7, không 7.0)
+    Các cột được lưu dạng float nên đây là chỗ duy nhất khôi phục kiểu khi tạo Job
+    """
+    value = value.item()
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+
+class JobTable:
+    """
+    Bảng job dạng cột: mỗi thuộc tính là một mảng NumPy liên tục
+    Dùng cho dữ liệu lớn (hàng trăm nghìn - hàng triệu job) thay cho list Job:
+      - ids, durations, priorities (ids: số nguyên, hoặc chuỗi khi giải bằng thuật toán;
+        file .sched và CSV cần id số nguyên)
+      - deadlines: NaN nếu job không có deadline
+      - start_times, finish_times: NaN nếu chưa được xếp lịch
+      - machines: chỉ số máy được gán, -1 nếu chưa được xếp lịch
+    Job vẫn dùng được như một bản ghi đơn lẻ: table[i] tạo Job tương ứng
+    """
+
+    COLUMNS = ("ids", "durations", "deadlines", "priorities",
+               "start_times", "finish_times", "machines")
+
+    def __init__(self, ids, durations, deadlines=None, priorities=None,
+                 start_times=None, finish_times=None, machines=None):
+        n = len(durations)
+        ids = np.asarray(ids)
+        # id thường là số nguyên; id khác (vd: chuỗi của job dạng dict) giữ nguyên kiểu
+        self.ids = ids if ids.dtype.kind in "OUS" else ids.astype(np.int64)
+        self.durations = np.asarray(durations, dtype=float)
+        self.deadlines = (np.full(n, np.nan) if deadlines is None
+                          else np.asarray(deadlines, dtype=float))
+        # Trọng số (weighted_tardiness) có thể là số thực => float, không cắt về int
+        self.priorities = (np.ones(n) if priorities is None
+                           else np.asarray(priorities, dtype=float))
+        # Cột lịch chỉ được cấp phát khi dùng tới (bảng nạp từ file chưa có lịch)
+        self._start_times = None if start_times is None else np.asarray(start_times, dtype=float)
+        self._finish_times = (None if finish_times is None
+                              else np.asarray(finish_times, dtype=float))
+        self._machines = None if machines is None else np.asarray(machines, dtype=np.int64)
+
+    @property
+    def start_times(self):
+        if self._start_times is None:
+            self._start_times = np.full(len(self), np.nan)
+        return self._start_times
+
+    @property
+    def finish_times(self):
+        if self._finish_times is None:
+            self._finish_times = np.full(len(self), np.nan)
+        return self._finish_times
+
+    @property
+    def machines(self):
+        if self._machines is None:
+            self._machines = np.full(len(self), -1, dtype=np.int64)
+        return self._machines
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        """Tạo bảng từ list Job"""
+        def column(attr, missing):
+            values = [getattr(job, attr) for job in jobs]
+            return [missing if v is None else v for v in values]
+
+        return cls(ids=[job.job_id for job in jobs],
+                   durations=[job.duration for job in jobs],
+                   deadlines=column("deadline", np.nan),
+                   priorities=[job.priority for job in jobs],
+                   start_times=column("start_time", np.nan),
+                   finish_times=column("finish_time", np.nan))
+
+    def __len__(self):
+        return len(self.durations)
+
+    def __getitem__(self, i):
+        """Tạo Job (bản ghi đơn lẻ) cho dòng thứ i"""
+        deadline = self.deadlines[i]
+        job = Job(self.ids[i].item(), _scalar(self.durations[i]),
+                  deadline=None if np.isnan(deadline) else _scalar(deadline),
+                  priority=_scalar(self.priorities[i]))
+        if not np.isnan(self.start_times[i]):
+            job.set_schedule(_scalar(self.start_times[i]))
+        return job
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def to_jobs(self):
+        """Tạo list Job (chỉ khi cần tương thích với code cũ)"""
+        return list(self)
+
+    def copy(self):
+        return JobTable(*(getattr(self, name).copy() for name in self.COLUMNS))
+
+    def take(self, indices):
+        """Bảng con gồm các dòng indices (theo đúng thứ tự đó)"""
+        return JobTable(*(getattr(self, name)[indices] for name in self.COLUMNS))
+
+    def set_schedule(self, indices, start_times, machines=None, finish_times=None):
+        """
+        Ghi thời điểm bắt đầu (và máy) cho nhiều job cùng lúc
+        finish_times: khi thời gian thực trên máy khác durations (máy không giống nhau)
+        """
+        self.start_times[indices] = start_times
+        if finish_times is None:
+            self.finish_times[indices] = self.start_times[indices] + self.durations[indices]
+        else:
+            self.finish_times[indices] = finish_times
+        if machines is not None:
+            self.machines[indices] = machines
+
+    def nbytes(self):
+        """Số byte các cột đã cấp phát (cột lịch chưa dùng tới không tính)"""
+        arrays = (self.__dict__.get(name, self.__dict__.get("_" + name)) for name in self.COLUMNS)
+        return sum(array.nbytes for array in arrays if array is not None)
+
+    def __repr__(self):
+        return f"JobTable({len(self)} jobs)"
@@ -1,18 +1,84 @@
 #Lớp đại diện cho một máy trong hệ thống lập lịch dùng để thực hiện các công việc
 #Quản lý các công việc đã được gán
 # Theo dõi tổng thời gian hoạt động
+from itertools import accumulate
+
+
 class Machine:
-    def __init__(self, machine_id):
+    __slots__ = ("machine_id", "speed", "schedule", "busy_time", "ready_time")
+
+    def __init__(self, machine_id, speed=1.0):
         self.machine_id = machine_id
+        # Tốc độ tương đối (máy uniform): job chạy trong duration / speed.
+        # Thuật toán đọc tốc độ qua Core.processing_times.resolve_times
+        self.speed = speed
         self.schedule = []  # Danh sách job
+        # Tổng cộng dồn, cập nhật khi gán/gỡ job => truy vấn O(1)
+        # (không sửa trực tiếp self.schedule, hãy dùng assign/remove)
+        self.busy_time = 0   # tổng thời gian xử lý các job đã gán
+        self.ready_time = 0  # thời điểm kết thúc của job cuối cùng
+
+    def assign(self, job, start_time, duration=None):
+        """duration: thời gian xử lý thực trên máy này (mặc định job.duration)"""
+        if duration is None:
+            duration = job.duration
+        finish_time = start_time + duration
+        self.schedule.append((job, start_time, finish_time))
+        self.busy_time += duration
+        self.ready_time = finish_time
+
+    def assign_many(self, jobs, start_times=None):
+        """
+        Gán nhiều job cùng lúc
+        start_times=None => chạy nối tiếp nhau từ thời điểm máy rảnh hiện tại
+        """
+        if not jobs:
+            return
+        durations = [job.duration for job in jobs]
+        if start_times is None:
+            finish_times = list(accumulate(durations, initial=self.ready_time))[1:]
+            start_times = [self.ready_time] + finish_times[:-1]
+        else:
+            finish_times = [s + d for s, d in zip(start_times, durations)]
+        self.schedule.extend(zip(jobs, start_times, finish_times))
+        self.busy_time += sum(durations)
+        self.ready_time = finish_times[-1]
+
+    def remove(self, job):
+        """Gỡ một job khỏi máy (các job khác giữ nguyên thời điểm)"""
+        for i, (assigned, start, finish) in enumerate(self.schedule):
+            if assigned is job:
+                del self.schedule[i]
+                self.busy_time -= finish - start
+                self.ready_time = self.schedule[-1][2] if self.schedule else 0
+                return
+        raise ValueError(f"Job {job.job_id} không có trên máy {self.machine_id}")
+
+    def remove_many(self, jobs):
+        """Gỡ nhiều job trong một lần duyệt lịch"""
+        targets = {id(job) for job in jobs}
+        kept = [entry for entry in self.schedule if id(entry[0]) not in targets]
+        removed = [finish - start for job, start, finish in self.schedule
+                   if id(job) in targets]
+        if len(removed) != len(targets):
+            raise ValueError(f"Có job không nằm trên máy {self.machine_id}")
+        self.busy_time -= sum(removed)
+        self.schedule = kept
+        self.ready_time = kept[-1][2] if kept else 0
+
+    def copy(self):
+        """Bản sao nông: list lịch mới nhưng dùng chung đối tượng Job"""
+        new_machine = Machine(self.machine_id, self.speed)
+        new_machine.schedule = list(self.schedule)
+        new_machine.busy_time = self.busy_time
+        new_machine.ready_time = self.ready_time
+        return new_machine
 
-    def assign(self, job, start_time):
-        self.schedule.append((job, start_time, start_time + job.duration))
+    def job_count(self):
+        return len(self.schedule)
 
     def total_time(self):
-        return sum(job.duration for job, _, _ in self.schedule)
+        return self.busy_time
 
     def current_time(self):
-        if not self.schedule:
-            return 0
-        return self.schedule[-1][2]  # Thời gian kết thúc của job cuối cùng
\ No newline at end of file
+        return self.ready_time  # Thời gian kết thúc của job cuối cùng
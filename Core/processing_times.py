@@ -0,0 +1,208 @@
+# processing_times.py
+# Thời gian xử lý khi các máy KHÔNG giống nhau (uniform / unrelated parallel machines)
+import numpy as np
+
+
+class ProcessingTimes:
+    """
+    Thời gian xử lý p_ij của job j trên máy i:
+      - identical: p_ij = p_j (máy giống nhau - mặc định của project)
+      - uniform:   máy i có tốc độ s_i => p_ij = p_j / s_i  (speeds: mảng (m,))
+      - unrelated: ma trận (n, m) cho sẵn (matrix), không dùng tới p_j
+    p_j là cột durations của JobTable (hoặc job.duration), chỉ số hàng j là vị trí
+    của job trong danh sách / bảng job truyền cho thuật toán
+
+    eligible: job chỉ được chạy trên một số máy. Lưu thưa dạng CSR, CHỈ cho các job
+    bị hạn chế (job chạy được mọi máy không tốn bộ nhớ):
+        restricted (k,) chỉ số hàng tăng dần, indptr (k + 1,), indices (nnz,) chỉ số máy
+    Máy không được phép <=> thời gian xử lý vô cùng (inf)
+    Khi giải mã, CSR được mở rộng MỘT lần thành bảng phạt (k + 1, m) gồm 0 / inf
+    cho riêng các job bị hạn chế (+ một hàng 0 dùng chung) => mỗi bước chỉ cần tra bảng
+    """
+
+    def __init__(self, n_machines=None, speeds=None, matrix=None, eligible=None):
+        if speeds is not None and matrix is not None:
+            raise ValueError("Chỉ truyền một trong speeds hoặc matrix")
+        self.speeds = None if speeds is None else np.asarray(speeds, dtype=float)
+        self.matrix = None if matrix is None else np.asarray(matrix, dtype=float)
+        if self.speeds is not None:
+            if self.speeds.ndim != 1 or np.any(self.speeds <= 0):
+                raise ValueError("speeds phải là mảng 1 chiều các số dương")
+            n_machines = len(self.speeds) if n_machines is None else n_machines
+        if self.matrix is not None:
+            if self.matrix.ndim != 2:
+                raise ValueError("matrix phải có dạng (n_jobs, n_machines)")
+            n_machines = self.matrix.shape[1] if n_machines is None else n_machines
+        if n_machines is None:
+            raise ValueError("Cần n_machines, speeds hoặc matrix")
+        self.n_machines = int(n_machines)
+        for array in (self.speeds, self.matrix):
+            if array is not None and array.shape[-1] != self.n_machines:
+                raise ValueError(f"Số máy không khớp: {array.shape[-1]} != {self.n_machines}")
+        self._inv_speeds = None if self.speeds is None else 1.0 / self.speeds
+
+        self.restricted = np.empty(0, dtype=np.int64)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.empty(0, dtype=np.int64)
+        self._penalty = None  # (slot (hàng -> dòng bảng phạt), bảng phạt), tạo khi cần
+        if eligible is not None:
+            self._set_eligible(eligible)
+        if self.matrix is not None and not np.isfinite(self.matrix).any(axis=1).all():
+            raise ValueError("Có job không chạy được trên máy nào (cả hàng là inf)")
+
+    @classmethod
+    def from_machines(cls, machines):
+        """Mô hình uniform theo Machine.speed; None nếu mọi máy cùng tốc độ 1"""
+        speeds = [machine.speed for machine in machines]
+        if all(speed == 1 for speed in speeds):
+            return None
+        return cls(speeds=speeds)
+
+    def _set_eligible(self, eligible):
+        """eligible: dict {hàng: các máy được phép} hoặc mặt nạ bool dày (n, m)"""
+        if isinstance(eligible, dict):
+            rows = sorted(eligible)
+            allowed = [np.unique(np.asarray(list(eligible[row]), dtype=np.int64))
+                       for row in rows]
+        else:
+            mask = np.asarray(eligible, dtype=bool)
+            if mask.ndim != 2 or mask.shape[1] != self.n_machines:
+                raise ValueError("Mặt nạ eligible phải có dạng (n_jobs, n_machines)")
+            rows = np.flatnonzero(~mask.all(axis=1)).tolist()
+            allowed = [np.flatnonzero(mask[row]) for row in rows]
+        for row, machines in zip(rows, allowed):
+            if not len(machines):
+                raise ValueError(f"Job ở hàng {row} không chạy được trên máy nào")
+            if machines[0] < 0 or machines[-1] >= self.n_machines:
+                raise ValueError(f"Chỉ số máy của hàng {row} ngoài khoảng 0..{self.n_machines - 1}")
+        self.restricted = np.asarray(rows, dtype=np.int64)
+        self.indptr = np.concatenate(([0], np.cumsum([len(a) for a in allowed]))).astype(np.int64)
+        self.indices = (np.concatenate(allowed) if allowed
+                        else np.empty(0, dtype=np.int64))
+
+    @property
+    def kind(self):
+        if self.matrix is not None:
+            return "unrelated"
+        if self.speeds is not None and np.any(self.speeds != 1):
+            return "uniform"
+        return "identical"
+
+    @property
+    def is_identical(self):
+        """True => dùng được đường nhanh của máy giống nhau (không hạn chế máy)"""
+        return self.kind == "identical" and not len(self.restricted)
+
+    def validate(self, n_jobs, n_machines):
+        if n_machines != self.n_machines:
+            raise ValueError(f"Mô hình máy có {self.n_machines} máy, bài toán có {n_machines}")
+        if self.matrix is not None and len(self.matrix) != n_jobs:
+            raise ValueError(f"matrix có {len(self.matrix)} hàng, bài toán có {n_jobs} job")
+        if len(self.restricted) and self.restricted[-1] >= n_jobs:
+            raise ValueError("eligible có hàng vượt quá số job")
+
+    def eligibility_mask(self, rows):
+        """Mặt nạ bool dày (len(rows), m) chỉ cho các hàng cần (mở rộng từ CSR)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        mask = np.ones((len(rows), self.n_machines), dtype=bool)
+        if not len(self.restricted) or not len(rows):
+            return mask
+        pos = np.minimum(np.searchsorted(self.restricted, rows), len(self.restricted) - 1)
+        hit = np.flatnonzero(self.restricted[pos] == rows)
+        if not len(hit):
+            return mask
+        starts = self.indptr[pos[hit]]
+        counts = self.indptr[pos[hit] + 1] - starts
+        # Vị trí từng phần tử trong indices: starts lặp lại + độ lệch 0..count-1
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        mask[hit] = False
+        mask[np.repeat(hit, counts), self.indices[np.repeat(starts, counts) + offsets]] = True
+        return mask
+
+    def _penalties(self):
+        if self._penalty is None:
+            slot = np.zeros(self.restricted[-1] + 2, dtype=np.int32)  # phần tử cuối: hàng 0
+            slot[self.restricted] = np.arange(1, len(self.restricted) + 1)
+            table = np.zeros((len(self.restricted) + 1, self.n_machines))
+            table[1:][~self.eligibility_mask(self.restricted)] = np.inf
+            self._penalty = (slot, table)
+        return self._penalty
+
+    def rows(self, ptimes, rows, out=None, aligned=False):
+        """
+        Thời gian xử lý của các job rows trên mọi máy: mảng (len(rows), m)
+        ptimes: thời gian cơ sở p_j (bỏ qua với mô hình unrelated)
+        out: mảng (len(rows), m) có sẵn để ghi vào (giải mã gọi mỗi bước => không cấp phát)
+        aligned: True => ptimes đã theo đúng thứ tự rows (len(rows),), vd: cửa sổ job
+                 của chế độ trực tuyến, nơi không có cả mảng p_j
+        Máy không được phép => inf
+        """
+        rows = np.asarray(rows)
+        if out is None:
+            out = np.empty((len(rows), self.n_machines))
+        if self.matrix is not None:
+            np.take(self.matrix, rows, axis=0, out=out)
+        else:
+            base = np.asarray(ptimes, dtype=float)
+            base = base if aligned else base[rows]
+            if self._inv_speeds is not None:
+                np.multiply(base[:, None], self._inv_speeds, out=out)
+            else:
+                out[:] = base[:, None]
+        if len(self.restricted):
+            slot, table = self._penalties()
+            out += table[slot[np.minimum(rows, len(slot) - 1)]]
+        return out
+
+    def pairs(self, ptimes, rows, machines):
+        """Thời gian xử lý của từng cặp (job rows[i], máy machines[i]): mảng (len(rows),)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        machines = np.asarray(machines, dtype=np.int64)
+        if self.matrix is not None:
+            return self.matrix[rows, machines]
+        times = np.asarray(ptimes, dtype=float)[rows]
+        return times if self._inv_speeds is None else times * self._inv_speeds[machines]
+
+    def min_times(self, ptimes, chunk_size=65536):
+        """Thời gian nhỏ nhất của từng job trên các máy được phép: mảng (n,)"""
+        n = len(self.matrix) if self.matrix is not None else len(ptimes)
+        if self.matrix is None and not len(self.restricted):
+            fastest = 1.0 if self._inv_speeds is None else self._inv_speeds.min()
+            return np.asarray(ptimes, dtype=float) * fastest
+        return np.concatenate([self.rows(ptimes, np.arange(lo, min(n, lo + chunk_size)))
+                               .min(axis=1) for lo in range(0, n, chunk_size)] or [[]])
+
+    def lower_bound(self, ptimes):
+        """
+        Cận dưới của makespan: max(max_j min_i p_ij, sum_j min_i p_ij / m)
+        uniform không hạn chế máy: dùng max(sum p / sum s, max p / max s) (chặt hơn)
+        Máy giống nhau => đúng bằng max(sum(p)/m, max(p)) như trước
+        """
+        if not len(ptimes) and self.matrix is None:
+            return 0.0
+        if self.kind == "uniform" and not len(self.restricted):
+            ptimes = np.asarray(ptimes, dtype=float)
+            return max(float(ptimes.sum() / self.speeds.sum()),
+                       float(ptimes.max() / self.speeds.max()))
+        best = self.min_times(ptimes)
+        return max(float(best.sum()) / self.n_machines, float(best.max()))
+
+    def nbytes(self):
+        arrays = (self.speeds, self.matrix, self.restricted, self.indptr, self.indices)
+        return sum(array.nbytes for array in arrays if array is not None)
+
+    def __repr__(self):
+        return (f"ProcessingTimes({self.kind}, {self.n_machines} machines, "
+                f"{len(self.restricted)} restricted jobs)")
+
+
+def resolve_times(times=None, machines=None):
+    """
+    Mô hình máy dùng cho thuật toán: times nếu được truyền, nếu không lấy theo
+    Machine.speed. Trả về None khi máy giống nhau => thuật toán dùng đường nhanh cũ
+    """
+    if times is None and machines is not None:
+        times = ProcessingTimes.from_machines(machines)
+    if times is None or times.is_identical:
+        return None
+    return times
@@ -1,36 +1,43 @@
 # schedule.py
-from Core.job import Job
-from Core.machine import Machine
+from Core.job_table import JobTable
+from Core.evaluation import evaluate_schedule
+import numpy as np
+from utils import profiler
 
 class Schedule:
     """Quản lý lịch làm việc: gán job, đánh giá lịch, tổng hợp dữ liệu"""
 
     def __init__(self, machines, jobs):
         self.machines = machines  # danh sách đối tượng Machine
-        self.jobs = jobs          # danh sách đối tượng Job
+        self.jobs = jobs          # danh sách đối tượng Job hoặc JobTable (đã điền cột lịch)
 
     def assign_job(self, job, machine, start_time):
         """Gán job vào máy tại thời điểm start_time"""
         machine.assign(job, start_time)
 
     def evaluate(self):
-        """Tính các chỉ số hiệu năng của lịch"""
-        total_makespan = max((m.schedule[-1][2] if m.schedule else 0) for m in self.machines)
-        
-        # Fix: Kiểm tra job.finish_time is not None trước khi so sánh
-        total_lateness = 0
-        for job in self.jobs:
-            if job.deadline is not None and job.finish_time is not None:
-                if job.finish_time > job.deadline:
-                    total_lateness += job.finish_time - job.deadline
-        
-        return {
-            "makespan": total_makespan,
-            "total_lateness": total_lateness
-        }
+        """
+        Tính các chỉ số hiệu năng của lịch (một lần duyệt, xem Core/evaluation.py)
+        Thời điểm kết thúc lấy từ lịch của máy nên độ trễ đúng kể cả khi
+        job.finish_time chưa được gán
+        """
+        table = self.jobs if isinstance(self.jobs, JobTable) else None
+        with profiler.phase("schedule.evaluate"):
+            return evaluate_schedule(self.machines, table)
 
     def get_schedule_summary(self):
         """Trả về dữ liệu dạng dict để hiển thị hoặc visualize"""
+        if isinstance(self.jobs, JobTable):
+            table = self.jobs
+            summary = {m.machine_id: [(job.job_id, start, finish) for job, start, finish in m.schedule]
+                       for m in self.machines}
+            for i in np.argsort(table.start_times, kind="stable"):
+                if table.machines[i] >= 0:
+                    machine_id = self.machines[table.machines[i]].machine_id
+                    summary[machine_id].append((int(table.ids[i]), table.start_times[i].item(),
+                                                table.finish_times[i].item()))
+            return summary
+
         summary = {}
         for m in self.machines:
             summary[m.machine_id] = [
@@ -0,0 +1,232 @@
+# schedule_result.py
+# Kết quả lập lịch dạng mảng dùng chung cho mọi thuật toán
+import numpy as np
+
+from Core.job_table import JobTable
+from Core.evaluation import evaluate_arrays
+from utils import profiler
+
+
+class ScheduleResult:
+    """
+    Lịch đã xếp, lưu dạng cột theo thứ tự (máy, thời điểm bắt đầu):
+      - table: JobTable các job đã xếp, đủ cột ids, durations, deadlines, priorities,
+               start_times, finish_times, machines (chỉ số máy 0..m-1)
+      - rows: (n,) vị trí của từng job trong danh sách / bảng job đầu vào
+      - bounds: (m + 1,) job của máy k nằm ở table[bounds[k]:bounds[k + 1]]
+      - machine_ids: id hiển thị của từng máy (mặc định 0..m-1)
+      - info: chi tiết của thuật toán (lịch sử hội tụ, gap, ...)
+    Vì job của cùng một máy nằm liền nhau, mọi truy vấn theo máy (Gantt, in lịch,
+    đánh giá) chỉ là lát cắt (view) của các cột, không sao chép và không tạo đối tượng
+    Job / Machine. Job không được xếp (vd: EDD bỏ job không có deadline) không có trong bảng
+    """
+
+    def __init__(self, table, rows, bounds, machine_ids=None, info=None):
+        self.table = table
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.bounds = np.asarray(bounds, dtype=np.int64)
+        n_machines = len(self.bounds) - 1
+        self.machine_ids = list(range(n_machines)) if machine_ids is None else list(machine_ids)
+        self.info = {} if info is None else info
+
+    # ==========================
+    # Tạo kết quả
+    # ==========================
+    @staticmethod
+    def _table(jobs):
+        return jobs if isinstance(jobs, JobTable) else JobTable.from_jobs(jobs)
+
+    @classmethod
+    def from_arrays(cls, jobs, machines, start_times, finish_times=None, n_machines=None,
+                    machine_ids=None, info=None):
+        """
+        Từ các cột theo thứ tự job đầu vào
+        jobs: JobTable hoặc list Job; machines: chỉ số máy của từng job (-1 => không xếp)
+        start_times, finish_times: thời điểm bắt đầu / kết thúc (finish mặc định start + duration)
+        """
+        table = cls._table(jobs)
+        machines = np.asarray(machines, dtype=np.int64)
+        start_times = np.asarray(start_times, dtype=float)
+        finish_times = (start_times + table.durations if finish_times is None
+                        else np.asarray(finish_times, dtype=float))
+        if n_machines is None:
+            n_machines = int(machines.max()) + 1 if len(machines) else 0
+        placed = np.flatnonzero(machines >= 0)
+        rows = placed[np.lexsort((start_times[placed], machines[placed]))]
+        return cls._build(table, rows, machines[rows], start_times[rows], finish_times[rows],
+                          n_machines, machine_ids, info)
+
+    @classmethod
+    def from_rows(cls, jobs, machine_rows, times=None, machine_ids=None, info=None):
+        """
+        Từ danh sách chỉ số job (vị trí trong jobs) theo từng máy, đúng thứ tự chạy:
+        job trên mỗi máy chạy liên tiếp từ thời điểm 0 (cách giải mã của GWO / B&B)
+        times: ProcessingTimes khi máy không giống nhau
+        """
+        table = cls._table(jobs)
+        counts = np.array([len(rows) for rows in machine_rows], dtype=np.int64)
+        rows = (np.concatenate([np.asarray(r, dtype=np.int64) for r in machine_rows])
+                if len(machine_rows) else np.empty(0, dtype=np.int64))
+        machines = np.repeat(np.arange(len(machine_rows)), counts)
+        if times is None:
+            durations = table.durations[rows]
+        else:
+            durations = times.pairs(table.durations, rows, machines)
+        # Cộng dồn toàn cục rồi trừ mốc đầu đoạn của từng máy => thời điểm kết thúc trên máy
+        finish = np.cumsum(durations)
+        offsets = np.concatenate(([0.0], finish))[np.cumsum(counts) - counts]
+        finish -= np.repeat(offsets, counts)
+        return cls._build(table, rows, machines, finish - durations, finish,
+                          len(machine_rows), machine_ids, info)
+
+    @classmethod
+    def from_assignment(cls, jobs, assignment, times=None, machine_ids=None, info=None):
+        """
+        Từ job id theo từng máy (vd: ScheduleResult.assignment, "assignment" của batch_solve)
+        """
+        table = cls._table(jobs)
+        sorter = np.argsort(table.ids, kind="stable")
+        machine_rows = [sorter[np.searchsorted(table.ids, np.asarray(ids, dtype=table.ids.dtype),
+                                               sorter=sorter)]
+                        for ids in assignment]
+        return cls.from_rows(table, machine_rows, times, machine_ids, info)
+
+    @classmethod
+    def from_schedule(cls, schedule):
+        """Từ Schedule kiểu cũ (Machine chứa (job, start, finish) + JobTable nếu có)"""
+        entries = [(k, job, start, finish) for k, machine in enumerate(schedule.machines)
+                   for job, start, finish in machine.schedule]
+        jobs = [job for _, job, _, _ in entries]
+        machine_ids = [machine.machine_id for machine in schedule.machines]
+        result = cls.from_arrays(jobs, [k for k, _, _, _ in entries],
+                                 [start for _, _, start, _ in entries],
+                                 [finish for _, _, _, finish in entries],
+                                 len(schedule.machines), machine_ids)
+        if isinstance(schedule.jobs, JobTable):
+            table = schedule.jobs
+            extra = cls.from_arrays(table, table.machines, table.start_times,
+                                    table.finish_times, len(schedule.machines), machine_ids)
+            if len(extra):
+                if not len(result):
+                    return extra
+                # Gộp cả hai phần (hiếm: máy có lịch sẵn + lịch trong bảng)
+                merged = JobTable(*(np.concatenate((getattr(result.table, name),
+                                                    getattr(extra.table, name)))
+                                    for name in JobTable.COLUMNS))
+                return cls.from_arrays(merged, merged.machines, merged.start_times,
+                                       merged.finish_times, len(schedule.machines),
+                                       machine_ids)
+        return result
+
+    @classmethod
+    def _build(cls, table, rows, machines, starts, finishes, n_machines, machine_ids, info):
+        result_table = JobTable(ids=table.ids[rows], durations=table.durations[rows],
+                                deadlines=table.deadlines[rows],
+                                priorities=table.priorities[rows],
+                                start_times=starts, finish_times=finishes, machines=machines)
+        bounds = np.searchsorted(machines, np.arange(n_machines + 1))
+        return cls(result_table, rows, bounds, machine_ids, info)
+
+    # ==========================
+    # Truy vấn (trả về view, không sao chép)
+    # ==========================
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def n_machines(self):
+        return len(self.bounds) - 1
+
+    @property
+    def ids(self):
+        return self.table.ids
+
+    @property
+    def start_times(self):
+        return self.table.start_times
+
+    @property
+    def finish_times(self):
+        return self.table.finish_times
+
+    @property
+    def machines(self):
+        """Chỉ số máy (0..m-1) của từng job trong bảng kết quả"""
+        return self.table.machines
+
+    @property
+    def makespan(self):
+        return float(self.finish_times.max()) if len(self) else 0.0
+
+    def machine_slice(self, k):
+        return slice(self.bounds[k], self.bounds[k + 1])
+
+    def machine_table(self, k):
+        """JobTable các job của máy k (các cột là view của bảng kết quả)"""
+        s = self.machine_slice(k)
+        return JobTable(*(getattr(self.table, name)[s] for name in JobTable.COLUMNS))
+
+    def gantt_rows(self):
+        """list (starts, finishes, job_ids) theo từng máy - cùng dạng utils.chart.gantt_rows"""
+        table = self.table
+        return [(table.start_times[s], table.finish_times[s], table.ids[s])
+                for s in map(self.machine_slice, range(self.n_machines))]
+
+    def evaluate(self):
+        """Các chỉ số của lịch (cùng khóa với Schedule.evaluate), tính thẳng trên các cột"""
+        table = self.table
+        with profiler.phase("schedule.evaluate"):
+            return evaluate_arrays(table.finish_times, table.deadlines,
+                                   table.finish_times - table.start_times, table.priorities,
+                                   table.machines, self.n_machines)
+
+    # ==========================
+    # Xuất (chuyển sang đối tượng Python chỉ ở đây)
+    # ==========================
+    def assignment(self):
+        """Job id theo từng máy (list các list, vd: "assignment" của batch_solve)"""
+        return [self.ids[s].tolist() for s in map(self.machine_slice, range(self.n_machines))]
+
+    def get_schedule_summary(self):
+        """dict machine_id -> [(job_id, start, finish), ...] để in / hiển thị"""
+        ids, starts, finishes = (self.ids.tolist(), self.start_times.tolist(),
+                                 self.finish_times.tolist())
+        bounds = self.bounds.tolist()
+        return {machine_id: list(zip(ids[bounds[k]:bounds[k + 1]],
+                                     starts[bounds[k]:bounds[k + 1]],
+                                     finishes[bounds[k]:bounds[k + 1]]))
+                for k, machine_id in enumerate(self.machine_ids)}
+
+    def columns(self):
+        """Các cột để ghi ra file (view): job_id, machine, start, finish, deadline, row"""
+        return {"job_id": self.ids, "machine": np.asarray(self.machine_ids)[self.machines],
+                "start": self.start_times, "finish": self.finish_times,
+                "deadline": self.table.deadlines, "row": self.rows}
+
+    def to_csv(self, stream):
+        """Ghi lịch ra CSV (một dòng mỗi job) bằng np.savetxt, không duyệt từng job"""
+        columns = self.columns()
+        stream.write(",".join(columns) + "\n")
+        if len(self):
+            data = np.column_stack([np.asarray(c, dtype=float) for c in columns.values()])
+            np.savetxt(stream, data, delimiter=",", fmt=["%d", "%d", "%.10g", "%.10g",
+                                                         "%.10g", "%d"])
+
+    def to_machines(self):
+        """Danh sách Machine kiểu cũ (chỉ để tương thích với code cũ, chậm với lịch lớn)"""
+        from Core.machine import Machine
+        machines = []
+        for k, machine_id in enumerate(self.machine_ids):
+            machine = Machine(machine_id)
+            s = self.machine_slice(k)
+            starts, finishes = self.start_times[s], self.finish_times[s]
+            machine.schedule = list(zip(self.machine_table(k).to_jobs(), starts.tolist(),
+                                        finishes.tolist()))
+            machine.busy_time = float((finishes - starts).sum())
+            machine.ready_time = finishes[-1].item() if len(finishes) else 0
+            machines.append(machine)
+        return machines
+
+    def __repr__(self):
+        return (f"ScheduleResult({len(self)} jobs, {self.n_machines} machines, "
+                f"makespan={self.makespan:g})")
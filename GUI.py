@@ -5,19 +5,20 @@ Sử dụng Tkinter + Matplotlib
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import sys
 import os
+import queue
+import threading
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from Core.job import Job
 from Core.machine import Machine
 from algorithms.greedy import GreedyScheduler
 from algorithms.gwo import gwo_schedule
 from utils.data_generator import DataGenerator
+from utils.chart import GanttRenderer
 import time
 
 
@@ -33,7 +34,18 @@ class SchedulingGUI:
         self.machines = []
         self.results = {}
         
+        # Chạy thuật toán ở luồng nền: luồng nền chỉ gửi thông điệp vào hàng đợi,
+        # luồng Tk đọc hàng đợi định kỳ (after) và cập nhật giao diện
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.workers = {}  # tên thuật toán -> Thread đang chạy
+        self.compare_when_done = False
+        self.live_history = []
+        self.live_line = None
+        self.last_live_draw = 0.0
+        
         self.setup_ui()
+        self.root.after(50, self.poll_events)
         
     def setup_ui(self):
         """Thiết lập giao diện"""
@@ -151,6 +163,13 @@ class SchedulingGUI:
         ttk.Button(action_frame, text="🗑️ Xóa Kết Quả", 
                   command=self.clear_results).pack(fill=tk.X, pady=2)
         
+        # Tiến độ + hủy
+        self.progress = ttk.Progressbar(action_frame, mode="determinate", maximum=100)
+        self.progress.pack(fill=tk.X, pady=2)
+        self.cancel_button = ttk.Button(action_frame, text="⏹️ Hủy", 
+                                        command=self.cancel_run, state=tk.DISABLED)
+        self.cancel_button.pack(fill=tk.X, pady=2)
+        
         # Status
         self.status_label = ttk.Label(control_frame, text="Trạng thái: Chờ dữ liệu...", 
                                      foreground="blue")
@@ -164,6 +183,9 @@ class SchedulingGUI:
         # Create matplotlib figure
         self.fig = Figure(figsize=(8, 6), dpi=80)
         self.canvas = FigureCanvasTkAgg(self.fig, master=viz_frame)
+        # Thanh công cụ pan / zoom (biểu đồ Gantt vẽ lại phần đang xem)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, viz_frame)
+        self.toolbar.update()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Initial plot
@@ -255,46 +277,87 @@ class SchedulingGUI:
         self.fig.tight_layout()
         self.canvas.draw()
         
+    def start_worker(self, name, target):
+        """
+        Chạy target() ở luồng nền; kết quả / lỗi gửi về qua self.events
+        target không được đụng tới widget Tk (chỉ luồng chính mới được vẽ)
+        """
+        if name in self.workers:
+            messagebox.showinfo("Thông báo", f"{name} đang chạy!")
+            return
+        if not self.workers:
+            self.cancel_event.clear()
+        
+        def worker():
+            try:
+                self.events.put(("done", name, target()))
+            except Exception as e:
+                self.events.put(("error", name, e))
+        
+        thread = threading.Thread(target=worker, name=name, daemon=True)
+        self.workers[name] = thread
+        self.cancel_button.config(state=tk.NORMAL)
+        thread.start()
+        
+    def poll_events(self):
+        """Đọc thông điệp từ luồng nền (chạy định kỳ trên luồng Tk)"""
+        try:
+            while True:
+                kind, name, payload = self.events.get_nowait()
+                if kind == "progress":
+                    self.on_progress(name, payload)
+                elif kind == "done":
+                    self.workers.pop(name, None)
+                    self.on_done(name, payload)
+                else:
+                    self.workers.pop(name, None)
+                    messagebox.showerror("Lỗi", f"Lỗi khi chạy {name}: {str(payload)}")
+                    self.status_label.config(text=f"❌ Lỗi khi chạy {name}", foreground="red")
+                if kind != "progress" and not self.workers:
+                    self.cancel_button.config(state=tk.DISABLED)
+                    if self.compare_when_done:
+                        self.compare_when_done = False
+                        if len(self.results) >= 2:
+                            self.show_comparison()
+        except queue.Empty:
+            pass
+        self.root.after(50, self.poll_events)
+        
+    def cancel_run(self):
+        """Yêu cầu dừng các thuật toán đang chạy (GWO dừng sau vòng lặp hiện tại)"""
+        self.cancel_event.set()
+        self.compare_when_done = False
+        self.status_label.config(text="⏹️ Đang hủy...", foreground="orange")
+        
     def run_greedy(self):
-        """Chạy thuật toán Greedy"""
+        """Chạy thuật toán Greedy (luồng nền)"""
         if not self.jobs:
             messagebox.showwarning("Cảnh báo", "Vui lòng tạo dữ liệu trước!")
             return
         
-        try:
-            strategy = self.greedy_strategy_var.get()
-            self.status_label.config(text=f"⏳ Đang chạy Greedy ({strategy})...", 
-                                    foreground="orange")
-            self.root.update()
-            
+        strategy = self.greedy_strategy_var.get()
+        jobs, machines = self.jobs, self.machines
+        self.status_label.config(text=f"⏳ Đang chạy Greedy ({strategy})...", 
+                                foreground="orange")
+        
+        def solve():
             start_time = time.time()
-            scheduler = GreedyScheduler(self.jobs, self.machines, strategy=strategy)
+            scheduler = GreedyScheduler(jobs, machines, strategy=strategy)
             schedule = scheduler.schedule()
             runtime = time.time() - start_time
             
             metrics = schedule.evaluate()
-            
-            self.results[f"Greedy_{strategy}"] = {
+            return {
                 "schedule": schedule,
                 "makespan": metrics["makespan"],
                 "total_lateness": metrics["total_lateness"],
                 "runtime": runtime
             }
-            
-            self.status_label.config(
-                text=f"✅ Greedy ({strategy}): Makespan={metrics['makespan']:.2f}, Time={runtime:.4f}s", 
-                foreground="green"
-            )
-            
-            self.display_results(f"Greedy_{strategy}")
-            self.visualize_gantt_chart(schedule, f"Greedy {strategy}")
-            
-        except Exception as e:
-            messagebox.showerror("Lỗi", f"Lỗi khi chạy Greedy: {str(e)}")
-            self.status_label.config(text="❌ Lỗi khi chạy Greedy", foreground="red")
+        
+        self.start_worker(f"Greedy_{strategy}", solve)
             
     def run_gwo(self):
-        """Chạy thuật toán GWO"""
+        """Chạy thuật toán GWO (luồng nền, báo tiến độ từng vòng lặp, hủy được)"""
         if not self.jobs:
             messagebox.showwarning("Cảnh báo", "Vui lòng tạo dữ liệu trước!")
             return
@@ -302,46 +365,103 @@ class SchedulingGUI:
         try:
             pop_size = self.gwo_pop_var.get()
             iters = self.gwo_iter_var.get()
-            
-            self.status_label.config(text=f"⏳ Đang chạy GWO...", foreground="orange")
-            self.root.update()
-            
-            job_durations = [job.duration for job in self.jobs]
-            
+        except Exception as e:
+            messagebox.showerror("Lỗi", f"Tham số GWO không hợp lệ: {str(e)}")
+            return
+        
+        self.status_label.config(text=f"⏳ Đang chạy GWO...", foreground="orange")
+        jobs = self.jobs
+        m = len(self.machines)
+        machine_ids = [machine.machine_id for machine in self.machines]
+        self.live_history = []
+        self.live_line = None
+        self.progress.config(value=0)
+        
+        def progress(p):
+            self.events.put(("progress", "GWO", p))
+            return self.cancel_event.is_set()
+        
+        def solve():
             start_time = time.time()
             schedule, makespan, info = gwo_schedule(
-                jobs=job_durations,
-                m=len(self.machines),
+                jobs=jobs,
+                m=m,
                 pop_size=pop_size,
                 iters=iters,
-                verbose=False
+                verbose=False,
+                callback=progress
             )
             runtime = time.time() - start_time
-            
-            self.results["GWO"] = {
+            schedule.machine_ids = machine_ids
+            return {
                 "schedule": schedule,
                 "makespan": makespan,
+                "total_lateness": schedule.evaluate()["total_lateness"],
                 "runtime": runtime,
                 "info": info
             }
-            
+        
+        self.start_worker("GWO", solve)
+        
+    def on_progress(self, name, p):
+        """Cập nhật thanh tiến độ + đồ thị hội tụ trực tiếp (vẽ lại tối đa ~10 lần/giây)"""
+        self.progress.config(value=100 * p["iteration"] / max(1, p["iters"]))
+        self.status_label.config(
+            text=f"⏳ {name}: vòng {p['iteration']}/{p['iters']}, best={p['alpha_score']:.2f}",
+            foreground="orange")
+        self.live_history.append(p["alpha_score"])
+        
+        now = time.time()
+        if now - self.last_live_draw < 0.1:
+            return
+        self.last_live_draw = now
+        if self.live_line is None:
+            self.fig.clear()
+            ax = self.fig.add_subplot(111)
+            self.live_line, = ax.plot([], [], linewidth=2, color='#e74c3c')
+            ax.set_xlabel('Iteration', fontsize=10)
+            ax.set_ylabel('Best Makespan', fontsize=10)
+            ax.set_title('GWO Convergence Curve (đang chạy)', fontsize=12, weight='bold')
+            ax.grid(alpha=0.3)
+        self.live_line.set_data(range(1, len(self.live_history) + 1), self.live_history)
+        ax = self.live_line.axes
+        ax.relim()
+        ax.autoscale_view()
+        self.canvas.draw_idle()
+        
+    def on_done(self, name, result):
+        """Nhận kết quả từ luồng nền (chạy trên luồng Tk)"""
+        self.results[name] = result
+        self.display_results(name)
+        
+        if name == "GWO":
+            info = result["info"]
+            self.live_line = None
+            self.progress.config(value=100)
+            cancelled = info.get("stop_reason") == "callback"
             self.status_label.config(
-                text=f"✅ GWO: Makespan={makespan:.2f}, Time={runtime:.4f}s", 
-                foreground="green"
+                text=f"{'⏹️ GWO đã hủy' if cancelled else '✅ GWO'}: "
+                     f"Makespan={result['makespan']:.2f}, Time={result['runtime']:.4f}s", 
+                foreground="blue" if cancelled else "green"
             )
-            
-            self.display_results("GWO")
             self.visualize_gwo_convergence(info)
-            
-        except Exception as e:
-            messagebox.showerror("Lỗi", f"Lỗi khi chạy GWO: {str(e)}")
-            self.status_label.config(text="❌ Lỗi khi chạy GWO", foreground="red")
+        else:
+            self.status_label.config(
+                text=f"✅ {name}: Makespan={result['makespan']:.2f}, "
+                     f"Time={result['runtime']:.4f}s", 
+                foreground="green"
+            )
+            if "GWO" not in self.workers:  # không vẽ đè đồ thị hội tụ đang chạy
+                self.visualize_gantt_chart(result["schedule"], name.replace("_", " "))
             
     def run_all_algorithms(self):
-        """Chạy tất cả thuật toán"""
+        """Chạy tất cả thuật toán song song, so sánh khi tất cả đã xong"""
+        if not self.jobs:
+            messagebox.showwarning("Cảnh báo", "Vui lòng tạo dữ liệu trước!")
+            return
+        self.compare_when_done = True
         self.run_greedy()
         self.run_gwo()
-        self.show_comparison()
         
     def display_results(self, algo_name):
         """Hiển thị kết quả chi tiết"""
@@ -364,19 +484,13 @@ class SchedulingGUI:
         self.results_text.insert(tk.END, "LỊCH PHÂN CÔNG:\n")
         self.results_text.insert(tk.END, "-"*80 + "\n\n")
         
-        if "schedule" in result and hasattr(result["schedule"], "machines"):
-            schedule = result["schedule"]
-            for machine in schedule.machines:
-                self.results_text.insert(tk.END, f"\nMachine {machine.machine_id}:\n")
-                for job, start, finish in machine.schedule:
-                    self.results_text.insert(tk.END, 
-                        f"  Job {job.job_id}: [{start:.1f} - {finish:.1f}] (dur: {job.duration})\n")
-        elif "schedule" in result:
-            # GWO format
-            schedule = result["schedule"]
-            for m_idx, jobs_on_machine in enumerate(schedule):
-                self.results_text.insert(tk.END, f"\nMachine {m_idx}:\n")
-                self.results_text.insert(tk.END, f"  Jobs: {jobs_on_machine}\n")
+        if "schedule" in result:
+            # Greedy / GWO đều trả về ScheduleResult => cùng một cách in
+            for machine_id, entries in result["schedule"].get_schedule_summary().items():
+                self.results_text.insert(tk.END, f"\nMachine {machine_id}:\n")
+                for job_id, start, finish in entries:
+                    self.results_text.insert(tk.END,
+                        f"  Job {job_id}: [{start:.1f} - {finish:.1f}] (dur: {finish - start:g})\n")
         
         self.results_text.config(state=tk.DISABLED)
         
@@ -385,23 +499,18 @@ class SchedulingGUI:
         self.fig.clear()
         ax = self.fig.add_subplot(111)
         
-        colors = plt.cm.Set3(range(len(schedule.machines)))
-        
-        for idx, machine in enumerate(schedule.machines):
-            for job, start, finish in machine.schedule:
-                ax.barh(idx, finish - start, left=start, height=0.8, 
-                       color=colors[idx], edgecolor='black', alpha=0.8)
-                ax.text(start + (finish - start)/2, idx, f"J{job.job_id}", 
-                       ha='center', va='center', fontsize=8, weight='bold')
+        # Mỗi máy một collection, chỉ vẽ lại khung nhìn khi kéo / phóng to trên thanh công cụ
+        self.gantt_renderer = GanttRenderer(ax, schedule)
         
         ax.set_xlabel('Time', fontsize=10)
         ax.set_ylabel('Machine', fontsize=10)
         ax.set_title(f'Gantt Chart - {title}', fontsize=12, weight='bold')
-        ax.set_yticks(range(len(schedule.machines)))
-        ax.set_yticklabels([f"M{m.machine_id}" for m in schedule.machines])
+        ax.set_yticks(range(schedule.n_machines))
+        ax.set_yticklabels([f"M{machine_id}" for machine_id in schedule.machine_ids])
         ax.grid(axis='x', alpha=0.3)
         
         self.fig.tight_layout()
+        self.gantt_renderer.render()  # kích thước trục đổi sau tight_layout
         self.canvas.draw()
         
     def visualize_gwo_convergence(self, info):
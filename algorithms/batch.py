@@ -0,0 +1,343 @@
+# ==========================
+#  GIẢI THEO LÔ (BATCH) NHIỀU BÀI TOÁN ĐỘC LẬP
+#  Description: Chạy (bài toán x cấu hình thuật toán) trên một pool tiến trình,
+#  trả kết quả về ngay khi từng tác vụ xong (không chờ cả lô).
+#  - Mỗi tác vụ có luồng số ngẫu nhiên riêng (SeedSequence.spawn) => tái lập
+#    được với cùng seed, không phụ thuộc thứ tự hoàn thành hay số tiến trình
+#  - Tác vụ chỉ được lấy khi có worker rảnh (max_workers / max_in_flight)
+#    => bộ nhớ không phình khi lô có hàng nghìn bài toán
+#  - Timeout từng tác vụ: truyền xuống làm ngân sách thời gian của GWO / B&B
+#    (dừng có kiểm soát, vẫn trả lời giải tốt nhất), tác vụ vượt quá
+#    timeout * hard_timeout_factor bị bỏ qua với status "timeout": chỉ worker
+#    chạy nó bị dừng và thay mới, các tác vụ khác không bị chạy lại
+# ==========================
+
+import os
+import queue
+import time
+from multiprocessing import Manager, Pipe, Process, connection
+
+import numpy as np
+
+from Core.machine import Machine
+from Core.processing_times import resolve_times
+from algorithms.greedy import GreedyScheduler
+from algorithms.gwo import gwo_schedule
+from algorithms.gwo_island import gwo_island_schedule
+from algorithms.pso import pso_schedule, pso_island_schedule
+from algorithms.woa import woa_schedule, woa_island_schedule
+from algorithms.branch_and_bound import BranchAndBoundScheduler
+
+
+# Các thuật toán dựa trên quần thể (algorithms/population.py): cùng tham số chung
+# (pop_size, iters, time_budget, callback, ...) nên xử lý giống nhau
+OPTIMIZERS = {"gwo": gwo_schedule, "pso": pso_schedule, "woa": woa_schedule}
+# Cùng các thuật toán đó chạy theo mô hình đảo (algorithms/island.py)
+ISLAND_OPTIMIZERS = {"gwo_island": gwo_island_schedule, "pso_island": pso_island_schedule,
+                     "woa_island": woa_island_schedule}
+ALGORITHMS = ("greedy", "gwo", "pso", "woa", "gwo_island", "pso_island", "woa_island",
+              "exact", "auto")
+
+
+def _normalize_instance(instance):
+    """Bài toán dạng (jobs, n_machines) hoặc {"jobs": ..., "machines": n_machines}"""
+    if isinstance(instance, dict):
+        return instance["jobs"], instance["machines"]
+    jobs, n_machines = instance
+    return jobs, n_machines
+
+
+def solve_task(task):
+    """
+    Giải một tác vụ (hàm cấp module để gửi sang tiến trình con)
+    task: (jobs, n_machines, algorithm, params, seed, timeout)
+    Trả về dict: makespan, total_lateness (nếu có), assignment, schedule (ScheduleResult),
+    info, runtime
+    """
+    jobs, n_machines, algorithm, params, seed, timeout = task
+    params = dict(params)
+    start = time.perf_counter()
+    result = {}
+
+    if algorithm == "greedy":
+        machines = [Machine(i) for i in range(n_machines)]
+        schedule = GreedyScheduler(jobs, machines, **params).schedule()
+        metrics = schedule.evaluate()
+        result.update(makespan=metrics["makespan"], total_lateness=metrics["total_lateness"],
+                      assignment=schedule.assignment(), info={})
+    elif algorithm == "exact":
+        if timeout is not None:
+            params["time_limit"] = min(params.get("time_limit", timeout), timeout)
+        machines = [Machine(i) for i in range(n_machines)]
+        scheduler = BranchAndBoundScheduler(jobs, machines, **params)
+        schedule = scheduler.schedule()
+        metrics = schedule.evaluate()
+        result.update(makespan=metrics["makespan"], total_lateness=metrics["total_lateness"],
+                      assignment=schedule.assignment(), info=scheduler.info)
+    elif algorithm in OPTIMIZERS or algorithm in ISLAND_OPTIMIZERS:
+        if timeout is not None:
+            budget = params.get("time_budget")
+            params["time_budget"] = timeout if budget is None else min(budget, timeout)
+        if algorithm in OPTIMIZERS:
+            schedule, makespan, info = OPTIMIZERS[algorithm](jobs, n_machines, seed=seed,
+                                                             **params)
+        else:
+            params.setdefault("max_workers", 0)  # đã ở trong tiến trình con => chạy tuần tự
+            schedule, makespan, info = ISLAND_OPTIMIZERS[algorithm](jobs, n_machines,
+                                                                    seed=seed, **params)
+        info = {key: value for key, value in info.items()
+                if key not in ("alpha", "best_position")}
+        schedule.info = info
+        result.update(makespan=float(makespan), assignment=schedule.assignment(), info=info)
+    else:
+        raise ValueError(f"Thuật toán không hợp lệ: {algorithm} (chọn trong {ALGORITHMS})")
+    result["schedule"] = schedule
+
+    result["runtime"] = time.perf_counter() - start
+    return result
+
+
+class _ProgressReporter:
+    """
+    Callback tiến độ của gwo_schedule / pso_schedule / woa_schedule trong tác vụ batch (picklable => gửi được sang
+    tiến trình con): cứ every vòng lặp gửi một bản ghi về tiến trình cha qua channel
+    """
+
+    def __init__(self, channel, instance, config, every):
+        self.channel = channel
+        self.instance = instance
+        self.config = config
+        self.every = every
+
+    def __call__(self, progress):
+        if progress["iteration"] % self.every == 0 or progress["iteration"] == progress["iters"]:
+            self.channel.put(dict(progress, instance=self.instance, config=self.config))
+        return False
+
+
+class _DirectChannel:
+    """Kênh cho chế độ tuần tự (max_workers = 0): gọi thẳng hàm progress"""
+
+    def __init__(self, progress):
+        self.put = progress
+
+
+def _drain(channel, progress):
+    """Chuyển các bản ghi tiến độ đang chờ trong channel cho hàm progress"""
+    while True:
+        try:
+            progress(channel.get_nowait())
+        except queue.Empty:
+            return
+
+
+def _tasks(instances, configs, seed, timeout, exact_max_jobs, channel=None, progress_every=1):
+    """
+    Sinh (instance_index, config_name, task) cho mọi cặp bài toán x cấu hình
+    Seed của tác vụ thứ k lấy từ SeedSequence(seed).spawn => độc lập và tái lập được
+    """
+    root = np.random.SeedSequence(seed)
+    for i, instance in enumerate(instances):
+        jobs, n_machines = _normalize_instance(instance)
+        for config in configs:
+            config = dict(config)
+            algorithm = config.pop("algorithm")
+            name = config.pop("name", algorithm)
+            task_timeout = config.pop("timeout", timeout)
+            if algorithm == "auto":
+                # Máy khác tốc độ (config["gwo"]["times"]) => B&B không áp dụng được
+                exact = (len(jobs) <= exact_max_jobs
+                         and resolve_times(config.get("gwo", {}).get("times")) is None)
+                algorithm = "exact" if exact else "gwo"
+                config = dict(config.get(algorithm, {}))  # bản sao: không ghi callback vào config gốc
+            task_seed = root.spawn(1)[0]
+            if channel is not None and algorithm in OPTIMIZERS:
+                config["callback"] = _ProgressReporter(channel, i, name, progress_every)
+            yield i, name, (jobs, n_machines, algorithm, config, task_seed, task_timeout)
+
+
+def batch_solve(instances, configs, seed=None, max_workers=None, max_in_flight=None,
+                timeout=None, hard_timeout_factor=2.0, exact_max_jobs=35, progress=None,
+                progress_every=10):
+    """
+    Giải nhiều bài toán độc lập song song, trả kết quả dần (generator) khi từng tác vụ xong
+    instances: iterable các bài toán (jobs, n_machines) hoặc {"jobs": ..., "machines": ...}
+               (có thể là generator => chỉ đọc tới đâu nạp tới đó)
+    configs: list cấu hình, mỗi cấu hình là dict:
+        {"algorithm": "greedy" | "gwo" | "pso" | "woa" | "gwo_island" | "pso_island"
+                      | "woa_island" | "exact" | "auto",
+         "name": tên hiển thị (mặc định = algorithm), "timeout": ghi đè timeout chung,
+         ...tham số của thuật toán (vd: strategy, pop_size, iters, time_limit)}
+        "auto": <= exact_max_jobs job trên máy giống nhau => "exact", còn lại (hoặc khi
+                config["gwo"]["times"] là máy khác tốc độ) => "gwo";
+                tham số riêng đặt trong config["exact"] / config["gwo"]
+    seed: seed gốc; mỗi tác vụ nhận một SeedSequence con riêng
+    max_workers: số tiến trình (0 => chạy tuần tự trong tiến trình hiện tại)
+    max_in_flight: số tác vụ tối đa đang chạy cùng lúc (mặc định max_workers; tác vụ chỉ được
+                   lấy từ instances khi có worker rảnh nên không có hàng đợi trong pool)
+    timeout: số giây cho mỗi tác vụ (None => không giới hạn)
+    progress(record): nhận tiến độ của các tác vụ GWO / PSO / WOA (dict callback của gwo_schedule
+                      + instance, config) mỗi progress_every vòng lặp, gọi trên tiến trình cha
+    Mỗi phần tử trả về là dict:
+        instance (chỉ số bài toán), config (tên cấu hình), algorithm,
+        status ("ok" | "timeout" | "error"), makespan, total_lateness (greedy/exact),
+        assignment (job id theo từng máy), schedule (ScheduleResult: thời điểm bắt đầu /
+        kết thúc), info, runtime, error (khi status = "error")
+    """
+    if max_workers == 0:
+        channel = _DirectChannel(progress) if progress is not None else None
+        for i, name, task in _tasks(instances, configs, seed, timeout, exact_max_jobs,
+                                    channel, progress_every):
+            yield _run_inline(i, name, task)
+        return
+
+    manager = Manager() if progress is not None else None
+    channel = manager.Queue() if manager is not None else None
+    tasks = _tasks(instances, configs, seed, timeout, exact_max_jobs, channel, progress_every)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_in_flight is not None:
+        max_workers = max(1, min(max_workers, max_in_flight))
+    workers = []  # tạo dần khi cần, tối đa max_workers
+
+    try:
+        exhausted = False
+        while True:
+            # Giao tác vụ cho các worker rảnh (tạo thêm worker nếu chưa đủ max_workers)
+            while not exhausted:
+                worker = next((w for w in workers if w.current is None), None)
+                if worker is None and len(workers) < max_workers:
+                    worker = _Worker()
+                    workers.append(worker)
+                if worker is None:
+                    break
+                item = next(tasks, None)
+                if item is None:
+                    exhausted = True
+                    break
+                worker.start_task(item, hard_timeout_factor)
+            busy = [w for w in workers if w.current is not None]
+            if not busy:
+                break
+
+            # Hạn chót tính từ lúc worker nhận tác vụ (tác vụ không phải xếp hàng chờ)
+            now = time.perf_counter()
+            deadlines = [w.deadline for w in busy if w.deadline is not None]
+            wait_for = max(0.0, min(deadlines) - now) if deadlines else None
+            if channel is not None:
+                wait_for = 0.1 if wait_for is None else min(wait_for, 0.1)
+            ready = connection.wait([w.conn for w in busy], timeout=wait_for)
+            if channel is not None:
+                _drain(channel, progress)
+
+            for worker in busy:
+                if worker.conn in ready:
+                    yield worker.finish_task()
+
+            # Tác vụ quá hạn cứng: chỉ dừng worker đang chạy nó, các tác vụ khác chạy tiếp
+            now = time.perf_counter()
+            for worker in busy:
+                if (worker.current is not None and worker.deadline is not None
+                        and now >= worker.deadline):
+                    i, name, task = worker.current
+                    worker.restart()
+                    yield {"instance": i, "config": name, "algorithm": task[2],
+                           "status": "timeout"}
+    finally:
+        for worker in workers:
+            worker.close()
+        if manager is not None:
+            _drain(channel, progress)
+            manager.shutdown()
+
+
+def _worker_loop(conn):
+    """Vòng lặp của tiến trình worker: nhận task qua pipe, gửi lại (status, kết quả)"""
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        try:
+            conn.send(("ok", solve_task(task)))
+        except Exception as exc:
+            conn.send(("error", repr(exc)))
+
+
+class _Worker:
+    """
+    Một tiến trình con chạy lần lượt các tác vụ (pipe riêng, tự quản lý)
+    Tác vụ quá hạn cứng => terminate() đúng tiến trình này rồi tạo tiến trình mới,
+    không ảnh hưởng tới tác vụ đang chạy trên các worker khác
+    """
+
+    def __init__(self):
+        self._spawn()
+
+    def _spawn(self):
+        # Không đặt daemon: tác vụ gwo_island với max_workers > 0 cần tạo tiến trình con.
+        # Tiến trình cha mất => pipe đóng => worker nhận EOFError và tự thoát
+        self.conn, child_conn = Pipe()
+        self.process = Process(target=_worker_loop, args=(child_conn,))
+        self.process.start()
+        child_conn.close()
+        self.current = None  # (instance, config, task) đang chạy
+        self.deadline = None
+
+    def start_task(self, item, hard_timeout_factor):
+        task = item[2]
+        self.conn.send(task)
+        self.current = item
+        task_timeout = task[-1]
+        self.deadline = (None if task_timeout is None
+                         else time.perf_counter() + task_timeout * hard_timeout_factor)
+
+    def finish_task(self):
+        """Nhận kết quả của tác vụ hiện tại, trả về bản ghi của batch_solve"""
+        i, name, task = self.current
+        record = {"instance": i, "config": name, "algorithm": task[2]}
+        try:
+            status, payload = self.conn.recv()
+        except EOFError:
+            # Tiến trình chết giữa chừng (vd: bị hệ điều hành kết thúc)
+            self.process.join()
+            record.update(status="error",
+                          error=f"worker exited with code {self.process.exitcode}")
+            self.restart()
+            return record
+        self.current = self.deadline = None
+        if status == "ok":
+            record.update(payload, status="ok")
+        else:
+            record.update(status="error", error=payload)
+        return record
+
+    def restart(self):
+        self.close()
+        self._spawn()
+
+    def close(self):
+        if self.current is None and self.process.is_alive():
+            try:
+                self.conn.send(None)  # worker rảnh => dừng êm
+            except OSError:
+                pass
+            self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+        self.current = self.deadline = None
+
+
+def _run_inline(i, name, task):
+    """Chạy một tác vụ ngay trong tiến trình hiện tại (max_workers = 0)"""
+    record = {"instance": i, "config": name, "algorithm": task[2]}
+    try:
+        record.update(solve_task(task), status="ok")
+    except Exception as exc:
+        record.update(status="error", error=repr(exc))
+    return record
@@ -0,0 +1,185 @@
+# ==========================
+#  BRANCH AND BOUND CHÍNH XÁC CHO P||Cmax (bài toán nhỏ)
+#  Description: Tìm lịch có makespan nhỏ nhất trên các máy giống nhau, chứng minh
+#  được tối ưu. Dùng cho bài toán dưới ~30-40 job, nơi GWO vẫn phải chạy hàng
+#  trăm vòng lặp mà không đảm bảo gì.
+#  - Job xét theo thứ tự LPT (dài trước) => cận tốt sớm, cắt nhánh sớm
+#  - Lời giải ban đầu: LPT + tìm kiếm cục bộ
+#  - Phá đối xứng: các máy có cùng tải là hoán đổi được => chỉ thử một máy
+#  - Ghi nhớ trạng thái tải (multiset tải, job tiếp theo) đã duyệt
+#  - Giới hạn số nút / thời gian: trả về lời giải tốt nhất + khoảng cách đã chứng minh
+# ==========================
+
+import math
+import time
+
+from Core.job_table import JobTable
+from Core.processing_times import resolve_times
+from Core.schedule_result import ScheduleResult
+from Core.scheduler import Scheduler
+from algorithms.local_search import improve_assignment
+
+
+def _root_lower_bound(ptimes_desc, m):
+    """
+    Cận dưới tại gốc:
+      - max(p), sum(p)/m (làm tròn lên nếu thời gian là số nguyên)
+      - p[m-1] + p[m]: trong m+1 job dài nhất, hai job phải chung một máy
+    """
+    total = sum(ptimes_desc)
+    integral = all(float(p).is_integer() for p in ptimes_desc)
+    bound = max(ptimes_desc[0], math.ceil(total / m) if integral else total / m)
+    if len(ptimes_desc) > m:
+        bound = max(bound, ptimes_desc[m - 1] + ptimes_desc[m])
+    return bound, integral
+
+
+def _lpt(ptimes_desc, m):
+    """Gán LPT: job dài trước vào máy nhẹ nhất. Trả về list chỉ số máy của từng job"""
+    loads = [0.0] * m
+    assignment = []
+    for p in ptimes_desc:
+        k = loads.index(min(loads))
+        loads[k] += p
+        assignment.append(k)
+    return assignment
+
+
+def solve_pcmax(ptimes, m, node_limit=1_000_000, time_limit=10.0, memo_limit=1_000_000):
+    """
+    Giải chính xác P||Cmax bằng branch and bound
+    ptimes: thời gian xử lý các job
+    m: số máy
+    Trả về: (assignment, makespan, info)
+        assignment[i]: chỉ số máy của job i (theo thứ tự ptimes đầu vào)
+        info: lower_bound, gap = (makespan - lower_bound) / lower_bound, optimal,
+              nodes, stop_reason ("optimal" | "node_limit" | "time_limit"), runtime
+    """
+    start = time.perf_counter()
+    n = len(ptimes)
+    if n == 0:
+        return [], 0.0, {"lower_bound": 0.0, "gap": 0.0, "optimal": True, "nodes": 0,
+                         "stop_reason": "optimal", "runtime": 0.0}
+
+    order = sorted(range(n), key=lambda i: -ptimes[i])
+    p = [float(ptimes[i]) for i in order]
+    root_bound, integral = _root_lower_bound(p, m)
+
+    # Lời giải ban đầu: LPT rồi cải thiện bằng move/swap
+    lpt = _lpt(p, m)
+    improved, best_makespan, _ = improve_assignment(
+        [[i for i in range(n) if lpt[i] == k] for k in range(m)], p)
+    best_assignment = [0] * n
+    for k, jobs_on_machine in enumerate(improved):
+        for i in jobs_on_machine:
+            best_assignment[i] = k
+
+    # Tổng thời gian các job còn lại tính từ vị trí i
+    suffix = [0.0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + p[i]
+
+    loads = [0.0] * m
+    assignment = [0] * n
+    seen = set()
+    stats = {"nodes": 0, "stop_reason": "optimal"}
+    deadline = start + time_limit if time_limit is not None else None
+
+    def node_bound(i):
+        bound = max(max(loads), (sum(loads) + suffix[i]) / m, min(loads) + p[i])
+        return math.ceil(bound - 1e-9) if integral else bound
+
+    def search(i):
+        nonlocal best_makespan, best_assignment
+        if i == n:
+            makespan = max(loads)
+            if makespan < best_makespan:
+                best_makespan, best_assignment = makespan, assignment.copy()
+            return best_makespan <= root_bound  # True => đã tối ưu, dừng toàn bộ
+
+        stats["nodes"] += 1
+        if stats["nodes"] >= node_limit:
+            stats["stop_reason"] = "node_limit"
+        elif deadline is not None and stats["nodes"] % 1024 == 0 and time.perf_counter() > deadline:
+            stats["stop_reason"] = "time_limit"
+        if stats["stop_reason"] != "optimal":
+            return True
+
+        if node_bound(i) >= best_makespan:
+            return False
+        state = (i, tuple(sorted(loads)))
+        if state in seen:
+            return False
+        if len(seen) < memo_limit:
+            seen.add(state)
+
+        tried = set()
+        for k in sorted(range(m), key=loads.__getitem__):
+            load = loads[k]
+            if load in tried:
+                continue  # phá đối xứng: máy cùng tải cho cây con giống hệt
+            tried.add(load)
+            if load + p[i] >= best_makespan:
+                break  # các máy sau còn nặng hơn
+            loads[k] = load + p[i]
+            assignment[i] = k
+            done = search(i + 1)
+            loads[k] = load
+            if done:
+                return True
+        return False
+
+    if best_makespan > root_bound:
+        search(0)
+
+    optimal = stats["stop_reason"] == "optimal"
+    lower_bound = best_makespan if optimal else root_bound
+    result = [0] * n
+    for pos, i in enumerate(order):
+        result[i] = best_assignment[pos]
+
+    info = {
+        "lower_bound": lower_bound,
+        "gap": (best_makespan - lower_bound) / lower_bound if lower_bound > 0 else 0.0,
+        "optimal": optimal,
+        "nodes": stats["nodes"],
+        "stop_reason": stats["stop_reason"],
+        "runtime": time.perf_counter() - start,
+    }
+    return result, best_makespan, info
+
+
+class BranchAndBoundScheduler(Scheduler):
+    """Lập lịch chính xác (P||Cmax) cho bài toán nhỏ, kế thừa từ Scheduler"""
+
+    def __init__(self, jobs, machines, node_limit=1_000_000, time_limit=10.0):
+        super().__init__(jobs, machines)
+        # Cận và phá đối xứng chỉ đúng khi máy giống nhau => lời giải "tối ưu" sẽ sai
+        if resolve_times(None, machines) is not None:
+            raise ValueError("Branch and Bound chỉ hỗ trợ máy giống nhau (mọi Machine.speed = 1)")
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.info = {}
+
+    def schedule(self):
+        """
+        Trả về ScheduleResult tối ưu (hoặc tốt nhất tìm được khi chạm giới hạn),
+        chi tiết ở self.info (cũng nằm trong schedule.info)
+        """
+        table = self.jobs if isinstance(self.jobs, JobTable) else JobTable.from_jobs(self.jobs)
+        assignment, _, self.info = solve_pcmax(
+            table.durations.tolist(), len(self.machines),
+            node_limit=self.node_limit, time_limit=self.time_limit)
+
+        machine_rows = [[] for _ in self.machines]
+        for i, k in enumerate(assignment):
+            machine_rows[k].append(i)
+        schedule = ScheduleResult.from_rows(
+            table, machine_rows, machine_ids=[machine.machine_id for machine in self.machines],
+            info=self.info)
+        self.best_schedule = schedule
+        self.best_score = self.evaluate(schedule)
+        return schedule
+
+    def evaluate(self, schedule):
+        return schedule.evaluate()["makespan"]
@@ -1,40 +1,225 @@
-import copy
+import heapq
+import math
+from itertools import islice
+import numpy as np
 from Core.scheduler import Scheduler
-from Core.schedule import Schedule
+from Core.job_table import JobTable
+from Core.schedule_result import ScheduleResult
+from Core.processing_times import resolve_times
+from utils import profiler
 
 class GreedyScheduler(Scheduler):
-    def __init__(self, jobs, machines, strategy="SPT"):
+    # Số job lấy thời gian xử lý trên mọi máy cùng lúc (máy không giống nhau)
+    TIMES_CHUNK = 4096
+    # SPT / LPT (Shortest / Longest Processing Time), EDD (Earliest Due Date),
+    # FCFS (First Come First Served)
+    STRATEGIES = ("SPT", "LPT", "EDD", "FCFS")
+
+    def __init__(self, jobs, machines, strategy="SPT", times=None):
         super().__init__(jobs, machines)
-        self.strategy = strategy  # SPT (Shortest Processing Time), EDD (Earliest Due Date), etc.
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Chiến lược không hợp lệ: {strategy} (chọn trong {self.STRATEGIES})")
+        self.strategy = strategy
+        # ProcessingTimes (máy uniform / unrelated, hạn chế máy); None => theo Machine.speed
+        self.times = times
 
-    def schedule(self):
-        # Tạo bản sao để không ảnh hưởng đến dữ liệu gốc
-        jobs_copy = copy.deepcopy(self.jobs)
-        machines_copy = copy.deepcopy(self.machines)
-        
-        # Sắp xếp jobs theo chiến lược
+    def _sorted_order(self, table):
+        """
+        Sắp xếp job theo chiến lược: trả về chỉ số dòng của bảng (sắp xếp ổn định,
+        không đụng tới dữ liệu gốc). EDD bỏ qua job không có deadline
+        """
         if self.strategy == "SPT":
-            jobs_copy.sort(key=lambda x: x.duration)
+            return np.argsort(table.durations, kind="stable")
+        elif self.strategy == "LPT":
+            return np.argsort(-table.durations, kind="stable")
         elif self.strategy == "EDD":
-            jobs_copy = [job for job in jobs_copy if job.deadline is not None]
-            jobs_copy.sort(key=lambda x: x.deadline)
+            has_deadline = np.flatnonzero(~np.isnan(table.deadlines))
+            return has_deadline[np.argsort(table.deadlines[has_deadline], kind="stable")]
         else:  # FCFS (First Come First Served)
-            jobs_copy.sort(key=lambda x: x.job_id)
-        
-        # Gán jobs vào máy có thời gian hoàn thành sớm nhất
-        for job in jobs_copy:
-            # Tìm máy có thời gian hoàn thành sớm nhất
-            best_machine = min(machines_copy, key=lambda m: m.current_time())
-            start_time = best_machine.current_time()
-            best_machine.assign(job, start_time)
-        
-        schedule = Schedule(machines_copy, jobs_copy)
+            return np.argsort(table.ids, kind="stable")
+
+    def _assign_heap(self, durations, ready):
+        """
+        Máy giống nhau: gán lần lượt cho máy rảnh sớm nhất
+        Heap (thời gian rảnh, chỉ số máy): lấy máy trong O(log m), bằng thời gian
+        thì ưu tiên máy đứng trước giống min() trước đây
+        Trả về (starts, machines) theo thứ tự durations
+        """
+        ready = [(start_time, idx) for idx, start_time in enumerate(ready)]
+        heapq.heapify(ready)
+        starts = np.empty(len(durations))
+        assigned = np.empty(len(durations), dtype=np.int64)
+        for i, p in enumerate(durations.tolist()):
+            start_time, idx = ready[0]
+            starts[i] = start_time
+            assigned[i] = idx
+            heapq.heapreplace(ready, (start_time + p, idx))
+        return starts, assigned
+
+    @staticmethod
+    def _ect(block, ready):
+        """
+        Gán lần lượt từng hàng của block (thời gian của một job trên mọi máy) cho máy có
+        thời điểm hoàn thành sớm nhất ready + p_ij (argmin trên cả vector máy)
+        ready: thời điểm rảnh của từng máy (mảng (m,), cập nhật tại chỗ)
+        Yield (start, finish, chỉ số máy) của từng hàng
+        """
+        for row in block:
+            finish = ready + row
+            k = finish.argmin()
+            start = ready[k]
+            ready[k] = finish[k]
+            yield start, finish[k], k
+
+    def _assign_ect(self, ptimes, order, ready, times):
+        """
+        Máy không giống nhau: gán các job (chỉ số hàng order) theo thời điểm hoàn thành
+        sớm nhất (_ect), lấy thời gian trên mọi máy theo từng khối TIMES_CHUNK job
+        Trả về (starts, finishes, machines) theo thứ tự order
+        """
+        starts = np.empty(len(order))
+        finishes = np.empty(len(order))
+        assigned = np.empty(len(order), dtype=np.int64)
+        for lo in range(0, len(order), self.TIMES_CHUNK):
+            block = times.rows(ptimes, order[lo:lo + self.TIMES_CHUNK])
+            for i, (start, finish, k) in enumerate(self._ect(block, ready), lo):
+                starts[i], finishes[i], assigned[i] = start, finish, k
+        return starts, finishes, assigned
+
+    def schedule(self):
+        profiler.count("greedy.jobs", len(self.jobs))
+        with profiler.phase(f"greedy.schedule.{self.strategy}"):
+            return self._schedule()
+
+    def _schedule(self):
+        """
+        Lập lịch trên các cột (list Job được đổi sang JobTable một lần, không tạo
+        Machine / Job mới). Máy bắt đầu từ thời điểm rảnh hiện tại (current_time)
+        Trả về ScheduleResult chỉ gồm các job được xếp trong lần gọi này
+        """
+        table = self.jobs if isinstance(self.jobs, JobTable) else JobTable.from_jobs(self.jobs)
+        times = resolve_times(self.times, self.machines)
+        order = self._sorted_order(table)
+        ready = np.array([machine.current_time() for machine in self.machines], dtype=float)
+
+        if times is not None:
+            times.validate(len(table), len(self.machines))
+            starts, finishes, assigned = self._assign_ect(table.durations, order, ready, times)
+        else:
+            starts, assigned = self._assign_heap(table.durations[order], ready)
+            finishes = starts + table.durations[order]
+
+        machines = np.full(len(table), -1, dtype=np.int64)
+        start_times = np.zeros(len(table))
+        finish_times = np.zeros(len(table))
+        machines[order], start_times[order], finish_times[order] = assigned, starts, finishes
+        schedule = ScheduleResult.from_arrays(
+            table, machines, start_times, finish_times, len(self.machines),
+            machine_ids=[machine.machine_id for machine in self.machines])
         self.best_schedule = schedule
         self.best_score = self.evaluate(schedule)
-        
         return schedule
 
+    # ==========================
+    # Chế độ trực tuyến (streaming): job đến liên tục
+    # ==========================
+    def _stream_key(self):
+        """Khóa sắp xếp trong một cửa sổ; EDD: job không có deadline xếp cuối"""
+        if self.strategy == "SPT":
+            return lambda job: job.duration
+        elif self.strategy == "LPT":
+            return lambda job: -job.duration
+        elif self.strategy == "EDD":
+            return lambda job: math.inf if job.deadline is None else job.deadline
+        else:  # FCFS
+            return lambda job: job.job_id
+
+    def _window_dispatcher(self, window):
+        """
+        Trạng thái dùng chung cho dispatch/adispatch, khởi tạo từ các máy hiện có
+        (không sửa self.machines):
+          - máy giống nhau: heap (thời gian rảnh, chỉ số máy), mỗi job O(log m)
+          - máy không giống nhau (self.times / Machine.speed): thời điểm hoàn thành sớm
+            nhất như schedule() (_ect); job thứ k của luồng là hàng k của ProcessingTimes
+        Trả về hàm gán một cửa sổ job -> list (job, machine_id, start, finish)
+        """
+        if window < 1:
+            raise ValueError(f"window phải >= 1 (nhận {window})")
+        times = resolve_times(self.times, self.machines)
+        if times is not None and times.n_machines != len(self.machines):
+            raise ValueError(f"Mô hình máy có {times.n_machines} máy, "
+                             f"bài toán có {len(self.machines)}")
+        ready = [(machine.current_time(), idx) for idx, machine in enumerate(self.machines)]
+        key = self._stream_key() if window > 1 else None
+        if times is not None:
+            return self._ect_dispatcher(times, [start for start, _ in ready], key)
+        heapq.heapify(ready)
+
+        def assign(jobs_window):
+            if key is not None:
+                jobs_window.sort(key=key)
+            assignments = []
+            for job in jobs_window:
+                start_time, idx = ready[0]
+                finish_time = start_time + job.duration
+                heapq.heapreplace(ready, (finish_time, idx))
+                assignments.append((job, self.machines[idx].machine_id, start_time, finish_time))
+            return assignments
+
+        return assign
+
+    def _ect_dispatcher(self, times, ready, key):
+        """Hàm gán cửa sổ job cho máy không giống nhau (xem _window_dispatcher)"""
+        ready = np.array(ready, dtype=float)
+        arrived = [0]  # số job đã nhận từ luồng = hàng của job kế tiếp
+
+        def assign(jobs_window):
+            # Hàng của job theo thứ tự đến, giữ nguyên khi sắp xếp trong cửa sổ
+            rows = list(range(arrived[0], arrived[0] + len(jobs_window)))
+            arrived[0] += len(jobs_window)
+            if times.matrix is not None and rows and rows[-1] >= len(times.matrix):
+                raise ValueError(f"matrix chỉ có {len(times.matrix)} hàng, luồng có nhiều job hơn")
+            pairs = list(zip(jobs_window, rows))
+            if key is not None:
+                pairs.sort(key=lambda pair: key(pair[0]))
+            jobs_window = [job for job, _ in pairs]
+            block = times.rows([job.duration for job in jobs_window],
+                               [row for _, row in pairs], aligned=True)
+            return [(job, self.machines[k].machine_id, start.item(), finish.item())
+                    for job, (start, finish, k) in zip(jobs_window, self._ect(block, ready))]
+
+        return assign
+
+    def dispatch(self, job_stream, window=1):
+        """
+        Gán job trực tuyến từ một iterator, mỗi job O(log m) (máy không giống nhau: O(m))
+        window: số job gom lại trước khi gán; trong mỗi cửa sổ vẫn sắp theo
+                chiến lược (SPT/LPT/EDD/FCFS), window=1 => gán ngay khi job tới (phải >= 1)
+        Yield từng phép gán (job, machine_id, start_time, finish_time) ngay khi có.
+        Không lưu lại lịch => bộ nhớ chỉ phụ thuộc m và window, không phụ thuộc số job
+        """
+        assign = self._window_dispatcher(window)
+        job_stream = iter(job_stream)
+        while True:
+            jobs_window = list(islice(job_stream, window))
+            if not jobs_window:
+                return
+            yield from assign(jobs_window)
+
+    async def adispatch(self, job_stream, window=1):
+        """Giống dispatch nhưng nhận async iterable (vd: hàng đợi job từ mạng)"""
+        assign = self._window_dispatcher(window)
+        jobs_window = []
+        async for job in job_stream:
+            jobs_window.append(job)
+            if len(jobs_window) >= window:
+                for assignment in assign(jobs_window):
+                    yield assignment
+                jobs_window = []
+        for assignment in assign(jobs_window):
+            yield assignment
+
     def evaluate(self, schedule):
         metrics = schedule.evaluate()
         # Hàm mục tiêu: tổ hợp makespan và độ trễ
-        return metrics["makespan"] + 0.1 * metrics["total_lateness"]
\ No newline at end of file
+        return metrics["makespan"] + 0.1 * metrics["total_lateness"]
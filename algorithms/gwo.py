@@ -4,69 +4,66 @@
 #  Description: Thuật toán tối ưu bầy sói xám (Grey Wolf Optimizer)
 #  dùng để giải bài toán Scheduling (phân công N job cho M máy sao cho
 #  makespan nhỏ nhất)
-#  - Không dùng thư viện ngoài, cài đặt từ đầu
+#  - Cài đặt từ đầu, chỉ dùng NumPy để vector hóa quần thể
+#  - Chạy trên khung chung algorithms/population.py (giải mã, cache, luật dừng,
+#    warm start, callback...), ở đây chỉ còn luật cập nhật vị trí của đàn sói
 # ==========================
 
 import random
-import math
-import time
-import copy
-from typing import List, Tuple, Dict, Any, Union
+
+import numpy as np
 
 # Import các lớp cốt lõi trong project
 from Core.scheduler import Scheduler
-from Core.schedule import Schedule
 from Core.machine import Machine
-from Core.job import Job
-
+from Core.processing_times import resolve_times
+from algorithms.population import PopulationOptimizer, population_schedule, population_iterate
+# Tương thích: code cũ dùng algorithms.gwo.decode_position (giờ nằm ở algorithms/population.py)
+from algorithms.population import decode_position
 
-# ==========================
-# 1. Chuẩn hóa dữ liệu job
-# ==========================
-def _normalize_jobs(jobs):
-    """Chuyển danh sách job về dạng [(id, ptime)]"""
-    result = []
-    if isinstance(jobs[0], dict):
-        for j in jobs:
-            result.append((j["id"], float(j["p"])))
-    else:
-        for i, p in enumerate(jobs):
-            result.append((i, float(p)))
-    return result
+__all__ = ["GWO", "gwo_schedule", "gwo_iterate", "GWOScheduler", "decode_position"]
 
 
 # ==========================
-# 2. Giải mã vector vị trí -> lịch phân công
+# 3. GREY WOLF OPTIMIZER
 # ==========================
-def decode_position(position, jobs, m):
+def _update_positions(wolves, leaders, a, lb, ub, rng):
     """
-    position: vector thực (float)
-    jobs: danh sách (id, ptime)
-    m: số máy
-    Cách làm:
-      - Sắp xếp job theo thứ tự position tăng dần (-> thứ tự thực thi)
-      - Gán tuần tự job cho máy có tổng thời gian nhỏ nhất
-    Trả về: (schedule, makespan)
+    Cập nhật vị trí cả đàn trong một lần (vector hóa bằng NumPy)
+    wolves: mảng (pop_size, n_jobs)
+    leaders: mảng (3, n_jobs) gồm alpha, beta, delta
+    Mỗi phần tử dùng hệ số A, C ngẫu nhiên riêng như bản gốc
+    """
+    pop_size, n_jobs = wolves.shape
+    new_X = np.zeros_like(wolves)
+    for leader in leaders:
+        A = 2 * a * rng.random((pop_size, n_jobs)) - a
+        C = 2 * rng.random((pop_size, n_jobs))
+        D = np.abs(C * leader - wolves)
+        new_X += leader - A * D
+    # Cập nhật vị trí trung bình + giới hạn biên
+    new_X /= 3.0
+    np.clip(new_X, lb, ub, out=new_X)
+    return new_X
+
+
+class GWO(PopulationOptimizer):
+    """
+    Luật cập nhật của GWO: 3 leader alpha, beta, delta; hệ số a giảm tuyến tính 2 -> 0
+    Leader chọn lại từ (leader cũ + cả đàn) sau mỗi vòng lặp (accept mặc định)
     """
-    normalized = _normalize_jobs(jobs)
-    order = sorted(range(len(position)), key=lambda i: position[i])
-    loads = [0.0] * m
-    schedule = [[] for _ in range(m)]
 
-    for i in order:
-        job_id, p = normalized[i]
-        # chọn máy rảnh nhất
-        min_m = min(range(m), key=lambda x: loads[x])
-        schedule[min_m].append(job_id)
-        loads[min_m] += p
+    name = "gwo"
+    n_leaders = 3
 
-    makespan = max(loads)
-    return schedule, makespan
+    def update(self, state, t, iters, lb, ub, rng):
+        a = 2 - 2 * t / iters  # hệ số giảm tuyến tính (2 → 0)
+        return _update_positions(state["positions"], state["leaders"], a, lb, ub, rng)
+
+
+_GWO = GWO()
 
 
-# ==========================
-# 3. GREY WOLF OPTIMIZER
-# ==========================
 def gwo_schedule(jobs,
                  m,
                  pop_size=30,
@@ -74,101 +71,52 @@ def gwo_schedule(jobs,
                  lb=0.0,
                  ub=1.0,
                  seed=None,
-                 verbose=False):
+                 verbose=False,
+                 cache_size=0,
+                 local_search=False,
+                 time_budget=None,
+                 stagnation=None,
+                 warm_start=None,
+                 callback=None,
+                 times=None):
     """
-    Cài đặt GWO để tối ưu makespan
-    jobs: list job (vd: [5,10,3,...]) hoặc [{'id':1,'p':5},...]
+    Cài đặt GWO để tối ưu makespan (tham số và kết quả: xem population_schedule)
+    jobs: list job (vd: [5,10,3,...]), [{'id':1,'p':5},...], list Job hoặc JobTable
     m: số máy
     pop_size: số lượng sói trong đàn
     iters: số vòng lặp
+    info["alpha"]: vector vị trí của alpha (= info["best_position"], dùng làm warm_start)
+    Quần thể được lưu dưới dạng mảng (pop_size, n_jobs), mỗi vòng lặp
+    cập nhật toàn bộ đàn bằng phép toán mảng thay vì lặp từng job
     Trả về:
-        best_schedule, best_makespan, info(dict)
+        best_schedule (ScheduleResult), best_makespan, info(dict)
     """
-    if seed is not None:
-        random.seed(seed)
-
-    n_jobs = len(jobs)
-    if n_jobs == 0:
-        return [], 0.0, {"runtime": 0.0, "best_history": []}
-
-    # Khởi tạo quần thể ngẫu nhiên
-    wolves = [[random.uniform(lb, ub) for _ in range(n_jobs)] for _ in range(pop_size)]
-
-    # Hàm fitness: makespan cần minimize
-    def fitness(pos):
-        _, ms = decode_position(pos, jobs, m)
-        return ms
-
-    # Đánh giá ban đầu
-    fitness_vals = [fitness(w) for w in wolves]
-    idx_sorted = sorted(range(pop_size), key=lambda i: fitness_vals[i])
-
-    alpha = copy.deepcopy(wolves[idx_sorted[0]])
-    alpha_score = fitness_vals[idx_sorted[0]]
-    beta = copy.deepcopy(wolves[idx_sorted[1]])
-    beta_score = fitness_vals[idx_sorted[1]]
-    delta = copy.deepcopy(wolves[idx_sorted[2]])
-    delta_score = fitness_vals[idx_sorted[2]]
-
-    best_history = [alpha_score]
-    start = time.time()
+    best_schedule, best_makespan, info = population_schedule(
+        _GWO, jobs, m, pop_size, iters, lb, ub, seed, verbose, cache_size, local_search,
+        time_budget, stagnation, warm_start, callback, times)
+    if "best_position" in info:
+        info["alpha"] = info["best_position"]
+    return best_schedule, best_makespan, info
 
-    # --- Vòng lặp chính ---
-    for t in range(iters):
-        a = 2 - 2 * t / iters  # hệ số giảm tuyến tính (2 → 0)
 
-        for i in range(pop_size):
-            X = wolves[i]
-            new_X = [0.0] * n_jobs
-            for j in range(n_jobs):
-                r1, r2 = random.random(), random.random()
-                A1 = 2 * a * r1 - a
-                C1 = 2 * r2
-                D_alpha = abs(C1 * alpha[j] - X[j])
-                X1 = alpha[j] - A1 * D_alpha
-
-                r1, r2 = random.random(), random.random()
-                A2 = 2 * a * r1 - a
-                C2 = 2 * r2
-                D_beta = abs(C2 * beta[j] - X[j])
-                X2 = beta[j] - A2 * D_beta
-
-                r1, r2 = random.random(), random.random()
-                A3 = 2 * a * r1 - a
-                C3 = 2 * r2
-                D_delta = abs(C3 * delta[j] - X[j])
-                X3 = delta[j] - A3 * D_delta
-
-                # Cập nhật vị trí trung bình
-                val = (X1 + X2 + X3) / 3.0
-                # Giới hạn biên
-                val = max(lb, min(ub, val))
-                new_X[j] = val
-
-            wolves[i] = new_X
-
-        # Cập nhật alpha, beta, delta
-        for i in range(pop_size):
-            f = fitness(wolves[i])
-            if f < alpha_score:
-                delta_score, delta = beta_score, copy.deepcopy(beta)
-                beta_score, beta = alpha_score, copy.deepcopy(alpha)
-                alpha_score, alpha = f, copy.deepcopy(wolves[i])
-            elif f < beta_score:
-                delta_score, delta = beta_score, copy.deepcopy(beta)
-                beta_score, beta = f, copy.deepcopy(wolves[i])
-            elif f < delta_score:
-                delta_score, delta = f, copy.deepcopy(wolves[i])
-
-        best_history.append(alpha_score)
-        if verbose and (t % max(1, iters // 10) == 0):
-            print(f"[GWO] Iter {t}/{iters} - Best makespan: {alpha_score:.4f}")
-
-    runtime = time.time() - start
-    best_schedule, best_makespan = decode_position(alpha, jobs, m)
-    info = {"runtime": runtime, "best_history": best_history,
-            "params": {"pop_size": pop_size, "iters": iters}}
-    return best_schedule, best_makespan, info
+def gwo_iterate(jobs,
+                m,
+                pop_size=30,
+                iters=100,
+                lb=0.0,
+                ub=1.0,
+                seed=None,
+                cache_size=0,
+                time_budget=None,
+                stagnation=None,
+                warm_start=None,
+                times=None):
+    """
+    Dạng generator của gwo_schedule: yield mỗi khi alpha tốt lên (và lời giải ban đầu)
+    Xem population_iterate; cùng seed => cùng quỹ đạo với gwo_schedule
+    """
+    return population_iterate(_GWO, jobs, m, pop_size, iters, lb, ub, seed, cache_size,
+                              time_budget, stagnation, warm_start, times)
 
 
 # ==========================
@@ -176,27 +124,68 @@ def gwo_schedule(jobs,
 # ==========================
 class GWOScheduler(Scheduler):
     """Triển khai thuật toán GWO kế thừa từ Scheduler"""
-    def __init__(self, jobs, machines, pop_size=30, iters=100):
+    # Tham số truyền thẳng cho gwo_schedule / island_schedule
+    OPTIONS = ("lb", "ub", "seed", "verbose", "cache_size")
+    # Tham số chỉ có nghĩa với mô hình đảo (n_islands > 1), xem island_schedule
+    ISLAND_OPTIONS = ("migration_interval", "migration_size", "max_workers")
+
+    def __init__(self, jobs, machines, pop_size=30, iters=100, n_islands=1,
+                 local_search=False, warm_start=None, times=None, **options):
         super().__init__(jobs, machines)
+        unknown = sorted(set(options) - set(self.OPTIONS) - set(self.ISLAND_OPTIONS))
+        if unknown:
+            raise TypeError(f"Tham số không hợp lệ: {', '.join(unknown)} "
+                            f"(chọn trong {', '.join(self.OPTIONS + self.ISLAND_OPTIONS)})")
+        island_only = sorted(set(options) & set(self.ISLAND_OPTIONS))
+        if island_only and n_islands <= 1:
+            raise ValueError(f"{', '.join(island_only)} chỉ dùng với n_islands > 1")
         self.pop_size = pop_size
         self.iters = iters
+        self.local_search = local_search
+        self.warm_start = warm_start  # vd: ["LPT", "SPT"] => gieo lời giải greedy vào đàn
+        self.times = times  # ProcessingTimes; None => theo Machine.speed
+        self.n_islands = n_islands  # > 1 => chạy mô hình đảo song song
+        self.options = options  # seed, lb, ub, ... (+ migration_interval, ... khi có đảo)
 
     def schedule(self):
-        """Thực thi thuật toán GWO để lập lịch"""
-        schedule, makespan, info = gwo_schedule(
-            jobs=self.jobs,
-            m=len(self.machines),
-            pop_size=self.pop_size,
-            iters=self.iters
-        )
-        self.best_schedule = schedule
+        """
+        Thực thi thuật toán GWO để lập lịch
+        Trả về ScheduleResult (thời điểm bắt đầu / kết thúc của từng job),
+        chi tiết thuật toán (lịch sử hội tụ, best_position, ...) ở schedule.info
+        """
+        times = resolve_times(self.times, self.machines)
+        if self.n_islands > 1:
+            from algorithms.gwo_island import gwo_island_schedule
+            result, makespan, _ = gwo_island_schedule(
+                jobs=self.jobs,
+                m=len(self.machines),
+                n_islands=self.n_islands,
+                pop_size=self.pop_size,
+                iters=self.iters,
+                local_search=self.local_search,
+                warm_start=self.warm_start,
+                times=times,
+                **self.options
+            )
+        else:
+            result, makespan, _ = gwo_schedule(
+                jobs=self.jobs,
+                m=len(self.machines),
+                pop_size=self.pop_size,
+                iters=self.iters,
+                local_search=self.local_search,
+                warm_start=self.warm_start,
+                times=times,
+                **self.options
+            )
+        result.machine_ids = [machine.machine_id for machine in self.machines]
+        self.best_schedule = result
         self.best_score = makespan
-        return schedule, makespan, info
+        return result
 
     def evaluate(self, schedule):
         """Đánh giá kết quả lập lịch"""
-        s = Schedule(self.machines, self.jobs)
-        return s.evaluate()
+        return schedule.evaluate()
 
 
 # ==========================
@@ -209,9 +198,9 @@ if __name__ == "__main__":
 
     print("Danh sách job:", jobs)
     gwo = GWOScheduler(jobs, [Machine(i) for i in range(m)], pop_size=25, iters=100)
-    schedule, best, info = gwo.schedule()
+    schedule = gwo.schedule()
 
     print("\n--- KẾT QUẢ ---")
-    print("Best makespan:", best)
-    print("Lịch phân công:", schedule)
-    print("Thời gian chạy (s):", round(info["runtime"], 3))
+    print("Best makespan:", schedule.makespan)
+    print("Lịch phân công:", schedule.assignment())
+    print("Thời gian chạy (s):", round(schedule.info["runtime"], 3))
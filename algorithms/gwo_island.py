@@ -0,0 +1,33 @@
+# ==========================
+#  GWO MÔ HÌNH ĐẢO (ISLAND MODEL)
+#  Description: Chạy nhiều quần thể GWO song song trên nhiều tiến trình (mỗi
+#  tiến trình một "đảo"). Sau mỗi migration_interval vòng lặp, các đảo gửi
+#  alpha/beta/delta của mình sang đảo kế tiếp theo vòng tròn, thay cho những
+#  con sói kém nhất ở đó.
+#  - Khung đảo dùng chung cho mọi thuật toán quần thể: algorithms/island.py
+# ==========================
+
+from algorithms.gwo import _GWO
+from algorithms.island import island_schedule
+
+
+def gwo_island_schedule(jobs, m, n_islands=4, migration_interval=10, migration_size=1,
+                        pop_size=30, iters=100, **options):
+    """
+    GWO nhiều đảo chạy song song (island_schedule với GWO)
+    jobs, m, pop_size, iters: giống gwo_schedule (pop_size là số sói MỖI đảo)
+    n_islands, migration_interval: xem island_schedule
+    migration_size: số leader (1..3: alpha, beta, delta) mỗi đảo gửi đi
+    options: lb, ub, seed, max_workers, verbose, cache_size, local_search, warm_start,
+             times, time_budget, stagnation (xem island_schedule)
+    Trả về (giống gwo_schedule):
+        best_schedule (ScheduleResult), best_makespan, info(dict)
+        info["best_history"]: makespan tốt nhất trên mọi đảo sau mỗi vòng lặp
+        info["island_history"]: lịch sử alpha của từng đảo
+    """
+    best_schedule, best_makespan, info = island_schedule(
+        _GWO, jobs, m, n_islands, migration_interval, migration_size, pop_size, iters,
+        **options)
+    if "best_position" in info:
+        info["alpha"] = info["best_position"]
+    return best_schedule, best_makespan, info
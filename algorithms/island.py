@@ -0,0 +1,205 @@
+# ==========================
+#  MÔ HÌNH ĐẢO (ISLAND MODEL) CHO MỌI THUẬT TOÁN QUẦN THỂ
+#  Description: Chạy nhiều quần thể của cùng một PopulationOptimizer (GWO, PSO,
+#  WOA...) song song trên nhiều tiến trình (mỗi tiến trình một "đảo"). Sau mỗi
+#  migration_interval vòng lặp, các đảo gửi các leader của mình sang đảo kế tiếp
+#  theo vòng tròn, thay cho những cá thể kém nhất ở đó.
+# ==========================
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+
+import numpy as np
+
+from Core.processing_times import resolve_times
+from algorithms.population import (_prepare_jobs, _job_table, _schedule_result,
+                                   _init_population, _evolve, _stopping_rule, decode_position,
+                                   FitnessCache, warm_start_positions, makespan_lower_bound)
+from algorithms.local_search import improve_assignment
+
+
+def _island_epoch(args):
+    """
+    Chạy một chặng (t_start..t_end) cho một đảo
+    Hàm cấp module để có thể gửi sang tiến trình con (pickle, kèm optimizer)
+    budget: số giây tối đa của chặng (None => chạy đủ vòng); dừng sớm cả khi chạm cận dưới
+    """
+    (optimizer, state, rng, cache, ptimes, m, t_start, t_end, iters, lb, ub, times,
+     lower_bound, budget) = args
+    stop = _stopping_rule(lower_bound, budget)
+    history = _evolve(optimizer, state, ptimes, m, t_start, t_end, iters, lb, ub, rng,
+                      cache=cache, stop=stop, times=times)
+    state.pop("stop_reason", None)
+    return state, rng, cache, history
+
+
+def _migrate(optimizer, states, migration_size):
+    """
+    Trao đổi theo vòng tròn: đảo i nhận migration_size leader tốt nhất của đảo i-1,
+    thay cho các cá thể kém nhất của mình (optimizer.migrate), rồi chọn lại leader
+    """
+    migrants = [(s["leaders"][:migration_size].copy(),
+                 s["leader_scores"][:migration_size].copy()) for s in states]
+    for i, state in enumerate(states):
+        positions, scores = migrants[i - 1]
+        worst = np.argsort(state["fitness"], kind="stable")[-migration_size:]
+        optimizer.migrate(state, worst, positions, scores)
+
+
+def island_schedule(optimizer,
+                    jobs,
+                    m,
+                    n_islands=4,
+                    migration_interval=10,
+                    migration_size=1,
+                    pop_size=30,
+                    iters=100,
+                    lb=0.0,
+                    ub=1.0,
+                    seed=None,
+                    max_workers=None,
+                    verbose=False,
+                    cache_size=0,
+                    local_search=False,
+                    warm_start=None,
+                    times=None,
+                    time_budget=None,
+                    stagnation=None):
+    """
+    Nhiều đảo của optimizer chạy song song
+    jobs, m, pop_size, iters, lb, ub, seed: giống population_schedule (pop_size là MỖI đảo)
+    n_islands: số quần thể độc lập
+    migration_interval: số vòng lặp giữa hai lần trao đổi
+    migration_size: số leader mỗi đảo gửi đi (1..optimizer.n_leaders)
+    max_workers: số tiến trình (mặc định = n_islands; 0 => chạy tuần tự trong tiến trình hiện tại)
+    cache_size: > 0 => mỗi đảo có cache LRU fitness riêng
+    local_search: True => cải thiện lịch tốt nhất bằng move/swap trước khi trả về
+    warm_start: lời giải gieo sẵn (xem warm_start_positions), gieo vào mọi đảo
+    times: ProcessingTimes khi máy không giống nhau
+    time_budget: số giây tối đa (tính cả khởi tạo); phần còn lại chia đều cho các chặng
+                 chưa chạy, mỗi đảo dừng chặng của mình khi hết phần được chia
+    stagnation: dừng khi điểm tốt nhất trên mọi đảo không cải thiện sau ngần này vòng
+                (chỉ kiểm tra giữa các chặng => có thể chạy quá tối đa migration_interval vòng)
+    Trả về (giống population_schedule):
+        best_schedule (ScheduleResult), best_makespan, info(dict)
+        info["best_history"]: makespan tốt nhất trên mọi đảo sau mỗi vòng lặp
+        info["island_history"]: lịch sử điểm tốt nhất của từng đảo
+    """
+    started = time.perf_counter()
+    n_jobs = len(jobs)
+    if n_jobs == 0:
+        info = {"runtime": 0.0, "best_history": []}
+        return _schedule_result(_job_table(jobs), [[] for _ in range(m)], info=info), 0.0, info
+    if not 1 <= migration_size <= optimizer.n_leaders:
+        raise ValueError(f"migration_size phải nằm trong khoảng 1..{optimizer.n_leaders} "
+                         f"({optimizer.name} giữ {optimizer.n_leaders} leader)")
+    migration_interval = max(1, migration_interval)
+
+    job_ids, ptimes = _prepare_jobs(jobs)
+    times = resolve_times(times)
+    if times is not None:
+        times.validate(n_jobs, m)
+        if local_search:
+            raise ValueError("local_search chỉ hỗ trợ máy giống nhau")
+
+    # Mỗi đảo có luồng số ngẫu nhiên độc lập, tái lập được từ seed
+    # (seed có thể là SeedSequence, vd: luồng con do batch_solve cấp)
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    rngs = [np.random.default_rng(s) for s in seed_seq.spawn(n_islands)]
+    caches = [FitnessCache(cache_size) if cache_size > 0 else None for _ in range(n_islands)]
+    initial = warm_start_positions(warm_start, jobs, lb, ub) if warm_start else None
+    states = [_init_population(optimizer, ptimes, m, pop_size, lb, ub, rng, cache, initial,
+                               times)
+              for rng, cache in zip(rngs, caches)]
+    island_history = [[float(s["leader_scores"][0])] for s in states]
+    best_history = [min(history[0] for history in island_history)]
+    lower_bound = makespan_lower_bound(ptimes, m, times)
+    stop = _stopping_rule(lower_bound, time_budget, stagnation, started)
+    stop_reason = stop(best_history[0]) or "iterations"
+    deadline = None if time_budget is None else started + time_budget
+
+    if max_workers is None:
+        max_workers = n_islands
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+    start = time.perf_counter()
+    label = f"{optimizer.name.upper()}-Island"
+
+    try:
+        epochs = range(0, iters, migration_interval) if stop_reason == "iterations" else []
+        for k, t_start in enumerate(epochs):
+            t_end = min(iters, t_start + migration_interval)
+            budget = (None if deadline is None
+                      else max(0.0, deadline - time.perf_counter()) / (len(epochs) - k))
+            tasks = [(optimizer, state, rng, cache, ptimes, m, t_start, t_end, iters, lb, ub,
+                      times, lower_bound, budget)
+                     for state, rng, cache in zip(states, rngs, caches)]
+            if executor is not None:
+                results = list(executor.map(_island_epoch, tasks))
+            else:
+                results = [_island_epoch(task) for task in tasks]
+
+            states = [state for state, _, _, _ in results]
+            rngs = [rng for _, rng, _, _ in results]
+            caches = [cache for _, _, cache, _ in results]
+            # Đảo dừng sớm (hết phần thời gian) giữ điểm cuối cho các vòng còn lại của chặng
+            histories = [history for _, _, _, history in results]
+            last = [h[-1] for h in island_history]
+            for i, history in enumerate(histories):
+                island_history[i] += history
+            epoch_best = [min(value if value is not None else last[i]
+                              for i, value in enumerate(values))
+                          for values in zip_longest(*histories)]
+            best_history += epoch_best
+
+            for score in epoch_best:
+                stop_reason = stop(score) or "iterations"
+                if stop_reason != "iterations":
+                    break
+            if stop_reason == "iterations" and deadline is not None \
+                    and time.perf_counter() >= deadline:
+                stop_reason = "time_budget"
+
+            if verbose:
+                print(f"[{label}] Iter {t_start + len(epoch_best)}/{iters} - "
+                      f"Best makespan: {best_history[-1]:.4f}")
+            if stop_reason != "iterations":
+                break
+            if t_end < iters:
+                _migrate(optimizer, states, migration_size)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    best_island = min(range(n_islands), key=lambda i: states[i]["leader_scores"][0])
+    best_schedule, best_makespan = decode_position(
+        states[best_island]["leaders"][0].tolist(), jobs, m, times)
+    if local_search:
+        best_schedule, best_makespan, ls_info = improve_assignment(
+            best_schedule, dict(zip(job_ids, ptimes)))
+    runtime = time.perf_counter() - start
+
+    evaluations = pop_size * sum(len(history) for history in island_history)
+    info = {"runtime": runtime, "best_history": best_history,
+            "island_history": island_history,
+            "evaluations": evaluations,
+            "iterations": len(best_history) - 1, "stop_reason": stop_reason,
+            "best_position": states[best_island]["leaders"][0].copy(),
+            "evals_per_sec": evaluations / runtime if runtime > 0 else float("inf"),
+            "params": dict(optimizer.params(), algorithm=f"{optimizer.name}_island",
+                           pop_size=pop_size, iters=iters, n_islands=n_islands,
+                           migration_interval=migration_interval,
+                           migration_size=migration_size,
+                           time_budget=time_budget, stagnation=stagnation,
+                           warm_start=0 if initial is None else len(initial),
+                           machines="identical" if times is None else times.kind)}
+    if local_search:
+        info["local_search"] = ls_info
+    if cache_size > 0:
+        info["cache"] = {
+            "hits": sum(c.hits for c in caches),
+            "misses": sum(c.misses for c in caches),
+            "size": sum(c.stats()["size"] for c in caches),
+            "maxsize": cache_size * n_islands,
+        }
+    return _schedule_result(_job_table(jobs), best_schedule, times, info), best_makespan, info
@@ -0,0 +1,188 @@
+# ==========================
+#  TÌM KIẾM CỤC BỘ (LOCAL SEARCH) HẬU XỬ LÝ
+#  Description: Cải thiện một phân công có sẵn (đầu ra của decode_position
+#  hoặc một Schedule) bằng cách chuyển (move) hoặc đổi chỗ (swap) job giữa
+#  máy tải nặng nhất và các máy khác.
+#  - Tải từng máy giữ trong heap min/max (xóa lười) => lấy máy nặng/nhẹ nhất O(log m)
+#  - Thời gian job trên mỗi máy giữ trong list đã sắp xếp => tìm job phù hợp
+#    bằng bisect, đánh giá mỗi move/swap O(1) chỉ từ tải hai máy
+# ==========================
+
+import bisect
+import heapq
+
+import numpy as np
+
+from Core.machine import Machine
+from Core.processing_times import resolve_times
+from Core.schedule import Schedule
+from Core.schedule_result import ScheduleResult
+
+
+class _LoadIndex:
+    """Tải các máy + heap min/max với xóa lười (entry cũ bị bỏ qua khi pop)"""
+
+    def __init__(self, loads):
+        self.loads = list(loads)
+        self._min = [(load, k) for k, load in enumerate(self.loads)]
+        self._max = [(-load, k) for k, load in enumerate(self.loads)]
+        heapq.heapify(self._min)
+        heapq.heapify(self._max)
+
+    def update(self, k, load):
+        self.loads[k] = load
+        heapq.heappush(self._min, (load, k))
+        heapq.heappush(self._max, (-load, k))
+
+    def argmin(self):
+        while self._min[0][0] != self.loads[self._min[0][1]]:
+            heapq.heappop(self._min)
+        return self._min[0][1]
+
+    def argmax(self):
+        while -self._max[0][0] != self.loads[self._max[0][1]]:
+            heapq.heappop(self._max)
+        return self._max[0][1]
+
+
+def _closest(sorted_items, target):
+    """Các phần tử (ptime, thứ tự, job) trong sorted_items có ptime gần target nhất"""
+    i = bisect.bisect_left(sorted_items, (target,))
+    return sorted_items[max(0, i - 1):i + 1]
+
+
+def _best_move(items_max, load_max, load_min):
+    """Chọn job trên máy nặng nhất để chuyển sang máy nhẹ nhất (p gần (gap/2) nhất)"""
+    gap = load_max - load_min
+    best, best_peak = None, load_max
+    for item in _closest(items_max, gap / 2):
+        p = item[0]
+        peak = max(load_max - p, load_min + p)
+        if 0 < p < gap and peak < best_peak:
+            best, best_peak = item, peak
+    return best
+
+
+def _best_swap(items_max, items_k, load_max, load_k):
+    """Chọn cặp (a trên máy nặng nhất, b trên máy k) với 0 < p_a - p_b < gap, gần gap/2 nhất"""
+    gap = load_max - load_k
+    best, best_peak = None, load_max
+    last_p = None
+    for a in items_max:
+        if a[0] == last_p:
+            continue  # cùng thời gian xử lý => cùng kết quả
+        last_p = a[0]
+        for b in _closest(items_k, a[0] - gap / 2):
+            delta = a[0] - b[0]
+            peak = max(load_max - delta, load_k + delta)
+            if 0 < delta < gap and peak < best_peak:
+                best, best_peak = (a, b), peak
+    return best
+
+
+def improve_assignment(machine_jobs, ptimes, max_iters=10000):
+    """
+    Cải thiện makespan của một phân công job -> máy (máy giống nhau)
+    machine_jobs: list các list job id theo từng máy (vd: đầu ra decode_position)
+    ptimes: thời gian xử lý tra theo job id (dict hoặc list/mảng đánh chỉ số bằng id)
+    max_iters: số bước cải thiện tối đa
+    Mỗi bước chỉ nhận move/swap làm giảm tải máy nặng nhất mà không tạo máy
+    nặng hơn => luôn dừng
+    Trả về: (machine_jobs_mới, makespan, info)
+        Job giữ nguyên thứ tự cũ trên máy của nó, job được chuyển tới nối vào cuối
+    """
+    m = len(machine_jobs)
+    seq = 0
+    items = []  # mỗi máy: list (ptime, thứ tự, job) đã sắp xếp
+    for jobs_on_machine in machine_jobs:
+        machine_items = []
+        for job_id in jobs_on_machine:
+            machine_items.append((float(ptimes[job_id]), seq, job_id))
+            seq += 1
+        machine_items.sort()
+        items.append(machine_items)
+
+    index = _LoadIndex(sum(item[0] for item in machine_items) for machine_items in items)
+    initial_makespan = max(index.loads) if m else 0.0
+    moves = swaps = 0
+
+    def transfer(item, src, dst):
+        nonlocal seq
+        items[src].remove(item)
+        # thứ tự mới lớn hơn mọi job cũ => nối vào cuối máy đích
+        bisect.insort(items[dst], (item[0], seq, item[2]))
+        seq += 1
+
+    for _ in range(max_iters if m > 1 else 0):
+        k_max, k_min = index.argmax(), index.argmin()
+        load_max = index.loads[k_max]
+
+        item = _best_move(items[k_max], load_max, index.loads[k_min])
+        if item is not None:
+            transfer(item, k_max, k_min)
+            index.update(k_max, load_max - item[0])
+            index.update(k_min, index.loads[k_min] + item[0])
+            moves += 1
+            continue
+
+        # Không chuyển được => thử đổi chỗ với các máy khác, máy nhẹ trước
+        swap = None
+        for k in sorted(range(m), key=lambda x: index.loads[x]):
+            if k == k_max:
+                continue
+            swap = _best_swap(items[k_max], items[k], load_max, index.loads[k])
+            if swap is not None:
+                break
+        if swap is None:
+            break
+
+        a, b = swap
+        delta = a[0] - b[0]
+        transfer(a, k_max, k)
+        transfer(b, k, k_max)
+        index.update(k_max, load_max - delta)
+        index.update(k, index.loads[k] + delta)
+        swaps += 1
+
+    result = [[job_id for _, _, job_id in sorted(machine_items, key=lambda x: x[1])]
+              for machine_items in items]
+    makespan = max(index.loads) if m else 0.0
+    info = {"initial_makespan": initial_makespan, "moves": moves, "swaps": swaps}
+    return result, makespan, info
+
+
+def improve_schedule(schedule, max_iters=10000):
+    """
+    Cải thiện một lịch (vd: kết quả GreedyScheduler) theo makespan
+    Trả về lịch mới cùng kiểu (ScheduleResult hoặc Schedule):
+    các job trên mỗi máy chạy liên tiếp từ thời điểm 0
+    Chỉ hỗ trợ máy giống nhau (giống local_search của gwo_schedule): lịch có job chạy
+    khác thời gian xử lý của nó (máy khác tốc độ / unrelated) bị từ chối
+    """
+    if isinstance(schedule, ScheduleResult):
+        # Job là chỉ số dòng của bảng kết quả => tra thời gian thẳng trên cột durations
+        table = schedule.table
+        if not np.allclose(table.finish_times - table.start_times, table.durations):
+            raise ValueError("improve_schedule chỉ hỗ trợ máy giống nhau")
+        machine_rows = [list(range(lo, hi)) for lo, hi in
+                        zip(schedule.bounds[:-1].tolist(), schedule.bounds[1:].tolist())]
+        improved, _, _ = improve_assignment(machine_rows, table.durations, max_iters)
+        result = ScheduleResult.from_rows(table, improved, machine_ids=schedule.machine_ids,
+                                          info=schedule.info)
+        result.rows = schedule.rows[result.rows]  # về lại chỉ số của bảng job đầu vào
+        return result
+
+    if resolve_times(None, schedule.machines) is not None or any(
+            finish - start != job.duration
+            for machine in schedule.machines for job, start, finish in machine.schedule):
+        raise ValueError("improve_schedule chỉ hỗ trợ máy giống nhau")
+    machine_jobs = [[job for job, _, _ in machine.schedule] for machine in schedule.machines]
+    ptimes = {job: job.duration for jobs_on_machine in machine_jobs for job in jobs_on_machine}
+    improved, _, _ = improve_assignment(machine_jobs, ptimes, max_iters)
+
+    machines = []
+    for machine, jobs_on_machine in zip(schedule.machines, improved):
+        new_machine = Machine(machine.machine_id, machine.speed)
+        new_machine.assign_many(jobs_on_machine)
+        machines.append(new_machine)
+    return Schedule(machines, schedule.jobs)
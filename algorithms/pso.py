@@ -0,0 +1,97 @@
+# ==========================
+#  PARTICLE SWARM OPTIMIZATION (PSO)
+#  Description: Tối ưu bầy đàn cho bài toán phân công N job cho M máy,
+#  chạy trên khung chung algorithms/population.py (cùng mã hóa random-key,
+#  giải mã theo lô, cache, luật dừng, warm start... như GWO)
+#  - Vận tốc cả bầy là một mảng (pop_size, n_jobs), cập nhật bằng phép toán mảng
+# ==========================
+
+import numpy as np
+
+from algorithms.population import PopulationOptimizer, population_schedule, population_iterate
+from algorithms.island import island_schedule
+
+
+class PSO(PopulationOptimizer):
+    """
+    v = w v + c1 r1 (pbest - x) + c2 r2 (gbest - x);  x = x + v
+    inertia: (w đầu, w cuối) - giảm tuyến tính theo vòng lặp
+    v_max: giới hạn |v| theo tỉ lệ của (ub - lb)
+    Mỗi hạt nhớ vị trí tốt nhất của riêng nó (pbest); gbest là leader của khung
+    """
+
+    name = "pso"
+    n_leaders = 1
+
+    def __init__(self, inertia=(0.9, 0.4), c1=1.5, c2=1.5, v_max=0.2):
+        self.inertia = inertia
+        self.c1 = c1
+        self.c2 = c2
+        self.v_max = v_max
+
+    def init(self, state, rng, lb, ub):
+        state["velocities"] = np.zeros_like(state["positions"])
+        state["best_positions"] = state["positions"].copy()
+        state["best_fitness"] = state["fitness"].copy()
+
+    def update(self, state, t, iters, lb, ub, rng):
+        positions, velocities = state["positions"], state["velocities"]
+        w_start, w_end = self.inertia
+        w = w_start + (w_end - w_start) * t / max(1, iters - 1)
+        r1 = rng.random(positions.shape)
+        r2 = rng.random(positions.shape)
+        velocities = (w * velocities
+                      + self.c1 * r1 * (state["best_positions"] - positions)
+                      + self.c2 * r2 * (state["leaders"][0] - positions))
+        limit = self.v_max * (ub - lb)
+        np.clip(velocities, -limit, limit, out=velocities)
+        state["velocities"] = velocities
+        return np.clip(positions + velocities, lb, ub)
+
+    def accept(self, state, positions, fitness_vals):
+        super().accept(state, positions, fitness_vals)
+        improved = fitness_vals < state["best_fitness"]
+        state["best_positions"][improved] = positions[improved]
+        state["best_fitness"][improved] = fitness_vals[improved]
+
+    def migrate(self, state, slots, positions, fitness_vals):
+        # Hạt nhập cư bắt đầu lại: pbest là chính nó, vận tốc 0
+        super().migrate(state, slots, positions, fitness_vals)
+        state["velocities"][slots] = 0.0
+        state["best_positions"][slots] = positions
+        state["best_fitness"][slots] = fitness_vals
+
+    def params(self):
+        return {"inertia": list(self.inertia), "c1": self.c1, "c2": self.c2,
+                "v_max": self.v_max}
+
+
+def pso_schedule(jobs, m, pop_size=30, iters=100, inertia=(0.9, 0.4), c1=1.5, c2=1.5,
+                 v_max=0.2, **options):
+    """
+    PSO tối ưu makespan
+    inertia, c1, c2, v_max: xem PSO
+    options: lb, ub, seed, verbose, cache_size, local_search, time_budget, stagnation,
+             warm_start, callback, times (giống gwo_schedule / population_schedule)
+    Trả về: best_schedule, best_makespan, info(dict)
+    """
+    return population_schedule(PSO(inertia, c1, c2, v_max), jobs, m, pop_size, iters,
+                               **options)
+
+
+def pso_iterate(jobs, m, pop_size=30, iters=100, inertia=(0.9, 0.4), c1=1.5, c2=1.5,
+                v_max=0.2, **options):
+    """Dạng generator của pso_schedule (xem population_iterate)"""
+    return population_iterate(PSO(inertia, c1, c2, v_max), jobs, m, pop_size, iters,
+                              **options)
+
+
+def pso_island_schedule(jobs, m, n_islands=4, migration_interval=10, pop_size=30, iters=100,
+                        inertia=(0.9, 0.4), c1=1.5, c2=1.5, v_max=0.2, **options):
+    """
+    PSO nhiều đảo (xem island_schedule): mỗi đảo gửi gbest của mình sang đảo kế tiếp
+    options: lb, ub, seed, max_workers, verbose, cache_size, local_search, warm_start, times,
+             time_budget, stagnation
+    """
+    return island_schedule(PSO(inertia, c1, c2, v_max), jobs, m, n_islands,
+                           migration_interval, 1, pop_size, iters, **options)
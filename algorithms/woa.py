@@ -0,0 +1,77 @@
+# ==========================
+#  WHALE OPTIMIZATION ALGORITHM (WOA)
+#  Description: Thuật toán tối ưu cá voi cho bài toán phân công N job cho M máy,
+#  chạy trên khung chung algorithms/population.py
+#  - Mỗi con cá voi chọn một trong ba hành vi (vây mồi / tìm kiếm / xoắn ốc),
+#    cả đàn được cập nhật trong một lần bằng np.where thay vì lặp từng con
+# ==========================
+
+import numpy as np
+
+from algorithms.population import PopulationOptimizer, population_schedule, population_iterate
+from algorithms.island import island_schedule
+
+
+class WOA(PopulationOptimizer):
+    """
+    a giảm tuyến tính 2 -> 0, A = 2 a r - a, C = 2 r, với xác suất 1/2:
+      - |A| < 1: vây mồi quanh con tốt nhất       X = X* - A |C X* - X|
+      - |A| >= 1: tìm kiếm quanh một con ngẫu nhiên X = X_r - A |C X_r - X|
+      - còn lại: bơi xoắn ốc về con tốt nhất       X = |X* - X| e^(b l) cos(2 pi l) + X*
+    spiral: hằng số b của đường xoắn ốc logarit
+    """
+
+    name = "woa"
+    n_leaders = 1
+
+    def __init__(self, spiral=1.0):
+        self.spiral = spiral
+
+    def update(self, state, t, iters, lb, ub, rng):
+        positions = state["positions"]
+        best = state["leaders"][0]
+        pop_size, n_jobs = positions.shape
+        a = 2 - 2 * t / iters
+
+        A = 2 * a * rng.random((pop_size, 1)) - a  # một hệ số cho mỗi con
+        C = 2 * rng.random((pop_size, n_jobs))
+        spiral_move = rng.random((pop_size, 1)) >= 0.5
+        l = rng.uniform(-1.0, 1.0, (pop_size, 1))
+        others = positions[rng.integers(pop_size, size=pop_size)]
+
+        target = np.where(np.abs(A) < 1, best, others)
+        encircle = target - A * np.abs(C * target - positions)
+        spiral = np.abs(best - positions) * np.exp(self.spiral * l) * np.cos(2 * np.pi * l) + best
+        new_positions = np.where(spiral_move, spiral, encircle)
+        np.clip(new_positions, lb, ub, out=new_positions)
+        return new_positions
+
+    def params(self):
+        return {"spiral": self.spiral}
+
+
+def woa_schedule(jobs, m, pop_size=30, iters=100, spiral=1.0, **options):
+    """
+    WOA tối ưu makespan
+    spiral: xem WOA
+    options: lb, ub, seed, verbose, cache_size, local_search, time_budget, stagnation,
+             warm_start, callback, times (giống gwo_schedule / population_schedule)
+    Trả về: best_schedule, best_makespan, info(dict)
+    """
+    return population_schedule(WOA(spiral), jobs, m, pop_size, iters, **options)
+
+
+def woa_iterate(jobs, m, pop_size=30, iters=100, spiral=1.0, **options):
+    """Dạng generator của woa_schedule (xem population_iterate)"""
+    return population_iterate(WOA(spiral), jobs, m, pop_size, iters, **options)
+
+
+def woa_island_schedule(jobs, m, n_islands=4, migration_interval=10, pop_size=30, iters=100,
+                        spiral=1.0, **options):
+    """
+    WOA nhiều đảo (xem island_schedule): mỗi đảo gửi con tốt nhất sang đảo kế tiếp
+    options: lb, ub, seed, max_workers, verbose, cache_size, local_search, warm_start, times,
+             time_budget, stagnation
+    """
+    return island_schedule(WOA(spiral), jobs, m, n_islands, migration_interval, 1, pop_size,
+                           iters, **options)
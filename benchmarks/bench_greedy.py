@@ -0,0 +1,38 @@
+# ==========================
+#  BENCHMARK: GreedyScheduler (heap, không deepcopy) vs bản gốc (deepcopy + min)
+#  Chạy: python -m benchmarks.bench_greedy
+# ==========================
+
+import time
+
+from Core.machine import Machine
+from algorithms.greedy import GreedyScheduler
+from benchmarks._reference import greedy_schedule_deepcopy
+from utils.data_generator import DataGenerator
+
+
+SIZES = [(1000, 10), (10000, 100), (100000, 500)]
+STRATEGIES = ["SPT", "EDD", "FCFS"]
+SEED = 1
+
+
+def main():
+    print(f"{'n_jobs':>8} {'m':>4} {'strategy':>8} {'gốc (s)':>10} {'heap (s)':>10} {'speedup':>8}")
+    for n_jobs, m in SIZES:
+        jobs = DataGenerator.generate_jobs(n_jobs, seed=SEED)
+        machines = [Machine(i) for i in range(m)]
+        for strategy in STRATEGIES:
+            start = time.perf_counter()
+            ref = greedy_schedule_deepcopy(jobs, machines, strategy)
+            t_ref = time.perf_counter() - start
+
+            start = time.perf_counter()
+            new = GreedyScheduler(jobs, machines, strategy=strategy).schedule()
+            t_new = time.perf_counter() - start
+
+            assert ref.get_schedule_summary() == new.get_schedule_summary()
+            print(f"{n_jobs:>8} {m:>4} {strategy:>8} {t_ref:>10.3f} {t_new:>10.3f} {t_ref / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# ==========================
+#  BENCHMARK: GWO vector hóa (NumPy) vs vòng lặp Python gốc
+#  Chạy: python -m benchmarks.bench_gwo
+# ==========================
+
+import random
+import time
+
+import numpy as np
+
+from algorithms.gwo import gwo_schedule, _update_positions
+from algorithms.population import _prepare_jobs, decode_population
+from benchmarks._reference import gwo_schedule_loop, update_positions_loop, decode_position_loop
+
+
+SIZES = [(100, 5), (500, 10), (2000, 20)]
+UPDATE_SIZES = [100, 1000, 2000, 10000]
+DECODE_SIZES = [(100, 5), (1000, 20), (2000, 50), (10000, 100)]
+POP_SIZE = 30
+ITERS = 10
+SEED = 1
+
+
+def _run(func, jobs, m):
+    start = time.perf_counter()
+    _, makespan, _ = func(jobs, m, pop_size=POP_SIZE, iters=ITERS, seed=SEED)
+    return time.perf_counter() - start, makespan
+
+
+def bench_update():
+    """Chỉ đo bước cập nhật vị trí của một vòng lặp (không tính fitness)"""
+    print(f"\n[Cập nhật vị trí, 1 vòng lặp] pop_size={POP_SIZE}")
+    print(f"{'n_jobs':>8} {'loop (s)':>10} {'numpy (s)':>10} {'speedup':>8}")
+    rng = np.random.default_rng(SEED)
+    for n_jobs in UPDATE_SIZES:
+        wolves = rng.random((POP_SIZE, n_jobs))
+        leaders = rng.random((3, n_jobs))
+
+        start = time.perf_counter()
+        update_positions_loop(wolves.tolist(), *leaders.tolist(), a=1.0)
+        t_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _update_positions(wolves, leaders, 1.0, 0.0, 1.0, rng)
+        t_np = time.perf_counter() - start
+        print(f"{n_jobs:>8} {t_loop:>10.4f} {t_np:>10.4f} {t_loop / t_np:>7.1f}x")
+
+
+def bench_decode():
+    """Đo giải mã fitness cả quần thể: từng con sói (gốc) vs giải mã theo lô"""
+    print(f"\n[Giải mã fitness cả đàn] pop_size={POP_SIZE}")
+    print(f"{'n_jobs':>8} {'m':>4} {'loop (s)':>10} {'batch (s)':>10} {'speedup':>8}")
+    rng = np.random.default_rng(SEED)
+    for n_jobs, m in DECODE_SIZES:
+        jobs = rng.integers(1, 100, n_jobs).tolist()
+        wolves = rng.random((POP_SIZE, n_jobs))
+
+        start = time.perf_counter()
+        ms_loop = [decode_position_loop(w, jobs, m)[1] for w in wolves.tolist()]
+        t_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, ptimes = _prepare_jobs(jobs)
+        ms_batch = decode_population(wolves, ptimes, m)
+        t_batch = time.perf_counter() - start
+
+        assert ms_loop == ms_batch.tolist()
+        print(f"{n_jobs:>8} {m:>4} {t_loop:>10.4f} {t_batch:>10.4f} {t_loop / t_batch:>7.1f}x")
+
+
+def bench_full():
+    """Đo toàn bộ gwo_schedule (gồm cả giải mã fitness)"""
+    print(f"\n[Toàn bộ gwo_schedule] pop_size={POP_SIZE}, iters={ITERS}")
+    print(f"{'n_jobs':>8} {'m':>4} {'loop (s)':>10} {'numpy (s)':>10} {'speedup':>8} "
+          f"{'ms loop':>10} {'ms numpy':>10}")
+    for n_jobs, m in SIZES:
+        rnd = random.Random(SEED)
+        jobs = [rnd.randint(1, 100) for _ in range(n_jobs)]
+        t_loop, ms_loop = _run(gwo_schedule_loop, jobs, m)
+        t_np, ms_np = _run(gwo_schedule, jobs, m)
+        print(f"{n_jobs:>8} {m:>4} {t_loop:>10.3f} {t_np:>10.3f} {t_loop / t_np:>7.1f}x "
+              f"{ms_loop:>10.1f} {ms_np:>10.1f}")
+
+
+def main():
+    bench_update()
+    bench_decode()
+    bench_full()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# ==========================
+#  BENCHMARK: GWO mô hình đảo - số lượt đánh giá/giây theo số đảo
+#  Chạy: python -m benchmarks.bench_island
+# ==========================
+
+import os
+import random
+
+from algorithms.gwo import gwo_schedule
+from algorithms.gwo_island import gwo_island_schedule
+
+
+N_JOBS, M = 2000, 20
+POP_SIZE = 30
+ITERS = 40
+SEED = 1
+
+
+def main():
+    rnd = random.Random(SEED)
+    jobs = [rnd.randint(1, 100) for _ in range(N_JOBS)]
+    lower_bound = max(sum(jobs) / M, max(jobs))
+    print(f"n_jobs={N_JOBS}, m={M}, pop_size={POP_SIZE}/đảo, iters={ITERS}, cpu={os.cpu_count()}")
+    print(f"lower bound = {lower_bound:.1f}")
+
+    _, makespan, info = gwo_schedule(jobs, M, pop_size=POP_SIZE, iters=ITERS, seed=SEED)
+    base_rate = info["evaluations"] / info["runtime"]
+    print(f"{'islands':>8} {'runtime (s)':>12} {'evals/s':>10} {'scaling':>8} {'makespan':>10}")
+    print(f"{'gwo':>8} {info['runtime']:>12.3f} {base_rate:>10.0f} {1.0:>7.2f}x {makespan:>10.1f}")
+
+    n = 1
+    while n <= (os.cpu_count() or 1):
+        _, makespan, info = gwo_island_schedule(jobs, M, n_islands=n, migration_interval=10,
+                                                pop_size=POP_SIZE, iters=ITERS, seed=SEED)
+        rate = info["evals_per_sec"]
+        print(f"{n:>8} {info['runtime']:>12.3f} {rate:>10.0f} {rate / base_rate:>7.2f}x {makespan:>10.1f}")
+        n *= 2
+
+
+if __name__ == "__main__":
+    main()
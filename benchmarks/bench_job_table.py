@@ -0,0 +1,72 @@
+# ==========================
+#  BENCHMARK: bộ nhớ + tốc độ - list Job (dict / __slots__) vs JobTable dạng cột
+#  Chạy: python -m benchmarks.bench_job_table
+# ==========================
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from Core.job import Job
+from Core.job_table import JobTable
+from Core.machine import Machine
+from algorithms.greedy import GreedyScheduler
+from benchmarks._reference import LegacyJob
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+N_MACHINES = 100
+SEED = 1
+
+
+def _columns(n_jobs):
+    rng = np.random.default_rng(SEED)
+    return (np.arange(1, n_jobs + 1), rng.integers(1, 21, n_jobs),
+            rng.integers(5, 51, n_jobs), rng.integers(1, 6, n_jobs))
+
+
+def _measure(build):
+    """Trả về (đối tượng, bộ nhớ cấp phát MB, thời gian tạo s)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current / 2 ** 20, elapsed
+
+
+def _solve(jobs):
+    start = time.perf_counter()
+    schedule = GreedyScheduler(jobs, [Machine(i) for i in range(N_MACHINES)], "SPT").schedule()
+    metrics = schedule.evaluate()
+    return time.perf_counter() - start, metrics["makespan"]
+
+
+def main():
+    print(f"{'n_jobs':>9} {'kiểu':>10} {'MB':>9} {'tạo (s)':>9} {'SPT+eval (s)':>13} {'jobs/s':>11}")
+    for n_jobs in SIZES:
+        ids, durations, deadlines, priorities = _columns(n_jobs)
+        lists = [ids.tolist(), durations.tolist(), deadlines.tolist(), priorities.tolist()]
+
+        builders = [
+            ("dict Job", lambda: [LegacyJob(*row) for row in zip(*lists)]),
+            ("slots Job", lambda: [Job(*row) for row in zip(*lists)]),
+            ("JobTable", lambda: JobTable(ids.copy(), durations, deadlines, priorities.copy())),
+        ]
+        makespans = set()
+        for name, build in builders:
+            jobs, mem, t_build = _measure(build)
+            if name == "dict Job":
+                print(f"{n_jobs:>9} {name:>10} {mem:>9.1f} {t_build:>9.3f} {'-':>13} {'-':>11}")
+                continue
+            t_solve, makespan = _solve(jobs)
+            makespans.add(makespan)
+            print(f"{n_jobs:>9} {name:>10} {mem:>9.1f} {t_build:>9.3f} {t_solve:>13.3f} "
+                  f"{n_jobs / t_solve:>11.0f}")
+        assert len(makespans) == 1
+
+
+if __name__ == "__main__":
+    main()
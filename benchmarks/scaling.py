@@ -0,0 +1,191 @@
+# ==========================
+#  BỘ BENCHMARK THEO QUY MÔ (không cần giao diện, thay cho demo_scale_test)
+#  - Chạy GreedyScheduler (SPT/EDD/FCFS) và gwo_schedule trên lưới (n_jobs, n_machines)
+#    với dữ liệu sinh từ seed cố định => mọi lần chạy thấy cùng một bộ dữ liệu
+#  - Ghi: thời gian chạy, job/s, lượt đánh giá/s, bộ nhớ đỉnh, khoảng cách
+#    makespan so với cận dưới max(sum(p)/m, max(p))
+#  - Xuất JSON, so với baseline đã lưu và trả mã lỗi 1 nếu bị chậm đi / kém đi
+#
+#  Chạy:
+#    python -m benchmarks.scaling --grid quick --output results.json
+#    python -m benchmarks.scaling --grid quick --baseline benchmarks/baseline_quick.json
+#    python -m benchmarks.scaling --grid quick --save-baseline benchmarks/baseline_quick.json
+# ==========================
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from Core.job_table import JobTable
+from Core.machine import Machine
+from algorithms.greedy import GreedyScheduler
+from algorithms.gwo import gwo_schedule
+from algorithms.population import makespan_lower_bound
+
+
+GRIDS = {
+    "quick": {"jobs": [10, 100, 1_000, 10_000], "machines": [2, 10, 100]},
+    "full": {"jobs": [10, 100, 1_000, 10_000, 100_000, 1_000_000],
+             "machines": [2, 10, 100, 1_000]},
+}
+STRATEGIES = ["SPT", "EDD", "FCFS"]
+GWO_PARAMS = {"pop_size": 20, "iters": 20}
+GWO_MAX_JOBS = 10_000  # GWO trên 1M job mất hàng giờ => chỉ chạy tới mức này
+SEED = 2024
+
+
+def make_instance(n_jobs, seed=SEED):
+    """Bộ dữ liệu cố định theo (n_jobs, seed)"""
+    rng = np.random.default_rng([seed, n_jobs])
+    durations = rng.integers(1, 101, n_jobs)
+    deadlines = durations + rng.integers(0, 10 * max(1, n_jobs // 10), n_jobs)
+    return JobTable(ids=np.arange(1, n_jobs + 1), durations=durations,
+                    deadlines=deadlines, priorities=rng.integers(1, 6, n_jobs))
+
+
+def lower_bound(table, n_machines):
+    return makespan_lower_bound(table.durations, n_machines)
+
+
+def _solve(algorithm, table, n_machines, seed):
+    """Trả về (makespan, số lượt đánh giá)"""
+    if algorithm == "gwo":
+        _, makespan, info = gwo_schedule(table, n_machines, seed=seed, **GWO_PARAMS)
+        return makespan, info["evaluations"]
+    strategy = algorithm.split("_", 1)[1]
+    machines = [Machine(i) for i in range(n_machines)]
+    schedule = GreedyScheduler(table, machines, strategy=strategy).schedule()
+    return schedule.evaluate()["makespan"], 1
+
+
+def run_case(algorithm, table, n_machines, seed=SEED, measure_memory=True):
+    """Chạy một ô của lưới, đo thời gian (lần chạy riêng) và bộ nhớ đỉnh (lần chạy thứ hai)"""
+    start = time.perf_counter()
+    makespan, evaluations = _solve(algorithm, table, n_machines, seed)
+    wall_time = time.perf_counter() - start
+
+    peak_mem_mb = None
+    if measure_memory:
+        tracemalloc.start()
+        _solve(algorithm, table, n_machines, seed)
+        peak_mem_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+    bound = lower_bound(table, n_machines)
+    return {
+        "algorithm": algorithm,
+        "n_jobs": len(table),
+        "n_machines": n_machines,
+        "wall_time": wall_time,
+        "jobs_per_sec": len(table) / wall_time if wall_time > 0 else None,
+        "evals_per_sec": evaluations / wall_time if wall_time > 0 else None,
+        "peak_mem_mb": peak_mem_mb,
+        "makespan": float(makespan),
+        "lower_bound": float(bound),
+        "gap": float((makespan - bound) / bound),
+    }
+
+
+def run_suite(grid="quick", seed=SEED, measure_memory=True, verbose=True):
+    """Chạy cả lưới, trả về list kết quả (mỗi phần tử là một dict của run_case)"""
+    results = []
+    algorithms = [f"greedy_{s}" for s in STRATEGIES] + ["gwo"]
+    for n_jobs in GRIDS[grid]["jobs"]:
+        table = make_instance(n_jobs, seed)
+        for n_machines in GRIDS[grid]["machines"]:
+            if n_machines > n_jobs:
+                continue
+            for algorithm in algorithms:
+                if algorithm == "gwo" and n_jobs > GWO_MAX_JOBS:
+                    continue
+                record = run_case(algorithm, table, n_machines, seed, measure_memory)
+                results.append(record)
+                if verbose:
+                    print(format_record(record), flush=True)
+    return results
+
+
+def format_record(r):
+    mem = f"{r['peak_mem_mb']:.1f}" if r["peak_mem_mb"] is not None else "-"
+    return (f"{r['algorithm']:>12} {r['n_jobs']:>9} {r['n_machines']:>5} "
+            f"{r['wall_time']:>9.4f}s {r['jobs_per_sec'] or 0:>11.0f} job/s "
+            f"{r['evals_per_sec'] or 0:>9.0f} ev/s {mem:>8} MB  gap={100 * r['gap']:.2f}%")
+
+
+def compare(results, baseline, time_tolerance=1.5, gap_tolerance=0.005, min_time=0.05):
+    """
+    So với baseline (cùng khóa algorithm/n_jobs/n_machines)
+    - Chậm đi: wall_time > baseline * time_tolerance (bỏ qua ô chạy dưới min_time giây)
+    - Kém đi: gap > baseline_gap + gap_tolerance
+    Trả về list thông báo hồi quy (rỗng nếu đạt)
+    """
+    key = lambda r: (r["algorithm"], r["n_jobs"], r["n_machines"])
+    reference = {key(r): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        base = reference.get(key(r))
+        if base is None:
+            continue
+        label = f"{r['algorithm']} n={r['n_jobs']} m={r['n_machines']}"
+        if (max(r["wall_time"], base["wall_time"]) >= min_time
+                and r["wall_time"] > base["wall_time"] * time_tolerance):
+            regressions.append(f"{label}: {r['wall_time']:.4f}s > {base['wall_time']:.4f}s "
+                               f"x {time_tolerance}")
+        if r["gap"] > base["gap"] + gap_tolerance:
+            regressions.append(f"{label}: gap {r['gap']:.4f} > {base['gap']:.4f} "
+                               f"+ {gap_tolerance}")
+    return regressions
+
+
+def _report(grid, seed, results):
+    return {
+        "meta": {"grid": grid, "seed": seed, "gwo_params": GWO_PARAMS,
+                 "python": platform.python_version(), "numpy": np.__version__,
+                 "platform": platform.platform(),
+                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark các thuật toán lập lịch theo quy mô")
+    parser.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", help="ghi kết quả JSON ra file ('-' => stdout)")
+    parser.add_argument("--baseline", help="file JSON baseline để so sánh")
+    parser.add_argument("--save-baseline", help="ghi kết quả hiện tại làm baseline mới")
+    parser.add_argument("--time-tolerance", type=float, default=1.5)
+    parser.add_argument("--gap-tolerance", type=float, default=0.005)
+    parser.add_argument("--no-memory", action="store_true", help="bỏ qua đo bộ nhớ đỉnh")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.grid, args.seed, measure_memory=not args.no_memory,
+                        verbose=args.output != "-")
+    report = _report(args.grid, args.seed, results)
+
+    for path in (args.output, args.save_baseline):
+        if path == "-":
+            json.dump(report, sys.stdout, indent=2)
+        elif path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.time_tolerance, args.gap_tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"OK: không có hồi quy so với {args.baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+GIAO DIỆN DÒNG LỆNH KHÔNG TƯƠNG TÁC (cho script / cron)
+- Đầu vào: file bài toán (.sched / Taillard / P||Cmax) hoặc tham số sinh ngẫu nhiên
+- Đầu ra: JSON / JSON Lines / CSV ra stdout hoặc file
+- Chỉ nạp NumPy và các thuật toán: matplotlib chỉ được import khi có --plot,
+  tkinter không bao giờ được import
+
+Ví dụ:
+    python cli.py --jobs 1000 --machines 8 --seed 1 -a greedy:SPT -a gwo --iters 50
+    python cli.py --instance ta001.txt -a auto --timeout 5 --format csv -o out.csv
+    python cli.py --jobs 200 --machines 4 -a greedy --plot gantt.png
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from algorithms.batch import ALGORITHMS, batch_solve
+from algorithms.greedy import GreedyScheduler
+
+
+# Các trường ghi ra ở chế độ mặc định (CSV luôn chỉ dùng các trường này)
+FIELDS = ("instance", "name", "n_jobs", "n_machines", "config", "algorithm", "status",
+          "makespan", "total_lateness", "runtime", "stop_reason", "error")
+
+
+# ==========================
+# Tham số dòng lệnh
+# ==========================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Xếp lịch công việc không tương tác (kết quả JSON / CSV)")
+    source = parser.add_argument_group("bài toán")
+    source.add_argument("--instance", "-i", action="append", default=[], metavar="FILE",
+                        help="file bài toán .sched / Taillard / P||Cmax (lặp lại được)")
+    source.add_argument("--jobs", "-n", type=int, help="sinh ngẫu nhiên bài toán n job")
+    source.add_argument("--machines", "-m", type=int,
+                        help="số máy cho bài toán sinh ngẫu nhiên")
+    source.add_argument("--count", type=int, default=1,
+                        help="số bài toán sinh ngẫu nhiên (mặc định 1)")
+    source.add_argument("--distribution", default="uniform",
+                        choices=("uniform", "bimodal", "heavy_tailed"))
+    source.add_argument("--deadlines", default="uniform",
+                        choices=("uniform", "correlated", "none"))
+    source.add_argument("--duration-range", type=int, nargs=2, default=(1, 20),
+                        metavar=("LO", "HI"))
+    source.add_argument("--speeds", type=float, nargs="+", metavar="S",
+                        help="tốc độ từng máy (máy uniform: job chạy trong p / s)")
+
+    solver = parser.add_argument_group("thuật toán")
+    solver.add_argument("--algorithm", "-a", action="append", metavar="ALGO",
+                        help="greedy[:SPT|LPT|EDD|FCFS], gwo, pso, woa, "
+                             "gwo_island[:N], pso_island[:N], woa_island[:N], exact, auto "
+                             "(lặp lại được; mặc định greedy)")
+    solver.add_argument("--seed", type=int, help="seed gốc (sinh dữ liệu và thuật toán)")
+    solver.add_argument("--pop-size", type=int, default=30)
+    solver.add_argument("--iters", type=int, default=100)
+    solver.add_argument("--stagnation", type=int, help="GWO dừng sau N vòng không cải thiện")
+    solver.add_argument("--warm-start", action="append", metavar="RULE",
+                        help="GWO: gieo sói từ luật SPT / LPT / EDD / FCFS")
+    solver.add_argument("--time-limit", type=float, help="giới hạn giây của exact (B&B)")
+    solver.add_argument("--node-limit", type=int, help="giới hạn số nút của exact (B&B)")
+    solver.add_argument("--timeout", type=float,
+                        help="ngân sách giây cho mỗi tác vụ (GWO / exact dừng có kiểm soát)")
+    solver.add_argument("--workers", type=int, default=0,
+                        help="số tiến trình (0 = chạy tuần tự, mặc định)")
+    solver.add_argument("--exact-max-jobs", type=int, default=35,
+                        help="auto: số job tối đa để giải chính xác")
+
+    output = parser.add_argument_group("kết quả")
+    output.add_argument("--format", "-f", default="json", choices=("json", "jsonl", "csv"))
+    output.add_argument("--output", "-o", default="-", metavar="FILE",
+                        help="file kết quả (mặc định stdout)")
+    output.add_argument("--details", action="store_true",
+                        help="JSON: kèm assignment và toàn bộ info của thuật toán")
+    output.add_argument("--plot", metavar="FILE.png",
+                        help="vẽ Gantt lời giải tốt nhất của bài toán đầu tiên (nạp matplotlib)")
+    output.add_argument("--profile", metavar="REPORT.json",
+                        help="bật đo đạc hiệu năng, ghi báo cáo JSON khi xong")
+    return parser
+
+
+def build_configs(args):
+    """Chuyển các --algorithm thành list cấu hình của batch_solve"""
+    population = {"pop_size": args.pop_size, "iters": args.iters}
+    if args.stagnation is not None:
+        population["stagnation"] = args.stagnation
+    if args.warm_start:
+        population["warm_start"] = args.warm_start
+    exact = {}
+    if args.time_limit is not None:
+        exact["time_limit"] = args.time_limit
+    if args.node_limit is not None:
+        exact["node_limit"] = args.node_limit
+
+    times = None
+    if args.speeds:
+        from Core.processing_times import ProcessingTimes
+        times = ProcessingTimes(speeds=args.speeds)
+        population["times"] = times
+
+    configs = []
+    for spec in args.algorithm or ["greedy"]:
+        algorithm, _, option = spec.partition(":")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Thuật toán không hợp lệ: {algorithm} (chọn trong {ALGORITHMS})")
+        if times is not None and algorithm == "exact":
+            raise ValueError("exact chỉ hỗ trợ máy giống nhau (bỏ --speeds, hoặc dùng auto)")
+        if algorithm == "greedy":
+            strategy = option.upper() or "SPT"
+            if strategy not in GreedyScheduler.STRATEGIES:
+                raise ValueError(f"Chiến lược greedy không hợp lệ: {option} "
+                                 f"(chọn trong {GreedyScheduler.STRATEGIES})")
+            config = {"strategy": strategy, "times": times}
+        elif algorithm.endswith("_island"):
+            config = dict(population, n_islands=int(option)) if option else dict(population)
+        elif algorithm in ("gwo", "pso", "woa"):
+            config = dict(population)
+        elif algorithm == "exact":
+            config = dict(exact)
+        else:
+            config = {"gwo": dict(population), "exact": dict(exact)}
+        configs.append(dict(config, algorithm=algorithm, name=spec))
+    return configs
+
+
+def load_instances(args):
+    """List (JobTable, n_machines, tên) từ các file và/hoặc tham số sinh ngẫu nhiên"""
+    instances = []
+    if args.instance:
+        from utils.instance_io import read_instances
+        for path in args.instance:
+            instances += read_instances(path)
+    if args.jobs is not None:
+        if args.machines is None:
+            raise ValueError("--jobs cần kèm --machines")
+        import numpy as np
+        from utils.data_generator import DataGenerator
+        seeds = np.random.SeedSequence(args.seed).spawn(args.count)
+        for k, seed in enumerate(seeds):
+            table = DataGenerator.generate_table(
+                args.jobs, duration_range=tuple(args.duration_range), seed=seed,
+                distribution=args.distribution, deadlines=args.deadlines)
+            instances.append((table, args.machines, f"random#{k}"))
+    if not instances:
+        raise ValueError("Cần --instance FILE hoặc --jobs N --machines M")
+    return instances
+
+
+# ==========================
+# Ghi kết quả
+# ==========================
+def _builtin(value):
+    """json.dump không nhận kiểu NumPy => đổi sang kiểu Python"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Không ghi được {type(value).__name__} ra JSON")
+
+
+def to_row(record, instances, details=False):
+    """Bản ghi của batch_solve -> dict phẳng để ghi ra"""
+    table, n_machines, name = instances[record["instance"]]
+    row = {"instance": record["instance"], "name": name, "n_jobs": len(table),
+           "n_machines": n_machines}
+    row.update((key, record[key]) for key in ("config", "algorithm", "status", "makespan",
+                                              "total_lateness", "runtime", "error")
+               if key in record)
+    info = record.get("info") or {}
+    if "stop_reason" in info:
+        row["stop_reason"] = info["stop_reason"]
+    if details:
+        row["assignment"] = record.get("assignment")
+        row["info"] = info
+    return row
+
+
+def write_rows(rows, stream, fmt):
+    """Ghi dần từng dòng (jsonl / csv) hoặc gom lại thành một mảng JSON"""
+    if fmt == "jsonl":
+        for row in rows:
+            stream.write(json.dumps(row, default=_builtin) + "\n")
+            stream.flush()
+    elif fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            stream.flush()
+    else:
+        json.dump(list(rows), stream, indent=2, default=_builtin)
+        stream.write("\n")
+
+
+def plot_gantt(path, schedule, title):
+    """
+    Vẽ Gantt của một ScheduleResult ("schedule" trong kết quả batch_solve)
+    Chỉ ở đây mới nạp matplotlib, với backend Agg (không cần màn hình)
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    from utils.chart import Chart
+
+    fig = Chart.gantt_chart(schedule, title=title)
+    fig.savefig(path, dpi=120, bbox_inches="tight")
+
+
+def run(args):
+    instances = load_instances(args)
+    configs = build_configs(args)
+    records = batch_solve([(table, m) for table, m, _ in instances], configs,
+                          seed=args.seed, max_workers=args.workers, timeout=args.timeout,
+                          exact_max_jobs=args.exact_max_jobs)
+
+    best = None  # lời giải tốt nhất của bài toán đầu tiên (cho --plot)
+
+    def rows():
+        nonlocal best
+        for record in records:
+            if (args.plot and record["instance"] == 0 and record["status"] == "ok"
+                    and (best is None or record["makespan"] < best["makespan"])):
+                best = record
+            yield to_row(record, instances, args.details)
+
+    if args.output == "-":
+        write_rows(rows(), sys.stdout, args.format)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as stream:
+            write_rows(rows(), stream, args.format)
+
+    if args.plot:
+        if best is None:
+            raise RuntimeError("Không có lời giải hợp lệ để vẽ")
+        _, _, name = instances[0]
+        plot_gantt(args.plot, best["schedule"],
+                   f"{name} - {best['config']} (makespan {best['makespan']:.1f})")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        if args.profile:
+            from utils import profiler
+            with profiler.profiling() as prof:
+                run(args)
+            prof.save(args.profile)
+        else:
+            run(args)
+    except (ValueError, RuntimeError, OSError) as exc:
+        print(f"Lỗi: {exc}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
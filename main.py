@@ -10,34 +10,50 @@ import os
 # Thêm thư mục gốc vào Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from Core.job import Job
 from Core.machine import Machine
+from Core.processing_times import resolve_times
 from Core.schedule import Schedule
+from Core.schedule_result import ScheduleResult
 from algorithms.greedy import GreedyScheduler
-from algorithms.gwo import GWOScheduler
+from algorithms.branch_and_bound import BranchAndBoundScheduler
 from utils.data_generator import DataGenerator
-from utils.metrics import Metrics
-import matplotlib.pyplot as plt
 import time
 
 
 class SchedulingSystem:
     """Hệ thống quản lý và thực thi các thuật toán xếp lịch"""
+
+    # Bài toán có số job <= ngưỡng này được giải chính xác (run_auto)
+    EXACT_MAX_JOBS = 35
     
     def __init__(self):
         self.jobs = []
         self.machines = []
         self.results = {}
         
-    def setup(self, n_jobs=10, n_machines=3, duration_range=(1, 20), deadline_range=(5, 50)):
-        """Khởi tạo dữ liệu jobs và machines"""
+    def setup(self, n_jobs=10, n_machines=3, duration_range=(1, 20), deadline_range=(5, 50),
+              seed=None):
+        """Khởi tạo dữ liệu jobs và machines (seed cố định => cùng bộ dữ liệu)"""
         self.jobs = DataGenerator.generate_jobs(
             n_jobs, 
             duration_range=duration_range,
-            deadline_range=deadline_range
+            deadline_range=deadline_range,
+            seed=seed
         )
         self.machines = [Machine(i) for i in range(n_machines)]
         print(f"✅ Đã tạo {n_jobs} jobs và {n_machines} machines")
+
+    def load(self, path):
+        """
+        Nạp bài toán từ file: .sched (nhị phân, memmap), Taillard (.txt có header
+        "number of jobs...", lấy bài toán đầu tiên) hoặc P||Cmax văn bản (n, m, p_j)
+        self.jobs là JobTable (không tạo đối tượng Job)
+        """
+        from utils.instance_io import read_instances
+        table, n_machines, _ = read_instances(path)[0]
+        self.jobs = table
+        self.machines = [Machine(i) for i in range(n_machines)]
+        print(f"✅ Đã nạp {len(table)} jobs và {n_machines} machines từ {path}")
         
     def run_greedy(self, strategy="SPT"):
         """Chạy thuật toán Greedy"""
@@ -60,28 +76,29 @@ class SchedulingSystem:
         print(f"✅ Greedy ({strategy}): Makespan = {metrics['makespan']:.2f}, Runtime = {runtime:.4f}s")
         return schedule
         
-    def run_gwo(self, pop_size=30, iters=100):
-        """Chạy thuật toán Grey Wolf Optimizer"""
+    def run_gwo(self, pop_size=30, iters=100, warm_start=None):
+        """Chạy thuật toán Grey Wolf Optimizer (warm_start: vd ["LPT", "SPT"], xem gwo_schedule)"""
         print(f"\n🔄 Đang chạy GWO (pop={pop_size}, iters={iters})...")
         start_time = time.time()
         
-        # Chuyển jobs thành format cho GWO
-        job_durations = [job.duration for job in self.jobs]
-        
         from algorithms.gwo import gwo_schedule
         schedule_result, makespan, info = gwo_schedule(
-            jobs=job_durations,
+            jobs=self.jobs,
             m=len(self.machines),
             pop_size=pop_size,
             iters=iters,
-            verbose=False
+            verbose=False,
+            warm_start=warm_start,
+            times=resolve_times(None, self.machines)  # máy khác tốc độ => thời gian theo speed
         )
+        schedule_result.machine_ids = [m.machine_id for m in self.machines]
         
         runtime = time.time() - start_time
         
         self.results["GWO"] = {
             "schedule": schedule_result,
             "makespan": makespan,
+            "total_lateness": schedule_result.evaluate()["total_lateness"],
             "runtime": runtime,
             "info": info
         }
@@ -89,6 +106,54 @@ class SchedulingSystem:
         print(f"✅ GWO: Makespan = {makespan:.2f}, Runtime = {runtime:.4f}s")
         return schedule_result
         
+    def run_exact(self, node_limit=1_000_000, time_limit=10.0):
+        """Chạy Branch and Bound chính xác (dành cho bài toán nhỏ)"""
+        print(f"\n🔄 Đang chạy Branch and Bound (tối đa {time_limit}s)...")
+        start_time = time.time()
+
+        scheduler = BranchAndBoundScheduler(self.jobs, self.machines,
+                                            node_limit=node_limit, time_limit=time_limit)
+        schedule = scheduler.schedule()
+
+        runtime = time.time() - start_time
+        metrics = schedule.evaluate()
+        info = scheduler.info
+
+        self.results["Exact"] = {
+            "schedule": schedule,
+            "makespan": metrics["makespan"],
+            "total_lateness": metrics["total_lateness"],
+            "runtime": runtime,
+            "info": info
+        }
+
+        status = "tối ưu" if info["optimal"] else f"gap = {100 * info['gap']:.2f}%"
+        print(f"✅ Exact: Makespan = {metrics['makespan']:.2f} ({status}), Runtime = {runtime:.4f}s")
+        return schedule
+
+    def run_auto(self, **gwo_params):
+        """
+        Tự chọn thuật toán: bài toán nhỏ trên máy giống nhau => giải chính xác,
+        còn lại (kể cả máy khác tốc độ) => GWO
+        """
+        if len(self.jobs) <= self.EXACT_MAX_JOBS and resolve_times(None, self.machines) is None:
+            return self.run_exact()
+        return self.run_gwo(**gwo_params)
+
+    def run_batch(self, instances, configs, seed=None, max_workers=None, max_in_flight=None,
+                  timeout=None, progress=None):
+        """
+        Giải nhiều bài toán độc lập song song (xem algorithms.batch.batch_solve)
+        instances: iterable (jobs, n_machines); configs: list dict {"algorithm": ..., ...}
+        Trả về generator: kết quả của từng (bài toán, cấu hình) ngay khi xong,
+        không ảnh hưởng tới self.jobs / self.results
+        progress: hàm nhận tiến độ các tác vụ GWO (xem callback của gwo_schedule)
+        """
+        from algorithms.batch import batch_solve
+        return batch_solve(instances, configs, seed=seed, max_workers=max_workers,
+                           max_in_flight=max_in_flight, timeout=timeout,
+                           exact_max_jobs=self.EXACT_MAX_JOBS, progress=progress)
+
     def compare_algorithms(self):
         """So sánh kết quả các thuật toán"""
         print("\n" + "="*60)
@@ -108,6 +173,7 @@ class SchedulingSystem:
             print("⚠️ Chưa có kết quả để so sánh!")
             return
             
+        import matplotlib.pyplot as plt  # chỉ nạp khi thực sự vẽ
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
         
         # Biểu đồ Makespan
@@ -141,12 +207,12 @@ class SchedulingSystem:
         
         result = self.results[algo_name]
         
-        if "schedule" in result and isinstance(result["schedule"], Schedule):
-            schedule = result["schedule"]
-            for machine in schedule.machines:
-                print(f"\nMachine {machine.machine_id}:")
-                for job, start, finish in machine.schedule:
-                    print(f"  Job {job.job_id}: [{start:.1f} - {finish:.1f}] (duration: {job.duration})")
+        if "schedule" in result and isinstance(result["schedule"], (ScheduleResult, Schedule)):
+            # Mọi thuật toán (Greedy, GWO, Exact) đều có cùng dạng tóm tắt
+            for machine_id, entries in result["schedule"].get_schedule_summary().items():
+                print(f"\nMachine {machine_id}:")
+                for job_id, start, finish in entries:
+                    print(f"  Job {job_id}: [{start:.1f} - {finish:.1f}] (duration: {finish - start:g})")
 
 
 def demo_basic():
@@ -174,47 +240,18 @@ def demo_basic():
 
 
 def demo_scale_test():
-    """Demo test với quy mô khác nhau"""
+    """Test hiệu năng theo quy mô (bộ benchmark không giao diện, xem benchmarks/scaling.py)"""
     print("="*60)
     print("📈 TEST HIỆU NĂNG VỚI QUY MÔ KHÁC NHAU")
     print("="*60)
-    
-    scales = [(10, 3), (20, 5), (30, 6), (50, 8)]
-    
-    results_spt = []
-    results_gwo = []
-    
-    for n_jobs, n_machines in scales:
-        print(f"\n--- Test với {n_jobs} jobs, {n_machines} machines ---")
-        
-        system = SchedulingSystem()
-        system.setup(n_jobs=n_jobs, n_machines=n_machines)
-        
-        system.run_greedy(strategy="SPT")
-        system.run_gwo(pop_size=20, iters=50)
-        
-        results_spt.append(system.results["Greedy_SPT"]["makespan"])
-        results_gwo.append(system.results["GWO"]["makespan"])
-    
-    # Vẽ biểu đồ so sánh scaling
-    plt.figure(figsize=(10, 6))
-    x_labels = [f"{j}j/{m}m" for j, m in scales]
-    x = range(len(x_labels))
-    
-    plt.plot(x, results_spt, marker='o', label='Greedy SPT', linewidth=2)
-    plt.plot(x, results_gwo, marker='s', label='GWO', linewidth=2)
-    
-    plt.xlabel('Problem Size (jobs/machines)')
-    plt.ylabel('Makespan')
-    plt.title('Hiệu năng thuật toán theo quy mô bài toán')
-    plt.xticks(x, x_labels)
-    plt.legend()
-    plt.grid(alpha=0.3)
-    plt.tight_layout()
-    plt.show()
 
+    from benchmarks.scaling import run_suite
+    run_suite(grid="quick", measure_memory=False)
+    print("\n💡 Lưới đầy đủ + so sánh baseline: python -m benchmarks.scaling --help")
 
-if __name__ == "__main__":
+
+def main_menu():
+    """Menu tương tác"""
     print("\n" + "="*60)
     print("   CHƯƠNG TRÌNH XẾP LỊCH CÔNG VIỆC - ĐỒ ÁN AI")
     print("   Nhóm 8 - Greedy & Grey Wolf Optimizer")
@@ -241,4 +278,26 @@ if __name__ == "__main__":
             print("\n👋 Cảm ơn đã sử dụng chương trình!")
             break
         else:
-            print("⚠️ Lựa chọn không hợp lệ!")
\ No newline at end of file
+            print("⚠️ Lựa chọn không hợp lệ!")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Chương trình xếp lịch công việc")
+    parser.add_argument("--profile", metavar="REPORT.json",
+                        help="bật đo đạc hiệu năng, ghi báo cáo JSON khi thoát")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="đo thêm bộ nhớ đỉnh bằng tracemalloc (chậm hơn)")
+    args = parser.parse_args()
+
+    if args.profile:
+        from utils import profiler
+        prof = profiler.enable(trace_memory=args.profile_memory)
+        try:
+            main_menu()
+        finally:
+            profiler.disable()
+            prof.save(args.profile)
+            print(f"📄 Đã ghi báo cáo hiệu năng: {args.profile}")
+    else:
+        main_menu()
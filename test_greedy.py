@@ -0,0 +1,39 @@
+# Kiểm tra GreedyScheduler (chạy: python -m pytest -q)
+import numpy as np
+
+from Core.machine import Machine
+from Core.processing_times import ProcessingTimes
+from algorithms.greedy import GreedyScheduler
+from utils.data_generator import DataGenerator
+
+
+def _streamed(scheduler, jobs, window):
+    assignments = list(scheduler.dispatch(jobs, window=window))
+    return {job.job_id: (machine_id, start, finish)
+            for job, machine_id, start, finish in assignments}
+
+
+def _batch(schedule):
+    return {job_id: (machine_id, start, finish)
+            for machine_id, entries in schedule.get_schedule_summary().items()
+            for job_id, start, finish in entries}
+
+
+def test_stream_matches_schedule_on_uniform_machines():
+    jobs = DataGenerator.generate_jobs(40, seed=5)
+    machines = [Machine(0, speed=2.0), Machine(1), Machine(2, speed=0.5)]
+    for strategy, window in (("FCFS", 1), ("SPT", len(jobs)), ("LPT", len(jobs))):
+        scheduler = GreedyScheduler(jobs, machines, strategy=strategy)
+        batch = _batch(scheduler.schedule())
+        streamed = _streamed(scheduler, jobs, window)
+        assert streamed == batch
+        assert max(finish for _, _, finish in streamed.values()) == scheduler.schedule().makespan
+
+
+def test_stream_uses_arrival_rows_of_unrelated_matrix():
+    jobs = DataGenerator.generate_jobs(12, seed=2)
+    matrix = np.random.default_rng(0).integers(1, 10, (12, 3)).astype(float)
+    scheduler = GreedyScheduler(jobs, [Machine(i) for i in range(3)], strategy="SPT",
+                                times=ProcessingTimes(matrix=matrix))
+    # SPT theo duration cơ sở; thời gian thực lấy theo hàng của job trong luồng
+    assert _streamed(scheduler, jobs, len(jobs)) == _batch(scheduler.schedule())
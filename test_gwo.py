@@ -0,0 +1,28 @@
+# Kiểm tra GWO / các thuật toán quần thể (chạy: python -m pytest -q)
+from Core.machine import Machine
+from Core.schedule_result import ScheduleResult
+from algorithms.gwo import GWOScheduler, gwo_schedule
+from algorithms.pso import pso_island_schedule
+
+
+def test_gwo_schedule_returns_schedule_result():
+    schedule, makespan, info = gwo_schedule([5, 3, 8, 2, 7, 4], 2, iters=20, seed=1)
+    assert isinstance(schedule, ScheduleResult)
+    assert schedule.makespan == makespan
+    assert schedule.info is info
+    assert sorted(job for jobs in schedule.assignment() for job in jobs) == list(range(6))
+
+
+def test_string_job_ids_are_kept():
+    jobs = [{"id": f"J{i}", "p": p} for i, p in enumerate([5, 3, 8, 2, 7, 4])]
+    result = GWOScheduler(jobs, [Machine("A"), Machine("B")], iters=20, seed=1).schedule()
+    summary = result.get_schedule_summary()
+    assert list(summary) == ["A", "B"]
+    assert sorted(job_id for entries in summary.values() for job_id, _, _ in entries) == \
+        sorted(job["id"] for job in jobs)
+
+    schedule, makespan, _ = pso_island_schedule(jobs, 2, n_islands=2, iters=10, seed=1,
+                                                max_workers=0)
+    assert schedule.makespan == makespan
+    assert {job_id for ids in schedule.assignment() for job_id in ids} == \
+        {job["id"] for job in jobs}
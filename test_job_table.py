@@ -0,0 +1,38 @@
+# Kiểm tra JobTable (chạy: python -m pytest -q)
+import numpy as np
+
+from Core.job import Job
+from Core.job_table import JobTable
+from Core.machine import Machine
+from Core.schedule_result import ScheduleResult
+from utils.data_generator import DataGenerator
+from utils.metrics import Metrics
+
+
+def test_priority_round_trip_keeps_fraction():
+    jobs = [Job(1, 3, deadline=1, priority=1.5), Job(2, 2, deadline=10, priority=2)]
+    table = JobTable.from_jobs(jobs)
+    assert table.priorities.dtype == np.float64
+    assert [job.priority for job in table.to_jobs()] == [1.5, 2]
+
+
+def test_weighted_tardiness_same_for_table_and_job_list():
+    jobs = [Job(1, 3, deadline=1, priority=1.5), Job(2, 2, deadline=4, priority=1)]
+    machine = Machine(0)
+    machine.assign_many(jobs)
+    from_jobs = Metrics.evaluate(jobs, [machine])["weighted_tardiness"]
+
+    table = JobTable.from_jobs(JobTable.from_jobs(jobs).to_jobs())
+    result = ScheduleResult.from_rows(table, [[0, 1]])
+    # Job 1 trễ 2 (trọng số 1.5), job 2 trễ 1 (trọng số 1)
+    assert from_jobs == 4.0
+    assert Metrics.evaluate(result)["weighted_tardiness"] == from_jobs
+
+
+def test_generated_jobs_keep_integer_values():
+    jobs = DataGenerator.generate_jobs(20, seed=3)
+    for job in jobs:
+        assert type(job.duration) is int and type(job.deadline) is int
+        assert type(job.priority) is int
+    assert all(job.deadline is None
+               for job in DataGenerator.generate_jobs(5, seed=3, deadlines="none"))
@@ -1,29 +1,165 @@
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PolyCollection
 
-class Chart:
-    @staticmethod
-    def gantt_chart(machines):
-        """Vẽ biểu đồ Gantt"""
-        fig, ax = plt.subplots(figsize=(10, 5))
+from Core.job_table import JobTable
+from Core.schedule_result import ScheduleResult
+
+
+def gantt_rows(machines, jobs=None):
+    """
+    Gom lịch thành mảng theo từng máy: list (starts, finishes, job_ids), sắp theo starts
+    machines: ScheduleResult (trả về view các cột, không sao chép) hoặc list Machine
+    jobs: JobTable (nếu lịch nằm trong các cột start_times / machines của bảng)
+    """
+    if isinstance(machines, ScheduleResult):
+        return machines.gantt_rows()
+    rows = []
+    for machine in machines:
+        entries = machine.schedule
+        rows.append((np.array([start for _, start, _ in entries], dtype=float),
+                     np.array([finish for _, _, finish in entries], dtype=float),
+                     np.array([job.job_id for job, _, _ in entries], dtype=np.int64)))
+
+    if isinstance(jobs, JobTable) and len(jobs):
+        placed = np.flatnonzero((jobs.machines >= 0) & ~np.isnan(jobs.start_times))
+        order = placed[np.lexsort((jobs.start_times[placed], jobs.machines[placed]))]
+        bounds = np.searchsorted(jobs.machines[order], np.arange(len(machines) + 1))
+        for k in range(len(machines)):
+            idx = order[bounds[k]:bounds[k + 1]]
+            if len(idx):
+                starts, finishes, ids = rows[k]
+                rows[k] = (np.concatenate((starts, jobs.start_times[idx])),
+                           np.concatenate((finishes, jobs.finish_times[idx])),
+                           np.concatenate((ids, jobs.ids[idx])))
+
+    for k, (starts, finishes, ids) in enumerate(rows):
+        if len(starts) > 1 and np.any(np.diff(starts) < 0):
+            order = np.argsort(starts, kind="stable")
+            rows[k] = (starts[order], finishes[order], ids[order])
+    return rows
+
+
+class GanttRenderer:
+    """
+    Vẽ Gantt cho lịch lớn (hàng nghìn - hàng triệu job):
+    - Mỗi máy là MỘT PolyCollection thay vì một barh + một text cho mỗi job
+    - Chỉ vẽ các job nằm trong khoảng thời gian đang hiển thị (tìm bằng searchsorted)
+    - Job hẹp hơn một pixel được gộp theo cột pixel thành một dải liền
+    - Nhãn chỉ vẽ khi ô đủ rộng, tối đa max_labels nhãn
+    Khi người dùng kéo / phóng to (xlim thay đổi) chỉ vẽ lại khung nhìn hiện tại
+    """
+
+    def __init__(self, ax, machines, jobs=None, colors=None, min_label_px=28, max_labels=300,
+                 bar_height=0.8):
+        self.ax = ax
+        self.rows = gantt_rows(machines, jobs)
+        if colors is None:
+            colors = plt.cm.Set3(np.arange(len(self.rows)) % 12)
+        self.colors = colors
+        self.min_label_px = min_label_px
+        self.max_labels = max_labels
+        self.bar_height = bar_height
+        self._artists = []
+        self.stats = {}  # số ô đã vẽ / đã gộp / nhãn ở lần vẽ gần nhất
+
+        makespan = max((row[1].max() for row in self.rows if len(row[1])), default=1.0)
+        ax.set_xlim(0, makespan * 1.02 or 1.0)
+        ax.set_ylim(-0.6, len(self.rows) - 0.4)
+        self.render()
+        # Hàm thường (không phải bound method) => registry giữ tham chiếu mạnh
+        ax.callbacks.connect("xlim_changed", lambda _ax: self.render())
+
+    def _visible(self, starts, finishes, x0, x1, px):
+        """Ô cần vẽ trong [x0, x1]: (lefts, widths, chỉ số job hoặc -1 nếu là dải gộp)"""
+        # finishes tăng theo starts (job trên một máy không chồng nhau)
+        lo = np.searchsorted(finishes, x0, side="right")
+        hi = np.searchsorted(starts, x1, side="left")
+        s, f = starts[lo:hi], finishes[lo:hi]
+        idx = np.arange(lo, hi)
+        small = (f - s) < px
+        if not small.any():
+            return s, f - s, idx
 
-        yticks = []
-        ytick_labels = []
+        # Nhóm mới bắt đầu khi: đổi cột pixel, hoặc job trước / job này đủ rộng
+        bins = np.floor((s - x0) / px)
+        new_group = np.ones(len(s), dtype=bool)
+        new_group[1:] = (bins[1:] != bins[:-1]) | ~small[1:] | ~small[:-1]
+        heads = np.flatnonzero(new_group)
+        lefts = s[heads]
+        rights = np.maximum.reduceat(f, heads)
+        merged = np.add.reduceat(np.ones(len(s), dtype=np.int64), heads) > 1
+        return lefts, rights - lefts, np.where(merged, -1, idx[heads])
 
-        for i, machine in enumerate(machines):
-            yticks.append(i)
-            ytick_labels.append(f"Machine {machine.machine_id}")  # Fix: machine.id -> machine.machine_id
+    def render(self):
+        """Vẽ lại các ô trong khung nhìn hiện tại"""
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
 
-            for job, start, finish in machine.schedule:
-                duration = finish - start
-                ax.barh(i, duration, left=start, alpha=0.8, edgecolor='black')
-                ax.text(start + duration/2, i, f"J{job.job_id}",
-                        ha='center', va='center', fontsize=9, weight='bold')
+        ax = self.ax
+        x0, x1 = ax.get_xlim()
+        width_px = max(1.0, ax.get_window_extent().width)
+        px = (x1 - x0) / width_px  # thời gian ứng với một pixel
+        half = self.bar_height / 2
+        labels = []
+        n_boxes = n_merged = 0
+
+        for k, (starts, finishes, ids) in enumerate(self.rows):
+            if not len(starts):
+                continue
+            lefts, widths, idx = self._visible(starts, finishes, x0, x1, px)
+            if not len(lefts):
+                continue
+            rights = lefts + widths
+            verts = np.empty((len(lefts), 4, 2))
+            verts[:, :, 0] = np.stack((lefts, lefts, rights, rights), axis=1)
+            verts[:, :, 1] = [k - half, k + half, k + half, k - half]
+            merged = idx < 0
+            detailed = np.median(widths) >= 4 * px  # ô đủ rộng => vẽ viền như bản cũ
+            collection = PolyCollection(verts, facecolors=self.colors[k], alpha=0.8,
+                                        edgecolors="black" if detailed else "none",
+                                        linewidths=0.5 if detailed else 0)
+            ax.add_collection(collection, autolim=False)
+            self._artists.append(collection)
+            n_boxes += len(lefts)
+            n_merged += int(merged.sum())
+
+            wide = np.flatnonzero(~merged & (widths / px >= self.min_label_px))
+            labels += [(lefts[i] + widths[i] / 2, k, ids[idx[i]]) for i in wide]
+
+        for x, y, job_id in labels[:self.max_labels]:
+            self._artists.append(ax.text(x, y, f"J{job_id}", ha="center", va="center",
+                                         fontsize=8, weight="bold", clip_on=True))
+        self.stats = {"boxes": n_boxes, "merged": n_merged,
+                      "labels": min(len(labels), self.max_labels)}
+        ax.figure.canvas.draw_idle()
+
+
+class Chart:
+    @staticmethod
+    def gantt_chart(machines, jobs=None, title="Gantt Chart", ax=None):
+        """
+        Vẽ biểu đồ Gantt (dùng GanttRenderer => vẽ nhanh cả với lịch rất lớn)
+        machines: ScheduleResult hoặc list Machine
+        jobs: JobTable nếu lịch nằm trong bảng (GreedyScheduler với JobTable)
+        ax: vẽ lên trục có sẵn (vd: trong GUI), mặc định tạo figure mới
+        """
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(10, 5))
+        else:
+            fig = ax.figure
+
+        renderer = GanttRenderer(ax, machines, jobs)
 
         ax.set_xlabel("Time")
-        ax.set_yticks(yticks)
-        ax.set_yticklabels(ytick_labels)
-        ax.set_title("Gantt Chart")
+        machine_ids = (machines.machine_ids if isinstance(machines, ScheduleResult)
+                       else [machine.machine_id for machine in machines])
+        ax.set_yticks(range(len(machine_ids)))
+        ax.set_yticklabels([f"Machine {machine_id}" for machine_id in machine_ids])
+        ax.set_title(title)
         ax.grid(axis='x', alpha=0.3)
+        fig.gantt_renderer = renderer  # giữ lại để xem stats / vẽ lại
 
         return fig
 
@@ -39,11 +175,11 @@ class Chart:
         ax.set_ylabel("Makespan")
         ax.set_title("So sánh Makespan các thuật toán")
         ax.grid(axis='y', alpha=0.3)
-        
+
         # Add value labels on bars
         for bar in bars:
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{height:.1f}', ha='center', va='bottom')
 
-        return fig
\ No newline at end of file
+        return fig
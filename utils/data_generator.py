@@ -1,19 +1,106 @@
-import random
-from Core.job import Job
+import numpy as np
+from Core.job_table import JobTable
+
 
 class DataGenerator:
+    """
+    Sinh bài toán ngẫu nhiên theo kiểu vector hóa (cả bảng job trong một lần gọi NumPy)
+    - seed cố định => cùng bộ dữ liệu ở mọi lần chạy
+    - Trả về JobTable; chỉ tạo đối tượng Job khi gọi generate_jobs
+    - generate_chunks: sinh từng khối cho bài toán quá lớn để giữ trong bộ nhớ
+    """
+
+    DURATIONS = ("uniform", "bimodal", "heavy_tailed")
+    DEADLINES = ("uniform", "correlated", "none")
+
+    @staticmethod
+    def _durations(rng, n, duration_range, distribution, long_fraction=0.2, alpha=1.5):
+        """
+        Thời gian xử lý nguyên trong duration_range = (lo, hi):
+          uniform: đều trên [lo, hi]
+          bimodal: (1 - long_fraction) job ngắn trong 1/5 dưới, còn lại job dài trong 1/5 trên
+          heavy_tailed: Pareto (alpha) cắt cụt trên [lo, hi] - đa số ngắn, ít job rất dài
+        """
+        lo, hi = duration_range
+        if distribution == "uniform":
+            return rng.integers(lo, hi + 1, n)
+        if distribution == "bimodal":
+            width = max(1, (hi - lo) // 5)
+            short = rng.integers(lo, lo + width + 1, n)
+            long = rng.integers(hi - width, hi + 1, n)
+            return np.where(rng.random(n) < long_fraction, long, short)
+        if distribution == "heavy_tailed":
+            # Nghịch đảo hàm phân phối của Pareto cắt cụt trên [lo, hi]
+            lo_f, hi_f = max(lo, 1), max(hi, 1)
+            u = rng.random(n)
+            x = lo_f / (1 - u * (1 - (lo_f / hi_f) ** alpha)) ** (1 / alpha)
+            return np.clip(np.floor(x), lo, hi).astype(np.int64)
+        raise ValueError(f"Phân phối không hợp lệ: {distribution} "
+                         f"(chọn trong {DataGenerator.DURATIONS})")
+
+    @staticmethod
+    def _deadlines(rng, durations, deadline_range, mode):
+        """
+        uniform: đều trên deadline_range, độc lập với thời gian xử lý
+        correlated: duration + độ trễ cho phép đều trên deadline_range (job dài => deadline muộn)
+        none: không có deadline (NaN)
+        """
+        n = len(durations)
+        if mode == "uniform":
+            return rng.integers(deadline_range[0], deadline_range[1] + 1, n)
+        if mode == "correlated":
+            return durations + rng.integers(deadline_range[0], deadline_range[1] + 1, n)
+        if mode == "none":
+            return np.full(n, np.nan)
+        raise ValueError(f"Kiểu deadline không hợp lệ: {mode} "
+                         f"(chọn trong {DataGenerator.DEADLINES})")
+
+    @staticmethod
+    def _table(rng, n_jobs, start_id, duration_range, deadline_range, distribution,
+               deadlines, priority_range):
+        durations = DataGenerator._durations(rng, n_jobs, duration_range, distribution)
+        return JobTable(
+            ids=np.arange(start_id, start_id + n_jobs),
+            durations=durations,
+            deadlines=DataGenerator._deadlines(rng, durations, deadline_range, deadlines),
+            priorities=rng.integers(priority_range[0], priority_range[1] + 1, n_jobs),
+        )
+
+    @staticmethod
+    def generate_table(n_jobs, duration_range=(1, 20), deadline_range=(5, 50), seed=None,
+                       distribution="uniform", deadlines="uniform", priority_range=(1, 5)):
+        """
+        Sinh n_jobs job dưới dạng JobTable (id từ 1), không tạo đối tượng Job
+        distribution: "uniform" | "bimodal" | "heavy_tailed" (thời gian xử lý)
+        deadlines: "uniform" | "correlated" | "none"
+        seed: số nguyên / SeedSequence => tái lập được; None => ngẫu nhiên
+        """
+        rng = np.random.default_rng(seed)
+        return DataGenerator._table(rng, n_jobs, 1, duration_range, deadline_range,
+                                    distribution, deadlines, priority_range)
+
+    @staticmethod
+    def generate_jobs(n_jobs, duration_range=(1, 20), deadline_range=(5, 50), seed=None,
+                      **options):
+        """
+        Giống generate_table nhưng trả về list Job (tương thích code cũ)
+        duration / deadline / priority là int như trước (JobTable.to_jobs khôi phục kiểu nguyên)
+        """
+        return DataGenerator.generate_table(n_jobs, duration_range, deadline_range, seed,
+                                            **options).to_jobs()
+
     @staticmethod
-    def generate_jobs(n_jobs, duration_range=(1, 20), deadline_range=(5, 50)):
-        jobs = []
-        for i in range(n_jobs):
-            duration = random.randint(*duration_range)
-            deadline = random.randint(*deadline_range)
-            priority = random.randint(1, 5)
-            job = Job(
-                job_id=i + 1,
-                duration=duration,
-                deadline=deadline,
-                priority=priority
-            )
-            jobs.append(job)
-        return jobs
+    def generate_chunks(n_jobs, chunk_size=1_000_000, duration_range=(1, 20),
+                        deadline_range=(5, 50), seed=None, distribution="uniform",
+                        deadlines="uniform", priority_range=(1, 5)):
+        """
+        Sinh bài toán n_jobs job thành từng khối JobTable (tối đa chunk_size dòng,
+        id nối tiếp nhau) => bộ nhớ chỉ cần cho một khối
+        Cùng (seed, chunk_size) => cùng dãy khối
+        Ghi thẳng ra file: utils.instance_io.write_instance_chunks(path, n_jobs, m, chunks)
+        """
+        rng = np.random.default_rng(seed)
+        for start in range(0, n_jobs, chunk_size):
+            size = min(chunk_size, n_jobs - start)
+            yield DataGenerator._table(rng, size, start + 1, duration_range, deadline_range,
+                                       distribution, deadlines, priority_range)
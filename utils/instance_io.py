@@ -0,0 +1,190 @@
+# ==========================
+#  ĐỌC / GHI BÀI TOÁN TỪ FILE
+#  - Định dạng nhị phân dạng cột (.sched): header JSON + các cột thô căn lề 64 byte
+#    => đọc bằng np.memmap, không tạo đối tượng Job, không sao chép dữ liệu
+#  - Nhập từ file văn bản: Taillard (flow shop) và P||Cmax đơn giản (n, m, p_j)
+#
+#  Bố cục file .sched:
+#    MAGIC (8 byte) | độ dài header (uint64, little-endian) | header JSON (utf-8)
+#    | các cột ids, durations, deadlines, priorities (little-endian, căn lề 64 byte)
+# ==========================
+
+import json
+import struct
+
+import numpy as np
+
+from Core.job_table import JobTable
+
+
+MAGIC = b"SCHEDv1\0"
+ALIGNMENT = 64
+COLUMNS = {"ids": "<i8", "durations": "<f8", "deadlines": "<f8", "priorities": "<f8"}
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_instance(path, jobs, n_machines, meta=None):
+    """
+    Ghi bài toán ra file .sched
+    jobs: JobTable hoặc list Job; n_machines: số máy; meta: dict tùy ý (tên, nguồn, ...)
+    """
+    table = jobs if isinstance(jobs, JobTable) else JobTable.from_jobs(jobs)
+    write_instance_chunks(path, len(table), n_machines, [table], meta)
+
+
+def write_instance_chunks(path, n_jobs, n_machines, chunks, meta=None):
+    """
+    Ghi file .sched từ các khối JobTable liên tiếp (tổng cộng n_jobs dòng)
+    Mỗi khối được ghi thẳng vào vị trí của nó trong từng cột rồi bỏ đi
+    => ghi được bài toán lớn hơn bộ nhớ (vd: DataGenerator.generate_chunks)
+    """
+    columns = {}
+    offset = 0  # tính từ đầu vùng dữ liệu, header xác định sau
+    for name, dtype in COLUMNS.items():
+        offset = _aligned(offset)
+        columns[name] = {"dtype": dtype, "offset": offset}
+        offset += n_jobs * np.dtype(dtype).itemsize
+
+    header = {"n_jobs": n_jobs, "n_machines": int(n_machines),
+              "columns": columns, "meta": meta or {}}
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 8 + len(header_bytes))
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        f.truncate(data_start + offset)
+        written = 0
+        for chunk in chunks:
+            if written + len(chunk) > n_jobs:
+                raise ValueError(f"Các khối có nhiều hơn {n_jobs} job")
+            for name, dtype in COLUMNS.items():
+                itemsize = np.dtype(dtype).itemsize
+                f.seek(data_start + columns[name]["offset"] + written * itemsize)
+                f.write(np.ascontiguousarray(getattr(chunk, name), dtype=dtype).tobytes())
+            written += len(chunk)
+    if written != n_jobs:
+        raise ValueError(f"Các khối chỉ có {written} / {n_jobs} job")
+
+
+def read_header(path):
+    """Đọc header của file .sched. Trả về (header dict, vị trí bắt đầu vùng dữ liệu)"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} không phải file bài toán .sched")
+        (length,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(length).decode("utf-8"))
+    return header, _aligned(len(MAGIC) + 8 + length)
+
+
+def load_instance(path, mmap_mode="r"):
+    """
+    Đọc file .sched thành (JobTable, n_machines), dùng được trực tiếp cho
+    GreedyScheduler / gwo_schedule / batch_solve
+    mmap_mode: "r" (chỉ đọc), "c" (ghi vào bản sao riêng, file không đổi) hoặc
+               None (đọc hết vào bộ nhớ)
+    Các cột ids, durations, deadlines, priorities là memmap trỏ thẳng vào file:
+    không sao chép, hệ điều hành chỉ nạp trang khi thực sự truy cập
+    (file cũ lưu priorities dạng <i8 vẫn đọc được, cột đó được chuyển sang float)
+    """
+    header, data_start = read_header(path)
+    n_jobs = header["n_jobs"]
+    arrays = {}
+    for name, spec in header["columns"].items():
+        offset = data_start + spec["offset"]
+        if mmap_mode is None:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                arrays[name] = np.fromfile(f, dtype=spec["dtype"], count=n_jobs)
+        elif n_jobs == 0:
+            arrays[name] = np.empty(0, dtype=spec["dtype"])  # memmap không nhận độ dài 0
+        else:
+            arrays[name] = np.memmap(path, dtype=spec["dtype"], mode=mmap_mode,
+                                     offset=offset, shape=(n_jobs,))
+    return JobTable(**arrays), header["n_machines"]
+
+
+# ==========================
+# Nhập từ file văn bản
+# ==========================
+def _numbers(text):
+    return [float(token) for token in text.split()]
+
+
+def read_pcmax(path):
+    """
+    File P||Cmax dạng văn bản: n, m, rồi n thời gian xử lý (cách nhau bởi khoảng trắng
+    hoặc xuống dòng). Trả về (JobTable, n_machines)
+    """
+    with open(path, encoding="utf-8") as f:
+        values = _numbers(f.read())
+    n_jobs, n_machines = int(values[0]), int(values[1])
+    durations = values[2:2 + n_jobs]
+    if len(durations) != n_jobs:
+        raise ValueError(f"{path}: cần {n_jobs} thời gian xử lý, chỉ có {len(durations)}")
+    return JobTable(ids=np.arange(1, n_jobs + 1), durations=durations), n_machines
+
+
+def read_taillard(path, reduce="sum"):
+    """
+    File Taillard (flow shop), có thể chứa nhiều bài toán liên tiếp:
+        number of jobs, number of machines, initial seed, upper bound and lower bound :
+                  20           5   873654221        1278        1232
+        processing times :
+         54 83 15 ...   (m dòng, mỗi dòng n số: thời gian của từng job trên máy đó)
+    Máy trong bài toán của ta là giống nhau => thời gian mỗi job gộp từ m công đoạn
+    theo reduce ("sum" | "mean" | "max")
+    Trả về list (JobTable, n_machines, meta) với meta gồm seed, upper_bound, lower_bound
+    """
+    reducers = {"sum": np.sum, "mean": np.mean, "max": np.max}
+    if reduce not in reducers:
+        raise ValueError(f"reduce phải là một trong {sorted(reducers)}")
+    with open(path, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    instances = []
+    i = 0
+    while i < len(lines):
+        if not lines[i].lower().startswith("number of jobs"):
+            i += 1
+            continue
+        n_jobs, n_machines, seed, upper, lower = (int(v) for v in _numbers(lines[i + 1])[:5])
+        i += 2
+        if lines[i].lower().startswith("processing times"):
+            i += 1
+        values = []
+        while len(values) < n_jobs * n_machines:
+            values += _numbers(lines[i])
+            i += 1
+        times = np.array(values, dtype=float).reshape(n_machines, n_jobs)
+        table = JobTable(ids=np.arange(1, n_jobs + 1), durations=reducers[reduce](times, axis=0))
+        meta = {"source": "taillard", "seed": seed, "upper_bound": upper,
+                "lower_bound": lower, "reduce": reduce}
+        instances.append((table, n_machines, meta))
+    return instances
+
+
+def read_instances(path):
+    """
+    Đọc mọi bài toán trong file, tự nhận định dạng:
+    .sched (theo MAGIC), Taillard (dòng đầu "number of jobs..."), còn lại là P||Cmax văn bản
+    Trả về list (JobTable, n_machines, tên); file Taillard có thể chứa nhiều bài toán
+    """
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC))
+        if head != MAGIC:
+            # Bỏ qua dòng trống / khoảng trắng đầu file (thường gặp trong bộ Taillard)
+            f.seek(0)
+            head = next((line.lstrip() for line in f if line.strip()), b"")
+    if head == MAGIC:
+        table, n_machines = load_instance(path)
+        return [(table, n_machines, str(path))]
+    if head.lower().startswith(b"number of jobs"):
+        return [(table, n_machines, f"{path}#{k}")
+                for k, (table, n_machines, _) in enumerate(read_taillard(path))]
+    table, n_machines = read_pcmax(path)
+    return [(table, n_machines, str(path))]
@@ -1,40 +1,99 @@
+import numpy as np
+from Core.job_table import JobTable
+from Core.evaluation import evaluate_arrays, evaluate_schedule, schedule_arrays
+from Core.schedule_result import ScheduleResult
+from utils import profiler
+
+
+def _job_columns(jobs):
+    """Cột (finish_times, deadlines, priorities) lấy từ list Job, JobTable hoặc ScheduleResult"""
+    if isinstance(jobs, ScheduleResult):
+        jobs = jobs.table
+    if isinstance(jobs, JobTable):
+        return jobs.finish_times, jobs.deadlines, jobs.priorities
+    finish = np.array([np.nan if job.finish_time is None else job.finish_time for job in jobs],
+                      dtype=float)
+    deadlines = np.array([np.nan if job.deadline is None else job.deadline for job in jobs],
+                         dtype=float)
+    priorities = np.array([job.priority for job in jobs], dtype=float)
+    return finish, deadlines, priorities
+
+
+def _tardiness_columns(jobs, machines=None):
+    """
+    (finish_times, deadlines) để tính độ trễ
+    machines: list Machine => thời điểm kết thúc lấy từ lịch của máy (Machine.assign
+              không ghi job.finish_time), cùng các cột lịch nếu jobs là JobTable
+    Không có thời điểm kết thúc nào => báo lỗi thay vì âm thầm trả về 0
+    """
+    if machines is not None and not isinstance(jobs, ScheduleResult):
+        columns = schedule_arrays(machines, jobs if isinstance(jobs, JobTable) else None)
+        finish, deadlines = columns["finish_times"], columns["deadlines"]
+    else:
+        finish, deadlines, _ = _job_columns(jobs)
+    if len(jobs) and np.isnan(finish).all():
+        raise ValueError("Các job chưa có thời điểm kết thúc: truyền machines "
+                         "(lịch của máy) hoặc một ScheduleResult")
+    return finish, deadlines
+
+
 class Metrics:
+    """Các chỉ số đánh giá lịch, tính bằng nhân chung Core.evaluation"""
+
     @staticmethod
-    def calculate_makespan(machines):
-        """Tính makespan - thời gian hoàn thành tất cả jobs"""
-        max_time = 0
-        for m in machines:
-            if m.schedule:  # Nếu máy có jobs
-                max_time = max(max_time, m.schedule[-1][2])  # finish time của job cuối
-        return max_time
+    def calculate_makespan(machines, jobs=None):
+        """Tính makespan - thời gian hoàn thành tất cả jobs (machines: list Machine hoặc ScheduleResult)"""
+        if isinstance(machines, ScheduleResult):
+            return machines.makespan
+        table = jobs if isinstance(jobs, JobTable) else None
+        return evaluate_schedule(machines, table)["makespan"]
 
     @staticmethod
-    def count_late_jobs(jobs):
-        """Đếm số job trễ deadline"""
-        late = 0
-        for job in jobs:
-            if job.finish_time is not None and job.deadline is not None:
-                if job.finish_time > job.deadline:
-                    late += 1
-        return late
+    def count_late_jobs(jobs, machines=None):
+        """
+        Đếm số job trễ deadline
+        jobs: ScheduleResult, JobTable đã xếp lịch, hoặc list Job kèm machines (list Machine)
+        """
+        finish, deadlines = _tardiness_columns(jobs, machines)
+        return evaluate_arrays(finish, deadlines)["tardy_jobs"]
 
     @staticmethod
-    def average_delay(jobs):
-        """Tính độ trễ trung bình"""
-        total = 0
-        count = 0
-        for job in jobs:
-            if job.finish_time is not None and job.deadline is not None:
-                if job.finish_time > job.deadline:
-                    total += job.finish_time - job.deadline
-                    count += 1
-        return total / count if count > 0 else 0
+    def average_delay(jobs, machines=None):
+        """Tính độ trễ trung bình trên các job trễ (tham số như count_late_jobs)"""
+        finish, deadlines = _tardiness_columns(jobs, machines)
+        return evaluate_arrays(finish, deadlines)["avg_lateness"]
 
     @staticmethod
-    def evaluate(jobs, machines):
-        """Đánh giá tổng thể"""
+    def evaluate(jobs, machines=None):
+        """
+        Đánh giá tổng thể trong một lần duyệt (jobs: list Job, JobTable hoặc ScheduleResult)
+        Thời điểm kết thúc lấy từ lịch của máy, cùng với các cột lịch của JobTable;
+        với ScheduleResult tính thẳng trên các cột của kết quả (machines bỏ qua)
+        """
+        table = jobs if isinstance(jobs, JobTable) else None
+        with profiler.phase("metrics.evaluate"):
+            if isinstance(jobs, ScheduleResult):
+                result = jobs.evaluate()
+            else:
+                result = evaluate_schedule(machines, table)
         return {
-            "makespan": Metrics.calculate_makespan(machines),
-            "late_jobs": Metrics.count_late_jobs(jobs),
-            "avg_delay": Metrics.average_delay(jobs)
-        }
\ No newline at end of file
+            "makespan": result["makespan"],
+            "late_jobs": result["tardy_jobs"],
+            "avg_delay": result["avg_lateness"],
+            "total_lateness": result["total_lateness"],
+            "weighted_tardiness": result["weighted_tardiness"],
+            "utilization": result.get("utilization"),
+        }
+
+    @staticmethod
+    def evaluate_batch(table, finish_times, machines, n_machines):
+        """
+        Đánh giá B lịch ứng viên của cùng một bảng job trong một lần gọi
+        table: JobTable (deadlines, durations, priorities dùng chung)
+        finish_times, machines: mảng (B, n)
+        Trả về dict các mảng (B,) (utilization: (B, n_machines))
+        """
+        profiler.count("metrics.batch_schedules", len(finish_times))
+        with profiler.phase("metrics.evaluate_batch"):
+            return evaluate_arrays(finish_times, table.deadlines, table.durations,
+                                   table.priorities, machines, n_machines)
@@ -0,0 +1,141 @@
+# ==========================
+#  ĐO ĐẠC HIỆU NĂNG (PROFILER) TÙY CHỌN
+#  - Thời gian từng pha (đồng hồ đơn điệu perf_counter): số lần gọi, tổng, lớn nhất
+#  - Bộ đếm: số lượt đánh giá, cache hit/miss, số job đã xếp, ...
+#  - Bộ nhớ: đỉnh tracemalloc (nếu bật trace_memory), số block cấp phát, RSS đỉnh
+#  - Xuất báo cáo JSON
+#  Tắt (mặc định): phase() trả về một context rỗng dùng chung, count() chỉ kiểm tra
+#  một biến toàn cục => gần như không tốn gì. Chỉ đặt ở mức pha / vòng lặp,
+#  không đặt trong vòng lặp từng job.
+#
+#  Dùng:
+#    from utils import profiler
+#    with profiler.profiling() as prof:
+#        gwo_schedule(jobs, m)
+#    prof.save("report.json")
+# ==========================
+
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource  # chỉ có trên Unix
+except ImportError:
+    resource = None
+
+
+_NULL = nullcontext()
+_active = None  # Profiler đang bật (None => tắt)
+
+
+class Profiler:
+    """Gom thời gian các pha và bộ đếm của một lượt chạy"""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.phases = {}  # tên -> [số lần gọi, tổng giây, lâu nhất]
+        self.counters = {}
+        self._started = None
+        self._elapsed = 0.0
+        self._blocks = 0
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._blocks = sys.getallocatedblocks()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        self._elapsed += time.perf_counter() - self._started
+        self._blocks = sys.getallocatedblocks() - self._blocks
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.counters["tracemalloc.peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.phases.get(name)
+            if stats is None:
+                self.phases[name] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        """Báo cáo dạng dict (sẵn sàng cho json.dump)"""
+        phases = {name: {"calls": calls, "total_s": total, "mean_s": total / calls,
+                         "max_s": longest,
+                         "share": total / self._elapsed if self._elapsed > 0 else None}
+                  for name, (calls, total, longest) in sorted(self.phases.items())}
+        memory = {"allocated_blocks_delta": self._blocks}
+        if "tracemalloc.peak_bytes" in self.counters:
+            memory["peak_traced_bytes"] = self.counters["tracemalloc.peak_bytes"]
+        if resource is not None:
+            # ru_maxrss: KB trên Linux, byte trên macOS
+            memory["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        counters = {k: v for k, v in sorted(self.counters.items())
+                    if k != "tracemalloc.peak_bytes"}
+        return {"wall_time_s": self._elapsed, "phases": phases,
+                "counters": counters, "memory": memory}
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def enable(trace_memory=False):
+    """Bật đo đạc toàn cục, trả về Profiler mới"""
+    global _active
+    _active = Profiler(trace_memory)
+    _active.start()
+    return _active
+
+
+def disable():
+    """Tắt đo đạc, trả về Profiler vừa dùng (hoặc None)"""
+    global _active
+    prof, _active = _active, None
+    if prof is not None:
+        prof.stop()
+    return prof
+
+
+def active():
+    return _active
+
+
+@contextmanager
+def profiling(trace_memory=False):
+    """Bật đo đạc trong khối with"""
+    prof = enable(trace_memory)
+    try:
+        yield prof
+    finally:
+        if _active is prof:
+            disable()
+
+
+def phase(name):
+    """Context đo một pha; khi tắt trả về context rỗng dùng chung"""
+    if _active is None:
+        return _NULL
+    return _active.phase(name)
+
+
+def count(name, n=1):
+    """Tăng bộ đếm name thêm n (không làm gì khi tắt)"""
+    if _active is not None:
+        _active.count(name, n)